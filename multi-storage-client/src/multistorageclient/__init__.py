@@ -23,6 +23,7 @@ from .pathlib import MultiStoragePath as Path
 from .shortcuts import (
     commit_metadata,
     delete,
+    delete_many,
     download_file,
     generate_presigned_url,
     get_telemetry_provider,
@@ -69,6 +70,7 @@ __all__ = [
     "SyncResult",
     "commit_metadata",
     "delete",
+    "delete_many",
     "download_file",
     "generate_presigned_url",
     "get_telemetry_provider",
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import errno
+import functools
 import glob
 import logging
 import os
@@ -21,6 +24,8 @@ import tempfile
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from typing import Any
 
@@ -39,9 +44,71 @@ DEFAULT_CACHE_REFRESH_INTERVAL = 300  # 5 minutes
 DEFAULT_LOCK_TIMEOUT = 600  # 10 minutes
 DEFAULT_CACHE_LINE_SIZE = "64M"
 
+# Linux-only open flag for unnamed files that are linked into the cache once fully written
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
+# Errors meaning the filesystem cannot create unnamed files, or the process cannot link them through /proc
+_O_TMPFILE_UNSUPPORTED_ERRNOS = frozenset({errno.EOPNOTSUPP, errno.EISDIR, errno.EINVAL})
+_PROC_LINK_UNSUPPORTED_ERRNOS = frozenset({errno.EXDEV, errno.EPERM})
+
 logger = logging.getLogger(__name__)
 
 
+def _preallocate_chunk_file(fd: int, length: int) -> None:
+    """Reserve space for a chunk file of known length and hint that it is written sequentially.
+
+    Both calls are advisory, so they are skipped where the platform or filesystem does not support them.
+
+    :param fd: File descriptor of the chunk file being written.
+    :param length: Number of bytes that will be written.
+    """
+    if length <= 0:
+        return
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, length)
+        except OSError:
+            pass
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, length, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_chunk_metadata(chunk_path: str, st_ino: int, st_mtime_ns: int, st_ctime_ns: int) -> tuple[str, int]:
+    """Read the etag and cache line size of a chunk file.
+
+    Chunks are never modified in place, so results are memoized per file identity and repeated validations skip the
+    xattr reads. The identity includes the change time because writing an xattr updates ctime but not mtime.
+
+    :param chunk_path: The path to the chunk file
+    :param st_ino: The inode number of the chunk file
+    :param st_mtime_ns: The modification time of the chunk file in nanoseconds
+    :param st_ctime_ns: The change time of the chunk file in nanoseconds
+    :return: The stored etag and cache line size
+    """
+    chunk_etag = xattr.getxattr(chunk_path, "user.etag").decode("utf-8")
+    cache_line_size = int(xattr.getxattr(chunk_path, "user.cache_line_size").decode("utf-8"))
+    return chunk_etag, cache_line_size
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_cached_etag(file_path: str, st_ino: int, st_mtime_ns: int, st_size: int) -> str:
+    """Read the etag of a fully cached file.
+
+    The etag is written before a cached file is published and never rewritten in place, so results are memoized per
+    file identity. The change time is left out of the identity because LRU access time updates change it on every read.
+
+    :param file_path: The path to the cached file
+    :param st_ino: The inode number of the cached file
+    :param st_mtime_ns: The modification time of the cached file in nanoseconds
+    :param st_size: The size of the cached file in bytes
+    :return: The stored etag
+    """
+    return xattr.getxattr(file_path, "user.etag").decode("utf-8")
+
+
 class CacheManager:
     """
     A concrete implementation of the :py:class:`CacheBackend` that stores cache data in the local filesystem.
@@ -66,6 +133,12 @@ class CacheManager:
 
         # Range cache configuration
         self._cache_line_size = cache_config.cache_line_size_bytes()
+        self._coalesce_window = cache_config.coalesce_window_bytes()
+        self._anonymous_chunk_files = bool(_O_TMPFILE)
+        self._download_parallelism = cache_config.download_parallelism
+        self._download_executor: ThreadPoolExecutor | None = None
+        self._download_executor_pid: int | None = None
+        self._download_executor_lock = threading.Lock()
 
         default_location = os.path.join(tempfile.gettempdir(), "msc-cache")
         # Create cache directory if it doesn't exist, this is used to download files
@@ -96,6 +169,18 @@ class CacheManager:
         with tempfile.NamedTemporaryFile(mode="wb", dir=self._cache_temp_dir, prefix=".") as temp_file:
             return temp_file.name
 
+    def _ensure_parent_dir(self, file_path: str) -> None:
+        """Create the parent directory of a cache file unless it already exists.
+
+        An existing directory, the common case, costs a single ``stat`` instead of the
+        ``makedirs`` sequence.
+
+        :param file_path: Path to the cache file.
+        """
+        parent_dir = os.path.dirname(file_path)
+        if not os.path.isdir(parent_dir):
+            safe_makedirs(parent_dir)
+
     def _check_if_eviction_policy_is_valid(self, eviction_policy: str) -> bool:
         """Check if the eviction policy is valid for this backend.
 
@@ -165,26 +250,30 @@ class CacheManager:
         logger.debug("\nStarting evict_files...")
         cache_items: list[CacheItem] = []
 
-        # Traverse the directory and subdirectories
-        for dirpath, _, filenames in os.walk(self._cache_dir):
-            for file_name in filenames:
-                file_path = os.path.join(dirpath, file_name)
-                # Skip lock files, but allow chunk files (hidden files that contain '#chunk')
-                if file_name.endswith(".lock"):
-                    continue
-                if file_name.startswith(".") and "#chunk" not in file_name:
-                    continue
-                try:
-                    if os.path.isfile(file_path):
-                        # Get the relative path from the cache directory
-                        rel_path = os.path.relpath(file_path, self._cache_path)
-                        cache_item = CacheItem.from_path(file_path, rel_path)
-                        if cache_item and cache_item.file_size:
-                            logger.debug(f"Found file: {rel_path}, size: {cache_item.file_size}")
-                            cache_items.append(cache_item)
-                except OSError:
-                    # Ignore if file has already been evicted
-                    pass
+        for entry in self._scan_cache_files():
+            # Skip lock files, but allow chunk files (hidden files that contain '#chunk')
+            if entry.name.endswith(".lock"):
+                continue
+            if entry.name.startswith(".") and "#chunk" not in entry.name:
+                continue
+            try:
+                stat_result = entry.stat()
+            except OSError:
+                # Ignore if file has already been evicted
+                continue
+            if stat_result.st_size:
+                # Get the relative path from the cache directory
+                rel_path = os.path.relpath(entry.path, self._cache_path)
+                logger.debug(f"Found file: {rel_path}, size: {stat_result.st_size}")
+                cache_items.append(
+                    CacheItem(
+                        file_path=entry.path,
+                        file_size=stat_result.st_size,
+                        atime=stat_result.st_atime,
+                        mtime=stat_result.st_mtime,
+                        hashed_key=rel_path,
+                    )
+                )
 
         logger.debug(f"\nFound {len(cache_items)} files before sorting")
 
@@ -326,27 +415,28 @@ class CacheManager:
         """Store a file in the cache."""
         file_path = self._get_cache_file_path(key)
         # Ensure the directory exists
-        safe_makedirs(os.path.dirname(file_path))
+        self._ensure_parent_dir(file_path)
 
         if isinstance(source, str):
-            # Move the file to the cache directory
-            os.rename(src=source, dst=file_path)
+            temp_file_path = source
         else:
-            # Create a temporary file and move the file to the cache directory
+            # Create a temporary file to move to the cache directory
             with tempfile.NamedTemporaryFile(
                 mode="wb", delete=False, dir=os.path.dirname(file_path), prefix="."
             ) as temp_file:
                 temp_file_path = temp_file.name
                 temp_file.write(source)
-            os.rename(src=temp_file_path, dst=file_path)
 
-        # Set extended attribute (e.g., ETag)
+        # Set extended attribute (e.g., ETag) before publishing, so the cached file never appears without it
         if source_version:
             try:
-                xattr.setxattr(file_path, "user.etag", source_version.encode("utf-8"))
+                xattr.setxattr(temp_file_path, "user.etag", source_version.encode("utf-8"))
             except OSError as e:
                 logger.warning(f"Failed to set xattr on {file_path}: {e}")
 
+        # Move the file to the cache directory
+        os.rename(src=temp_file_path, dst=file_path)
+
         # Make the file read-only for all users
         self._make_readonly(file_path)
 
@@ -367,7 +457,9 @@ class CacheManager:
             file_path = self._get_cache_file_path(key)
 
             # If file doesn't exist, return False
-            if not os.path.exists(file_path):
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 return False
 
             # If etag checking is disabled, return True if file exists
@@ -379,9 +471,10 @@ class CacheManager:
 
             # Verify etag matches if checking is enabled
             try:
-                xattr_value = xattr.getxattr(file_path, "user.etag")
-                stored_version = xattr_value.decode("utf-8")
-                return stored_version is not None and stored_version == source_version
+                stored_version = _read_cached_etag(
+                    file_path, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
+                )
+                return stored_version == source_version
             except OSError:
                 # If xattr fails, assume version doesn't match
                 return False
@@ -398,17 +491,37 @@ class CacheManager:
         """Return the current size of the cache in bytes."""
         file_size = 0
 
-        # Traverse the directory and subdirectories
-        for dirpath, _, filenames in os.walk(self._cache_dir):
-            for file_name in filenames:
-                file_path = os.path.join(dirpath, file_name)
-                if os.path.isfile(file_path) and not file_name.endswith(".lock"):
-                    size = self.get_file_size(file_path)
-                    if size:
-                        file_size += size
+        for entry in self._scan_cache_files():
+            if not entry.name.endswith(".lock"):
+                try:
+                    file_size += entry.stat().st_size
+                except OSError:
+                    pass
 
         return file_size
 
+    def _scan_cache_files(self) -> Iterator[os.DirEntry]:
+        """Yield a directory entry for every regular file under the cache directory.
+
+        Uses :py:func:`os.scandir` so file types come from the directory listing and each file needs at most
+        one ``stat`` call, which callers make through :py:meth:`os.DirEntry.stat`. Directories removed while
+        scanning are skipped.
+        """
+        pending_dirs = [self._cache_dir]
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif entry.is_file():
+                                yield entry
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+
     def refresh_cache(self) -> bool:
         """Scan the cache directory and evict cache entries."""
         try:
@@ -538,18 +651,73 @@ class CacheManager:
             cache_path, start_chunk, end_chunk, configured_cache_line_size, source_version
         )
 
-        # Download missing chunks with minimal locking
-        for chunk_idx in chunks_to_download:
+        # Download missing chunks with minimal locking, one request per run of consecutive chunks
+        chunk_runs = self._coalesce_missing_chunks(chunks_to_download, configured_cache_line_size)
+        download_args = (original_key, configured_cache_line_size, storage_provider, source_version, source_size)
+        if len(chunk_runs) <= 1 or self._download_parallelism <= 1:
+            for chunk_run in chunk_runs:
+                self._download_missing_chunk_run(cache_path, chunk_run, *download_args)
+            return
+
+        # Runs cover disjoint chunks, so they can be fetched concurrently without contending for chunk locks
+        executor = self._get_download_executor()
+        futures = [
+            executor.submit(self._download_missing_chunk_run, cache_path, chunk_run, *download_args)
+            for chunk_run in chunk_runs
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+    def _download_missing_chunk_run(
+        self,
+        cache_path: str,
+        chunk_run: list[int],
+        original_key: str,
+        cache_line_size: int,
+        storage_provider,
+        source_version: str | None,
+        source_size: int | None,
+    ) -> None:
+        """Download a run of consecutive missing chunks, using a plain chunk download for single-chunk runs."""
+        if len(chunk_run) == 1:
             self._download_single_chunk(
-                cache_path,
-                original_key,
-                chunk_idx,
-                configured_cache_line_size,
-                storage_provider,
-                source_version,
-                source_size,
+                cache_path, original_key, chunk_run[0], cache_line_size, storage_provider, source_version, source_size
+            )
+        else:
+            self._download_chunk_run(
+                cache_path, original_key, chunk_run, cache_line_size, storage_provider, source_version, source_size
             )
 
+    def _get_download_executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool used for concurrent chunk downloads, creating it on first use in this process."""
+        with self._download_executor_lock:
+            if self._download_executor is None or self._download_executor_pid != os.getpid():
+                # Worker threads do not survive fork, so child processes need their own pool
+                self._download_executor = ThreadPoolExecutor(
+                    max_workers=self._download_parallelism, thread_name_prefix="msc-cache-download"
+                )
+                self._download_executor_pid = os.getpid()
+            return self._download_executor
+
+    def _coalesce_missing_chunks(self, chunk_indices: list[int], cache_line_size: int) -> list[list[int]]:
+        """Group sorted chunk indices into runs of consecutive chunks spanning at most the coalesce window.
+
+        Chunks separated by an already cached chunk are never merged, so no valid data is fetched twice.
+
+        :param chunk_indices: Sorted indices of the chunks to download
+        :param cache_line_size: The size of each chunk in bytes
+        :return: Runs of consecutive chunk indices
+        """
+        max_run_length = max(1, self._coalesce_window // cache_line_size)
+        chunk_runs: list[list[int]] = []
+        for chunk_idx in chunk_indices:
+            if chunk_runs and chunk_idx == chunk_runs[-1][-1] + 1 and len(chunk_runs[-1]) < max_run_length:
+                chunk_runs[-1].append(chunk_idx)
+            else:
+                chunk_runs.append([chunk_idx])
+        return chunk_runs
+
     def _identify_missing_chunks(
         self,
         cache_path: str,
@@ -571,7 +739,9 @@ class CacheManager:
 
     def _is_chunk_valid(self, chunk_path: str, source_version: str | None, cache_line_size: int) -> bool:
         """Check if a chunk exists and has valid metadata."""
-        if not os.path.exists(chunk_path):
+        try:
+            chunk_stat = os.stat(chunk_path)
+        except OSError:
             return False
 
         # If no metadata to validate, chunk is valid if it exists
@@ -580,8 +750,9 @@ class CacheManager:
 
         try:
             # Validate chunk metadata
-            chunk_etag = xattr.getxattr(chunk_path, "user.etag").decode("utf-8")
-            stored_cache_line_size = int(xattr.getxattr(chunk_path, "user.cache_line_size").decode("utf-8"))
+            chunk_etag, stored_cache_line_size = _read_chunk_metadata(
+                chunk_path, chunk_stat.st_ino, chunk_stat.st_mtime_ns, chunk_stat.st_ctime_ns
+            )
 
             # Check if chunk is invalid
             if (source_version and chunk_etag != source_version) or stored_cache_line_size != cache_line_size:
@@ -643,6 +814,66 @@ class CacheManager:
             # Clean up lock file
             self._cleanup_lock_file(chunk_lock_key)
 
+    def _download_chunk_run(
+        self,
+        cache_path: str,
+        original_key: str,
+        chunk_run: list[int],
+        cache_line_size: int,
+        storage_provider,
+        source_version: str | None,
+        source_size: int | None,
+    ) -> None:
+        """Download a run of consecutive chunks with a single range request.
+
+        Chunk locks are acquired in ascending index order so concurrent runs cannot deadlock. Chunks created by
+        another thread while waiting for the locks are left untouched; the rest are cut from the response.
+
+        :param cache_path: The base cache path for the original file
+        :param original_key: The original key for the object
+        :param chunk_run: Consecutive chunk indices (0-based) in ascending order
+        :param cache_line_size: The size of each chunk in bytes
+        :param storage_provider: The storage provider to fetch the chunks from
+        :param source_version: The source version of the object
+        :param source_size: Optional size of the source object in bytes
+        """
+        chunk_lock_keys = [f"{cache_path}#chunk{chunk_idx}" for chunk_idx in chunk_run]
+
+        with contextlib.ExitStack() as stack:
+            for chunk_lock_key in chunk_lock_keys:
+                stack.enter_context(self.acquire_lock(chunk_lock_key))
+
+            # Double-check which chunks were created by another thread
+            pending_chunks = [
+                chunk_idx for chunk_idx in chunk_run if not os.path.exists(self._get_chunk_path(cache_path, chunk_idx))
+            ]
+            if pending_chunks:
+                run_start = pending_chunks[0] * cache_line_size
+                run_size = (pending_chunks[-1] - pending_chunks[0] + 1) * cache_line_size
+                if source_size is not None and run_start < source_size:
+                    # Stop the request at the last byte of the object
+                    run_size = min(run_size, source_size - run_start)
+                run_data = memoryview(storage_provider.get_object(original_key, Range(offset=run_start, size=run_size)))
+
+                for chunk_idx in pending_chunks:
+                    data_offset = chunk_idx * cache_line_size - run_start
+                    chunk_data = run_data[data_offset : data_offset + cache_line_size]
+                    if not chunk_data:
+                        # The response ended before this chunk, so it lies past the end of the object
+                        break
+
+                    chunk_path = self._get_chunk_path(cache_path, chunk_idx)
+                    self._write_chunk_to_cache(
+                        chunk_path, chunk_data, source_version, chunk_idx, cache_line_size, source_size
+                    )
+                    self._handle_chunk0_renaming(cache_path, chunk_path, chunk_idx, cache_line_size)
+                    self._update_chunk_access_time(cache_path, chunk_path, chunk_idx)
+                self._schedule_refresh_if_needed()
+
+            # Clean up lock files
+            for chunk_lock_key in chunk_lock_keys:
+                self._cleanup_lock_file(chunk_lock_key)
+
     def _fetch_and_cache_chunk(
         self,
         cache_path: str,
@@ -661,12 +892,16 @@ class CacheManager:
         :param cache_line_size: The size of each chunk in bytes
         :param storage_provider: The storage provider to fetch the chunk from
         :param source_version: The source version of the object
+        :param source_size: Optional size of the source object in bytes, used to end the range at the object's last byte
         """
         chunk_path = self._get_chunk_path(cache_path, chunk_idx)
 
         # Calculate chunk range
         chunk_start = chunk_idx * cache_line_size
         chunk_end = chunk_start + cache_line_size - 1
+        if source_size is not None and chunk_start < source_size:
+            # Stop the request at the last byte of the object
+            chunk_end = min(chunk_end, source_size - 1)
 
         # Fetch chunk data
         chunk_data = storage_provider.get_object(
@@ -686,7 +921,7 @@ class CacheManager:
     def _write_chunk_to_cache(
         self,
         chunk_path: str,
-        chunk_data: bytes,
+        chunk_data: bytes | memoryview,
         source_version: str | None,
         chunk_idx: int,
         cache_line_size: int,
@@ -694,9 +929,10 @@ class CacheManager:
     ) -> None:
         """Atomically write chunk data to cache with metadata.
 
-        Writes to a temporary file, sets xattr metadata on it, then
-        atomically replaces the target path. This ensures concurrent readers
-        never see a partially written chunk. Metadata is best-effort: on
+        Writes to a temporary file (an unnamed ``O_TMPFILE`` file where
+        supported), sets xattr metadata on it, then atomically publishes it at
+        the target path. This ensures concurrent readers never see a
+        partially written chunk. Metadata is best-effort: on
         filesystems without xattr support the write still succeeds, but later
         validation may invalidate short final chunks and fall back to a
         remote read.
@@ -708,7 +944,7 @@ class CacheManager:
         :param cache_line_size: The size of each chunk in bytes
         :param source_size: Optional size of the source object in bytes
         """
-        safe_makedirs(os.path.dirname(chunk_path))
+        self._ensure_parent_dir(chunk_path)
 
         object_size = source_size
         # If metadata was not fetched, a short chunk implies we reached the final chunk.
@@ -716,12 +952,18 @@ class CacheManager:
         if object_size is None and len(chunk_data) < cache_line_size:
             object_size = chunk_idx * cache_line_size + len(chunk_data)
 
+        if self._anonymous_chunk_files and self._write_anonymous_chunk(
+            chunk_path, chunk_data, source_version, cache_line_size, object_size
+        ):
+            return
+
         temp_path = None
         try:
             with tempfile.NamedTemporaryFile(
                 mode="wb", delete=False, dir=os.path.dirname(chunk_path), prefix=".chunk_tmp_"
             ) as temp_file:
                 temp_path = temp_file.name
+                _preallocate_chunk_file(temp_file.fileno(), len(chunk_data))
                 temp_file.write(chunk_data)
             self._set_chunk_metadata(temp_path, source_version, cache_line_size, object_size)
             os.replace(temp_path, chunk_path)
@@ -732,11 +974,61 @@ class CacheManager:
                 except OSError:
                     pass
 
+    def _write_anonymous_chunk(
+        self,
+        chunk_path: str,
+        chunk_data: bytes | memoryview,
+        source_version: str | None,
+        cache_line_size: int,
+        object_size: int | None,
+    ) -> bool:
+        """Write chunk data and metadata to an unnamed ``O_TMPFILE`` file, then link it into place.
+
+        The chunk only gets a name once it is complete, so no temporary file is left behind if the
+        process dies mid-write. If another writer already published the chunk, this copy is discarded.
+        When the platform or filesystem cannot create or link unnamed files, the approach is disabled
+        for this manager. Other errors, such as running out of space or file descriptors, only affect
+        this chunk. Either way False is returned so the caller falls back to a named temporary file.
+
+        :param chunk_path: The path to the chunk file
+        :param chunk_data: The data to write to the chunk file
+        :param source_version: The source version of the object
+        :param cache_line_size: The size of each chunk in bytes
+        :param object_size: Optional total size of the source object in bytes
+        :return: True if the chunk was published, False if the caller should fall back
+        """
+        try:
+            fd = os.open(os.path.dirname(chunk_path), _O_TMPFILE | os.O_WRONLY, 0o600)
+        except OSError as e:
+            if e.errno in _O_TMPFILE_UNSUPPORTED_ERRNOS:
+                self._anonymous_chunk_files = False
+            return False
+
+        try:
+            _preallocate_chunk_file(fd, len(chunk_data))
+            with open(fd, "wb", closefd=False) as chunk_file:
+                chunk_file.write(chunk_data)
+            self._set_chunk_metadata(fd, source_version, cache_line_size, object_size)
+            try:
+                os.link(f"/proc/self/fd/{fd}", chunk_path)
+            except FileExistsError:
+                pass
+            except OSError as e:
+                if e.errno in _PROC_LINK_UNSUPPORTED_ERRNOS or (
+                    e.errno == errno.ENOENT and not os.path.isdir("/proc/self/fd")
+                ):
+                    self._anonymous_chunk_files = False
+                return False
+        finally:
+            os.close(fd)
+
+        return True
+
     def _set_chunk_metadata(
-        self, chunk_path: str, source_version: str | None, cache_line_size: int, object_size: int | None
+        self, chunk_path: str | int, source_version: str | None, cache_line_size: int, object_size: int | None
     ) -> None:
         """Set xattr metadata for a chunk file.
-        :param chunk_path: The path to the chunk file
+        :param chunk_path: The path to the chunk file, or an open descriptor for it
         :param source_version: The source version of the object
         :param cache_line_size: The size of each chunk in bytes
         :param object_size: Optional total size of the source object in bytes
@@ -806,7 +1098,7 @@ class CacheManager:
     ) -> bytes:
         """Assemble the requested byte range from locally cached chunks.
 
-        Reads only the overlapping portion of each chunk and copies it into a
+        Reads only the overlapping portion of each chunk directly into a
         pre-allocated result buffer. When a chunk on disk is shorter than the
         slice needed from it, the stored ``user.size`` xattr is consulted to
         determine whether the chunk is a valid short final chunk or corrupt.
@@ -827,6 +1119,7 @@ class CacheManager:
         """
         # Pre-allocate the largest possible buffer and trim to actual bytes read.
         result = bytearray(byte_range.size)
+        result_view = memoryview(result)
         result_offset = 0
 
         for chunk_idx in range(start_chunk, end_chunk + 1):
@@ -878,21 +1171,20 @@ class CacheManager:
                     if expected_length == 0:
                         # Requested range is entirely past the object's EOF.
                         continue
+                # Read straight into the result buffer, without an intermediate bytes object
                 with open(actual_path, "rb") as f:
                     f.seek(chunk_offset)
-                    chunk_data = f.read(expected_length)
-                if len(chunk_data) != expected_length:
+                    bytes_read = f.readinto(result_view[result_offset : result_offset + expected_length])
+                if bytes_read != expected_length:
                     self._remove_invalid_chunk(actual_path)
                     raise OSError(
                         f"Chunk file {actual_path} returned a short read: "
-                        f"expected={expected_length}, actual={len(chunk_data)}"
+                        f"expected={expected_length}, actual={bytes_read}"
                     )
 
-                # Copy directly to result buffer
-                result[result_offset : result_offset + expected_length] = chunk_data
                 result_offset += expected_length
 
-        return bytes(result[:result_offset])
+        return bytes(result_view[:result_offset])
 
     def _invalidate_chunks(self, cache_path: str):
         """Delete all chunks and metadata for a path.
@@ -927,21 +1219,21 @@ class CacheManager:
         :return: The requested byte range data if successful, None otherwise
         """
         # Check if we have a full cached file that's valid
-        if os.path.exists(cache_path):
-            try:
-                # Validate the full cached file's etag
-                cached_etag = xattr.getxattr(cache_path, "user.etag").decode("utf-8")
-                if cached_etag == source_version or source_version is None:
-                    # Full file is cached and valid, read range directly from it
-                    with open(cache_path, "rb") as f:
-                        f.seek(byte_range.offset)
-                        data = f.read(byte_range.size)
-                    # Update access time for LRU
-                    self._update_access_time(cache_path)
-                    return data
-            except (OSError, AttributeError):
-                # xattrs not supported or file corrupted, fall through to chunking
-                pass
+        try:
+            cache_stat = os.stat(cache_path)
+            # Validate the full cached file's etag
+            cached_etag = _read_cached_etag(cache_path, cache_stat.st_ino, cache_stat.st_mtime_ns, cache_stat.st_size)
+            if cached_etag == source_version or source_version is None:
+                # Full file is cached and valid, read range directly from it
+                with open(cache_path, "rb") as f:
+                    f.seek(byte_range.offset)
+                    data = f.read(byte_range.size)
+                # Update access time for LRU
+                self._update_access_time(cache_path)
+                return data
+        except (OSError, AttributeError):
+            # No full cached file, xattrs not supported or file corrupted, fall through to chunking
+            pass
 
         # No valid full cached file available
         return None
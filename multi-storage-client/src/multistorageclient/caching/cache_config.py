@@ -15,6 +15,11 @@
 
 from dataclasses import dataclass, field
 
+#: Number of cache lines a single coalesced range request spans when ``coalesce_window`` is not set.
+DEFAULT_COALESCE_CACHE_LINES = 4
+#: Maximum number of chunk range requests issued concurrently for a single read when not configured.
+DEFAULT_DOWNLOAD_PARALLELISM = 8
+
 
 @dataclass
 class EvictionPolicyConfig:
@@ -64,6 +69,10 @@ class CacheConfig:
     location: str | None = None
     #: Cache eviction policy configuration. Default is LRU with 300s refresh.
     eviction_policy: EvictionPolicyConfig = field(default_factory=default_eviction_policy)
+    #: Maximum span of consecutive missing chunks fetched with a single range request. Defaults to 4 cache lines.
+    coalesce_window: str | None = None
+    #: Maximum number of chunk range requests issued concurrently for a single read. Defaults to 8.
+    download_parallelism: int = DEFAULT_DOWNLOAD_PARALLELISM
 
     def size_bytes(self) -> int:
         """
@@ -81,6 +90,16 @@ class CacheConfig:
         """
         return self._convert_to_bytes(self.cache_line_size)
 
+    def coalesce_window_bytes(self) -> int:
+        """
+        Convert coalesce window to bytes.
+
+        :return: The coalesce window in bytes, or ``DEFAULT_COALESCE_CACHE_LINES`` cache lines if it is not set.
+        """
+        if self.coalesce_window is None:
+            return DEFAULT_COALESCE_CACHE_LINES * self.cache_line_size_bytes()
+        return self._convert_to_bytes(self.coalesce_window)
+
     def get_eviction_policy(self) -> str:
         """
         Get the eviction policy.
@@ -199,6 +199,7 @@ class StorageClient(AbstractStorageClient):
         path: str,
         byte_range: Range | None = None,
         check_source_version: SourceVersionCheckMode = SourceVersionCheckMode.INHERIT,
+        source_size: int | None = None,
     ) -> bytes:
         """
         Read bytes from a file at the specified logical path.
@@ -206,10 +207,11 @@ class StorageClient(AbstractStorageClient):
         :param path: The logical path of the object to read.
         :param byte_range: Optional byte range to read (offset and length).
         :param check_source_version: Whether to check the source version of cached objects.
+        :param source_size: Optional size of the object in bytes, if already known by the caller.
         :return: The content of the object as bytes.
         :raises FileNotFoundError: If the file at the specified path does not exist.
         """
-        return self._delegate.read(path, byte_range, check_source_version)
+        return self._delegate.read(path, byte_range, check_source_version, source_size)
 
     def open(
         self,
@@ -496,6 +498,7 @@ class StorageClient(AbstractStorageClient):
         dryrun: bool = False,
         dryrun_output_path: str | None = None,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> SyncResult:
         """
         Syncs files from the source storage client to "path/".
@@ -531,6 +534,8 @@ class StorageClient(AbstractStorageClient):
             :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
             :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on the target via :py:meth:`make_symlink`
             instead of copying bytes (required for round-trip preservation of symlinks).
+        :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+            the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
         :raises ValueError: If both source_files and patterns are provided.
         :raises NotImplementedError: If sync operations are not supported (e.g., CompositeStorageClient as target).
         """
@@ -550,6 +555,7 @@ class StorageClient(AbstractStorageClient):
             dryrun,
             dryrun_output_path,
             symlink_handling,
+            batch_size,
         )
 
     def sync_replicas(
@@ -563,6 +569,7 @@ class StorageClient(AbstractStorageClient):
         patterns: PatternList | None = None,
         ignore_hidden: bool = True,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> None:
         """
         Sync files from this client to its replica storage clients.
@@ -580,6 +587,8 @@ class StorageClient(AbstractStorageClient):
             :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
             :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on each replica via
             :py:meth:`make_symlink` instead of copying bytes.
+        :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+            the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
         """
         return self._delegate.sync_replicas(
             source_path,
@@ -591,6 +600,7 @@ class StorageClient(AbstractStorageClient):
             patterns,
             ignore_hidden,
             symlink_handling,
+            batch_size,
         )
 
     def list(
@@ -169,13 +169,14 @@ class CompositeStorageClient(AbstractStorageClient):
         path: str,
         byte_range: Range | None = None,
         check_source_version: SourceVersionCheckMode = SourceVersionCheckMode.INHERIT,
+        source_size: int | None = None,
     ) -> bytes:
         resolved = self._metadata_provider.realpath(path)
         if not resolved.exists:
             raise FileNotFoundError(f"Path '{path}' not found")
 
         child = self._get_child_client(resolved.profile)
-        return child.read(resolved.physical_path, byte_range, check_source_version)
+        return child.read(resolved.physical_path, byte_range, check_source_version, source_size)
 
     def open(
         self,
@@ -414,6 +415,7 @@ class CompositeStorageClient(AbstractStorageClient):
         dryrun: bool = False,
         dryrun_output_path: str | None = None,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> SyncResult:
         raise NotImplementedError(
             "CompositeStorageClient cannot be used as sync target (write operation). "
@@ -431,6 +433,7 @@ class CompositeStorageClient(AbstractStorageClient):
         patterns: PatternList | None = None,
         ignore_hidden: bool = True,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> None:
         """No-op for read-only client."""
 
@@ -401,6 +401,7 @@ class SingleStorageClient(AbstractStorageClient):
         path: str,
         byte_range: Range | None = None,
         check_source_version: SourceVersionCheckMode = SourceVersionCheckMode.INHERIT,
+        source_size: int | None = None,
     ) -> bytes:
         """
         Read bytes from a file at the specified logical path.
@@ -408,6 +409,7 @@ class SingleStorageClient(AbstractStorageClient):
         :param path: The logical path of the object to read.
         :param byte_range: Optional byte range to read (offset and length).
         :param check_source_version: Whether to check the source version of cached objects.
+        :param source_size: Optional size of the object in bytes, if already known by the caller.
         :return: The content of the object as bytes.
         :raises FileNotFoundError: If the file at the specified path does not exist.
         """
@@ -430,14 +432,17 @@ class SingleStorageClient(AbstractStorageClient):
                             metadata = self._storage_provider.get_object_metadata(path)
                             source_version = metadata.etag
 
+                    if metadata:
+                        source_size = metadata.content_length
+
                     # Optimization: For full-file reads (offset=0, size >= file_size), cache whole file instead of chunking
                     # This avoids creating many small chunks when the user requests the entire file.
-                    # Only apply this optimization when metadata is already available (i.e., when version checking is enabled),
-                    # to respect the user's choice to disable version checking and avoid extra HEAD requests.
-                    if byte_range.offset == 0 and metadata and byte_range.size >= metadata.content_length:
+                    # Only apply this optimization when the file size is already known (from version checking metadata or
+                    # the caller), to respect the user's choice to disable version checking and avoid extra HEAD requests.
+                    if byte_range.offset == 0 and source_size is not None and byte_range.size >= source_size:
                         full_file_data = self._storage_provider.get_object(path)
                         self._cache_manager.set(path, full_file_data, source_version)
-                        return full_file_data[: metadata.content_length]
+                        return full_file_data[:source_size]
 
                     # Use chunk-based caching for partial reads or when optimization doesn't apply
                     data = self._cache_manager.read(
@@ -445,7 +450,7 @@ class SingleStorageClient(AbstractStorageClient):
                         source_version=source_version,
                         byte_range=byte_range,
                         storage_provider=self._storage_provider,
-                        source_size=metadata.content_length if metadata else None,
+                        source_size=source_size,
                     )
                     if data is not None:
                         return data
@@ -1059,6 +1064,7 @@ class SingleStorageClient(AbstractStorageClient):
         dryrun: bool = False,
         dryrun_output_path: str | None = None,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> SyncResult:
         """
         Syncs files from the source storage client to "path/".
@@ -1094,6 +1100,8 @@ class SingleStorageClient(AbstractStorageClient):
             :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
             :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on the target via :py:meth:`make_symlink`
             instead of copying bytes (required for round-trip preservation of symlinks).
+        :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+            the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
         :raises ValueError: If both source_files and patterns are provided.
         :raises RuntimeError: If errors occur during sync operations. The sync will stop on first error (fail-fast).
         """
@@ -1111,7 +1119,8 @@ class SingleStorageClient(AbstractStorageClient):
             source_client._replica_manager = None
 
         m = SyncManager(source_client, source_path, self, target_path)
-        batch_size = int(os.environ.get("MSC_SYNC_BATCH_SIZE", DEFAULT_SYNC_BATCH_SIZE))
+        if batch_size is None:
+            batch_size = int(os.environ.get("MSC_SYNC_BATCH_SIZE", DEFAULT_SYNC_BATCH_SIZE))
 
         return m.sync_objects(
             execution_mode=execution_mode,
@@ -1140,6 +1149,7 @@ class SingleStorageClient(AbstractStorageClient):
         patterns: PatternList | None = None,
         ignore_hidden: bool = True,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> None:
         """
         Sync files from this client to its replica storage clients.
@@ -1157,6 +1167,8 @@ class SingleStorageClient(AbstractStorageClient):
             :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
             :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on each replica via
             :py:meth:`make_symlink` instead of copying bytes.
+        :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+            the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
         """
         if not self._replicas:
             logger.warning(
@@ -1196,6 +1208,7 @@ class SingleStorageClient(AbstractStorageClient):
                 patterns=patterns,
                 ignore_hidden=ignore_hidden,
                 symlink_handling=symlink_handling,
+                batch_size=batch_size,
             )
 
     def list(
@@ -103,6 +103,7 @@ class AbstractStorageClient(ABC):
         path: str,
         byte_range: Range | None = None,
         check_source_version: SourceVersionCheckMode = SourceVersionCheckMode.INHERIT,
+        source_size: int | None = None,
     ) -> bytes:
         """
         Read bytes from a file at the specified logical path.
@@ -110,6 +111,7 @@ class AbstractStorageClient(ABC):
         :param path: The logical path of the object to read.
         :param byte_range: Optional byte range to read (offset and length).
         :param check_source_version: Whether to check the source version of cached objects.
+        :param source_size: Optional size of the object in bytes, if already known by the caller.
         :return: The content of the object as bytes.
         :raises FileNotFoundError: If the file at the specified path does not exist.
         """
@@ -379,6 +381,7 @@ class AbstractStorageClient(ABC):
         dryrun: bool = False,
         dryrun_output_path: str | None = None,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> SyncResult:
         """
         Syncs files from the source storage client to "path/".
@@ -414,6 +417,8 @@ class AbstractStorageClient(ABC):
             :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
             :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on the target via :py:meth:`make_symlink`
             instead of copying bytes (required for round-trip preservation of symlinks).
+        :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+            the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
         :raises ValueError: If both source_files and patterns are provided.
         :raises NotImplementedError: If sync operations are not supported (e.g., CompositeStorageClient as target).
         """
@@ -430,6 +435,7 @@ class AbstractStorageClient(ABC):
         patterns: PatternList | None = None,
         ignore_hidden: bool = True,
         symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+        batch_size: int | None = None,
     ) -> None:
         """
         Sync files from this client to its replica storage clients.
@@ -447,6 +453,8 @@ class AbstractStorageClient(ABC):
             :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
             :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on each replica via
             :py:meth:`make_symlink` instead of copying bytes.
+        :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+            the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
         """
 
     @abstractmethod
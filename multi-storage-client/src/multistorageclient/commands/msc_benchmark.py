@@ -25,7 +25,7 @@ from multiprocessing.managers import ListProxy
 from typing import Any
 
 from multistorageclient import StorageClient, StorageClientConfig
-from multistorageclient.schema import BENCHMARK_SCHEMA, validate
+from multistorageclient.schema import validate_benchmark_config
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -56,7 +56,7 @@ def load_config(config_path: str | None) -> dict[str, Any]:
                 config = json.load(f)
 
             # Validate config against benchmark schema
-            validate(instance=config, schema=BENCHMARK_SCHEMA)
+            validate_benchmark_config(config)
 
             return config
         except json.JSONDecodeError as e:
@@ -26,8 +26,12 @@ from urllib.parse import urlparse
 
 import yaml
 
-from .cache import DEFAULT_CACHE_LINE_SIZE, DEFAULT_CACHE_SIZE, CacheManager
-from .caching.cache_config import CacheConfig, EvictionPolicyConfig
+from .cache import (
+    DEFAULT_CACHE_LINE_SIZE,
+    DEFAULT_CACHE_SIZE,
+    CacheManager,
+)
+from .caching.cache_config import DEFAULT_DOWNLOAD_PARALLELISM, CacheConfig, EvictionPolicyConfig
 from .providers.manifest_metadata import ManifestMetadataProvider
 from .rclone import read_rclone_config
 from .schema import validate_config
@@ -927,6 +931,8 @@ class StorageClientConfigLoader:
                 "cache:\n"
                 "  size: 500G                    # Optional: Maximum cache size (default: 10G)\n"
                 "  cache_line_size: 64M          # Optional: Chunk size for partial file caching (default: 64M)\n"
+                "  coalesce_window: 256M         # Optional: Max span of missing chunks fetched per request (default: 4 cache lines)\n"
+                "  download_parallelism: 8       # Optional: Max concurrent chunk requests per read (default: 8)\n"
                 "  check_source_version: true    # Optional: Use ETag for cache validation (default: true)\n"
                 "  location: /tmp/msc_cache      # Optional: Cache directory path (default: system tempdir + '/msc_cache')\n"
                 "  eviction_policy:               # Optional: Cache eviction policy\n"
@@ -1093,6 +1099,8 @@ class StorageClientConfigLoader:
                 prefetch_file=cache_dict.get("prefetch_file", True),
                 eviction_policy=eviction_policy,
                 cache_line_size=cache_dict.get("cache_line_size", DEFAULT_CACHE_LINE_SIZE),
+                coalesce_window=cache_dict.get("coalesce_window"),
+                download_parallelism=cache_dict.get("download_parallelism", DEFAULT_DOWNLOAD_PARALLELISM),
             )
 
             cache_manager = CacheManager(profile=self._profile, cache_config=cache_config)
@@ -13,13 +13,179 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import itertools
+import mmap
 import os
 import pickle as _pickle
-from collections.abc import Callable, Iterable
+import threading
+import types
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import IO, Any
 
+from ..client import StorageClient
 from ..pathlib import MultiStoragePath
-from ..shortcuts import open as msc_open
+from ..shortcuts import resolve_storage_client
+
+#: Default read buffer size used by :py:func:`load` for files it opens itself.
+DEFAULT_LOAD_BUFFER_SIZE = 16 * 1024 * 1024
+
+#: Default size in bytes up to which :py:func:`dump` serializes a remote object in memory and uploads it at once.
+DEFAULT_DUMP_IN_MEMORY_THRESHOLD = 128 * 1024 * 1024
+
+
+class _BufferPool:
+    """
+    Free-list of fixed-size ``bytearray`` slabs reused across :py:func:`load` calls instead of allocating per call.
+    """
+
+    def __init__(self, slab_sizes: tuple[int, ...], max_pooled_bytes: int):
+        self._slab_sizes = slab_sizes
+        self._max_pooled_bytes = max_pooled_bytes
+        self._free: dict[int, list[bytearray]] = {slab_size: [] for slab_size in slab_sizes}
+        self._pooled_bytes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, size: int) -> bytearray | None:
+        """
+        :return: The smallest slab holding ``size`` bytes, or ``None`` if ``size`` exceeds the largest slab.
+        """
+        slab_size = next((slab_size for slab_size in self._slab_sizes if slab_size >= size), None)
+        if slab_size is None:
+            return None
+        with self._lock:
+            free = self._free[slab_size]
+            if free:
+                self._pooled_bytes -= slab_size
+                return free.pop()
+        return bytearray(slab_size)
+
+    def release(self, buffer: bytearray) -> None:
+        with self._lock:
+            if self._pooled_bytes + len(buffer) <= self._max_pooled_bytes:
+                self._free[len(buffer)].append(buffer)
+                self._pooled_bytes += len(buffer)
+
+
+_BUFFER_POOL = _BufferPool(slab_sizes=(1 << 20, 1 << 22, 1 << 24), max_pooled_bytes=1 << 26)
+
+
+def _readinto_exactly(fp: IO[bytes], view: memoryview, path: str) -> None:
+    offset = 0
+    while offset < len(view):
+        bytes_read = fp.readinto(view[offset:])  # type: ignore[attr-defined]
+        if not bytes_read:
+            raise EOFError(f"Unexpected end of {path}")
+        offset += bytes_read
+
+
+def _load_remote(fp: IO[bytes], path: str, buffer_size: int, **kwargs: Any) -> Any:
+    """
+    Unpickle a remote object, reading it whole into a pooled slab when it fits and through a buffered reader otherwise.
+    """
+    size = fp.seek(0, os.SEEK_END)
+    fp.seek(0)
+    buffer = _BUFFER_POOL.acquire(size)
+    if buffer is None:
+        # Wrap ``fp`` so the unpickler's small opcode reads are served from memory instead of the underlying file.
+        reader = io.BufferedReader(fp, buffer_size=min(buffer_size, size))  # type: ignore[arg-type]
+        return _pickle.load(reader, **kwargs)
+    try:
+        with memoryview(buffer)[:size] as view:
+            _readinto_exactly(fp, view, path)
+            return _pickle.loads(view, **kwargs)
+    finally:
+        _BUFFER_POOL.release(buffer)
+
+
+def _map_file(path: str) -> mmap.mmap | None:
+    """
+    Map a local file read-only so the unpickler walks it in place instead of copying it through a file object.
+
+    :return: The mapping, or ``None`` for empty files, which cannot be mapped.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            return None
+        mapped = mmap.mmap(fd, 0, flags=mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0), prot=mmap.PROT_READ)
+    finally:
+        os.close(fd)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
+class _SpillingWriter:
+    """
+    Collect a pickle in memory and upload it in one request, switching to a streaming ``client.open(path, "wb")`` once
+    it grows past ``threshold`` bytes.
+    """
+
+    def __init__(self, client: StorageClient, path: str, attributes: dict[str, Any], threshold: int):
+        self._client = client
+        self._path = path
+        self._attributes = attributes
+        self._threshold = threshold
+        self._buffer: io.BytesIO | None = io.BytesIO()
+        self._fp: IO[bytes] | None = None
+
+    def write(self, data: Any) -> int:
+        if self._fp is None:
+            assert self._buffer is not None
+            if self._buffer.tell() + memoryview(data).nbytes <= self._threshold:
+                return self._buffer.write(data)
+            self._fp = self._client.open(self._path, mode="wb", attributes=self._attributes)  # type: ignore[assignment]
+            assert self._fp is not None
+            self._fp.write(self._buffer.getbuffer())
+            self._buffer = None
+        return self._fp.write(data)
+
+    def __enter__(self) -> "_SpillingWriter":  # noqa: PYI034
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        if self._fp is not None:
+            self._fp.__exit__(exc_type, exc_val, exc_tb)
+        elif exc_type is None:
+            assert self._buffer is not None
+            self._buffer.seek(0)
+            self._client.upload_file(self._path, self._buffer, attributes=self._attributes)
+
+
+def _resolve(file: str | MultiStoragePath) -> tuple[StorageClient, str]:
+    """
+    Resolve ``file`` to its storage client and path once, so the pickle and its out-of-band buffers share them.
+    """
+    if isinstance(file, MultiStoragePath):
+        return file._storage_client, str(file._internal_path)
+    return resolve_storage_client(file)
+
+
+def _read_buffer(client: StorageClient, path: str) -> bytearray:
+    """
+    Read an out-of-band buffer into a writable ``bytearray`` so arrays rebuilt on top of it stay writable.
+    """
+    with client.open(path, "rb") as fp:
+        size = fp.seek(0, os.SEEK_END)
+        fp.seek(0)
+        buffer = bytearray(size)
+        _readinto_exactly(fp, memoryview(buffer), path)
+        return buffer
+
+
+def _iter_buffers(client: StorageClient, path: str) -> Iterator[bytearray]:
+    """
+    Lazily yield the out-of-band buffers written alongside ``path``; the unpickler pulls exactly as many as it needs.
+    """
+    for index in itertools.count():
+        yield _read_buffer(client, f"{path}.buf{index}")
 
 
 def load(
@@ -29,6 +195,8 @@ def load(
     encoding: str = "ASCII",
     errors: str = "strict",
     buffers: Iterable[Any] | None = None,
+    buffer_size: int = DEFAULT_LOAD_BUFFER_SIZE,
+    out_of_band: bool = False,
 ) -> Any:
     """
     Adapt ``pickle.load``.
@@ -50,19 +218,75 @@ def load(
 
     User, however, cannot directly pass the file object as the msc-prefixed file path cannot be used by native
     ``open()`` i.e. ``multistorageclient.pickle.load(open(file_path_with_msc_protocol, "rb"))``
+
+    Paths backed by a POSIX filesystem are memory-mapped and unpickled in place.
+
+    :param buffer_size: Read buffer size in bytes used when ``file`` is a path to a remote object too large to be read
+        into a pooled buffer at once. File-like objects are read as-is so their position is left right after the pickle.
+    :param out_of_band: Read the out-of-band buffers written by :py:func:`dump` with ``out_of_band=True`` from the
+        ``<file>.buf<N>`` objects next to ``file``.
     """
 
-    if isinstance(file, str):
-        with msc_open(file) as fp:
-            return _pickle.load(fp, fix_imports=fix_imports, encoding=encoding, errors=errors, buffers=buffers)
-    elif isinstance(file, MultiStoragePath):
-        with file.open("rb") as fp:
-            return _pickle.load(fp, fix_imports=fix_imports, encoding=encoding, errors=errors, buffers=buffers)
+    if out_of_band:
+        if buffers is not None:
+            raise ValueError("buffers cannot be combined with out_of_band.")
+        if not isinstance(file, (str, MultiStoragePath)):
+            raise NotImplementedError("out_of_band requires a file path.")
+
+    if isinstance(file, (str, MultiStoragePath)):
+        client, path = _resolve(file)
+        if out_of_band:
+            buffers = _iter_buffers(client, path)
+        posix_path = client.get_posix_path(path)
+        mapped = _map_file(posix_path) if posix_path is not None else None
+        if mapped is not None:
+            with mapped:
+                return _pickle.loads(mapped, fix_imports=fix_imports, encoding=encoding, errors=errors, buffers=buffers)
+        with client.open(path, "rb") as fp:
+            return _load_remote(
+                fp, path, buffer_size, fix_imports=fix_imports, encoding=encoding, errors=errors, buffers=buffers
+            )
     else:
         # assume a file-like object
         return _pickle.load(file, fix_imports=fix_imports, encoding=encoding, errors=errors, buffers=buffers)  # type: ignore
 
 
+def load_many(
+    files: Iterable[str | os.PathLike[str]],
+    *,
+    max_workers: int | None = None,
+    fix_imports: bool = True,
+    encoding: str = "ASCII",
+    errors: str = "strict",
+) -> list[Any]:
+    """
+    Load many pickled files concurrently.
+
+    Each file is loaded with :py:func:`load` on a thread pool so opens and reads of many small shards overlap instead
+    of running one after another. Results are returned in the order of ``files``.
+
+    .. code-block:: python
+       :linenos:
+
+       shards = multistorageclient.pickle.load_many([f"msc://profile/shards/{i}.pkl" for i in range(1000)])
+
+    :param files: Paths (``msc://`` URLs, POSIX paths, :py:class:`pathlib.Path` or
+        :py:class:`multistorageclient.Path` objects) to load.
+    :param max_workers: Number of concurrent loads. Defaults to the ``MSC_MAX_WORKERS`` environment variable, or 8.
+    :return: The unpickled objects, in the order of ``files``.
+    """
+    max_workers = max_workers or int(os.getenv("MSC_MAX_WORKERS", "8"))
+
+    def _load(file: str | os.PathLike[str]) -> Any:
+        # :py:func:`load` treats anything other than a string or MultiStoragePath as a file-like object.
+        if isinstance(file, os.PathLike) and not isinstance(file, MultiStoragePath):
+            file = os.fspath(file)
+        return load(file, fix_imports=fix_imports, encoding=encoding, errors=errors)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_load, files))
+
+
 def dump(
     obj: Any,
     file_path: str | os.PathLike[str],
@@ -71,6 +295,8 @@ def dump(
     fix_imports: bool = True,
     buffer_callback: Callable[[Any], None] | None = None,
     attributes: dict[str, Any] | None = None,
+    out_of_band: bool = False,
+    in_memory_threshold: int = DEFAULT_DUMP_IN_MEMORY_THRESHOLD,
 ) -> None:
     """
     Adapt ``pickle.dump``.
@@ -90,14 +316,35 @@ def dump(
        with multistorageclient.open(file_path_with_msc_protocol, "rb") as fp:
            pickle.dump(data, fp, ....)
 
+    ``protocol`` defaults to ``pickle.HIGHEST_PROTOCOL``.
+
     :param attributes: Optional dictionary of custom attributes/metadata to attach to the file.
+    :param out_of_band: Write ``PickleBuffer`` payloads (e.g. large numpy arrays) as separate ``<file_path>.buf<N>``
+        objects instead of copying them into the pickle stream. Load them back with ``load(..., out_of_band=True)``.
+    :param in_memory_threshold: Remote objects whose pickle fits in this many bytes are serialized in memory and uploaded
+        in a single request. Larger pickles are streamed through ``multistorageclient.open(file_path, "wb")``.
     """
+    if protocol is None:
+        protocol = _pickle.HIGHEST_PROTOCOL
     attributes_dict = attributes or {}
-    if isinstance(file_path, str):
-        with msc_open(file_path, mode="wb", attributes=attributes_dict) as fp:
-            _pickle.dump(obj, fp, protocol=protocol, fix_imports=fix_imports, buffer_callback=buffer_callback)
-    elif isinstance(file_path, MultiStoragePath):
-        with file_path.open("wb", attributes=attributes_dict) as fp:
+
+    oob_buffers: list[_pickle.PickleBuffer] = []
+    if out_of_band:
+        if buffer_callback is not None:
+            raise ValueError("buffer_callback cannot be combined with out_of_band.")
+        buffer_callback = oob_buffers.append
+
+    if not isinstance(file_path, (str, MultiStoragePath)):
+        raise NotImplementedError("file object is not supported.")
+
+    client, path = _resolve(file_path)
+    if client.get_posix_path(path) is not None:
+        with client.open(path, mode="wb", attributes=attributes_dict) as fp:
             _pickle.dump(obj, fp, protocol=protocol, fix_imports=fix_imports, buffer_callback=buffer_callback)
     else:
-        raise NotImplementedError("file object is not supported.")
+        with _SpillingWriter(client, path, attributes_dict, in_memory_threshold) as fp:
+            _pickle.dump(obj, fp, protocol=protocol, fix_imports=fix_imports, buffer_callback=buffer_callback)
+
+    for index, buffer in enumerate(oob_buffers):
+        with client.open(f"{path}.buf{index}", mode="wb") as fp:
+            fp.write(buffer.raw())
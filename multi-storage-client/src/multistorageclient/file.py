@@ -106,7 +106,10 @@ class RemoteFileReader(IO[bytes]):
         # Perform range read from storage provider
         bytes_range = Range(offset=offset, size=length)
         data = self._storage_client.read(
-            self._remote_path, byte_range=bytes_range, check_source_version=self._check_source_version
+            self._remote_path,
+            byte_range=bytes_range,
+            check_source_version=self._check_source_version,
+            source_size=self._file_size,
         )
         # If the storage client is using the Rust client, convert the Rust bytes-like buffer to Python bytes
         # to support Python bytes operations like startswith()
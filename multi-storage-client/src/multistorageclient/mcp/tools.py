@@ -15,6 +15,7 @@
 
 """MCP tool definitions for Multi-Storage Client operations."""
 
+import itertools
 import json
 import logging
 
@@ -23,6 +24,9 @@ from .utils import get_storage_client_for_url, metadata_to_dict
 
 logger = logging.getLogger(__name__)
 
+#: Separators for metadata responses; compact output keeps ``json.dumps`` on the C encoder, ``indent`` does not.
+_COMPACT_SEPARATORS = (",", ":")
+
 
 @mcp.tool
 def msc_list(
@@ -33,6 +37,7 @@ def msc_list(
     attribute_filter_expression: str | None = None,
     show_attributes: bool = False,
     limit: int | None = None,
+    include_url_prefix: bool = True,
 ) -> str:
     """
     Lists the contents of the specified URL prefix in Multi-Storage Client.
@@ -47,10 +52,11 @@ def msc_list(
     :param attribute_filter_expression: Attribute filter expression to apply to results
     :param show_attributes: Whether to return attributes in the result
     :param limit: Maximum number of objects to return
+    :param include_url_prefix: Whether to return keys as full URLs rather than paths relative to the profile
     :return: JSON string containing list of objects with their metadata
     """
     try:
-        logger.info(f"Listing objects at URL: {url}")
+        logger.info("Listing objects at URL: %s", url)
 
         client, path = get_storage_client_for_url(url)
 
@@ -59,20 +65,13 @@ def msc_list(
             start_after=start_after,
             end_at=end_at,
             include_directories=include_directories,
-            include_url_prefix=True,
+            include_url_prefix=include_url_prefix,
             attribute_filter_expression=attribute_filter_expression,
             show_attributes=show_attributes,
         )
 
-        # Collect results with optional limit
-        objects = []
-        count = 0
-        for obj_metadata in results_iter:
-            obj_dict = metadata_to_dict(obj_metadata)
-            objects.append(obj_dict)
-            count += 1
-            if limit and count >= limit:
-                break
+        objects = [metadata_to_dict(obj_metadata) for obj_metadata in itertools.islice(results_iter, limit or None)]
+        count = len(objects)
 
         result = {"success": True, "url": url, "count": count, "objects": objects}
 
@@ -80,13 +79,13 @@ def msc_list(
             result["truncated"] = True
             result["message"] = f"Results limited to {limit} objects"
 
-        logger.info(f"Successfully listed {count} objects from {url}")
-        return json.dumps(result, indent=2, default=str)
+        logger.info("Successfully listed %d objects from %s", count, url)
+        return json.dumps(result, separators=_COMPACT_SEPARATORS, default=str)
 
     except Exception as e:
-        logger.error(f"Error listing objects at {url}: {e!s}")
+        logger.error("Error listing objects at %s: %s", url, e)
         error_result = {"success": False, "error": str(e), "url": url}
-        return json.dumps(error_result, indent=2)
+        return json.dumps(error_result, separators=_COMPACT_SEPARATORS)
 
 
 @mcp.tool
@@ -101,7 +100,7 @@ def msc_info(url: str) -> str:
     :return: JSON string containing object metadata including size, last modified time, type, etc.
     """
     try:
-        logger.info(f"Getting info for URL: {url}")
+        logger.info("Getting info for URL: %s", url)
 
         client, path = get_storage_client_for_url(url)
 
@@ -109,13 +108,13 @@ def msc_info(url: str) -> str:
 
         result = {"success": True, "url": url, "metadata": metadata_to_dict(metadata)}
 
-        logger.info(f"Successfully retrieved info for {url}")
-        return json.dumps(result, indent=2, default=str)
+        logger.info("Successfully retrieved info for %s", url)
+        return json.dumps(result, separators=_COMPACT_SEPARATORS, default=str)
 
     except Exception as e:
-        logger.error(f"Error getting info for {url}: {e!s}")
+        logger.error("Error getting info for %s: %s", url, e)
         error_result = {"success": False, "error": str(e), "url": url}
-        return json.dumps(error_result, indent=2)
+        return json.dumps(error_result, separators=_COMPACT_SEPARATORS)
 
 
 @mcp.tool
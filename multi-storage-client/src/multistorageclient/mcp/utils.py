@@ -15,13 +15,26 @@
 
 """Shared utilities and helpers for Multi-Storage Client MCP server."""
 
+import os
+import threading
+from collections import OrderedDict
 from typing import Any
 
 from multistorageclient import StorageClient, StorageClientConfig
+from multistorageclient.config import _find_config_file_paths
+from multistorageclient.rclone import _get_rclone_config_path
 from multistorageclient.types import ObjectMetadata
 
 from .server import mcp_wrapper
 
+#: Maximum number of storage clients kept by the MCP server.
+_MCP_CLIENT_CACHE_MAXSIZE = 256
+#: Least recently used storage clients keyed by profile and the versions of the configuration files they were built from.
+_MCP_CLIENT_CACHE: OrderedDict[tuple[str, tuple[tuple[str, int | None, int | None], ...]], StorageClient] = (
+    OrderedDict()
+)
+_MCP_CLIENT_CACHE_LOCK = threading.Lock()
+
 
 def metadata_to_dict(metadata: ObjectMetadata) -> dict[str, Any]:
     """
@@ -61,12 +74,41 @@ def get_msc_config_paths() -> list[str] | None:
         return None
 
 
+def _config_file_versions(config_file_paths: list[str] | None) -> tuple[tuple[str, int | None, int | None], ...]:
+    """
+    Get the versions of the configuration files a storage client would be built from.
+
+    :param config_file_paths: Configuration file search paths, or None for the default search paths
+    :return: Tuple of ``(path, st_mtime_ns, st_size)`` for each candidate file, with None for missing files
+    """
+    if config_file_paths:
+        candidate_paths = list(config_file_paths)
+    else:
+        msc_config_env = os.getenv("MSC_CONFIG")
+        candidate_paths = ([msc_config_env] if msc_config_env else []) + list(_find_config_file_paths())
+
+    rclone_config_path = _get_rclone_config_path()
+    if rclone_config_path is not None:
+        candidate_paths.append(str(rclone_config_path))
+
+    versions = []
+    for path in candidate_paths:
+        try:
+            stat_result = os.stat(path)
+            versions.append((path, stat_result.st_mtime_ns, stat_result.st_size))
+        except OSError:
+            versions.append((path, None, None))
+    return tuple(versions)
+
+
 def get_storage_client_for_url(url: str) -> tuple[StorageClient, str]:
     """
     Create a StorageClient instance for the given URL using MCP server configuration.
 
     This function uses get_msc_config_paths() to determine configuration file paths,
-    then creates a StorageClient instance for the resolved profile.
+    then creates a StorageClient instance for the resolved profile. Clients are cached
+    per profile and configuration file version, so repeated tool calls reuse them until
+    a configuration file changes.
 
     :param url: The storage URL to resolve
     :return: Tuple of (StorageClient instance, resolved path)
@@ -83,11 +125,21 @@ def get_storage_client_for_url(url: str) -> tuple[StorageClient, str]:
     # Get configuration file paths using MCP server configuration
     config_file_paths = get_msc_config_paths()
 
-    # Create StorageClient with the determined configuration
-    config = StorageClientConfig.from_file(
-        config_file_paths=config_file_paths,
-        profile=profile,
-    )
-    client = StorageClient(config)
+    # Reuse the client across tool calls; editing, adding or removing a config file produces a new key.
+    cache_key = (profile, _config_file_versions(config_file_paths))
+    with _MCP_CLIENT_CACHE_LOCK:
+        client = _MCP_CLIENT_CACHE.get(cache_key)
+        if client is None:
+            # Create StorageClient with the determined configuration
+            config = StorageClientConfig.from_file(
+                config_file_paths=config_file_paths,
+                profile=profile,
+            )
+            client = StorageClient(config)
+            _MCP_CLIENT_CACHE[cache_key] = client
+            if len(_MCP_CLIENT_CACHE) > _MCP_CLIENT_CACHE_MAXSIZE:
+                _MCP_CLIENT_CACHE.popitem(last=False)
+        else:
+            _MCP_CLIENT_CACHE.move_to_end(cache_key)
 
     return client, path
@@ -55,9 +55,10 @@ class JsonlManifestFormatHandler(ManifestFormatHandler):
         return "\n".join(lines).encode("utf-8")
 
     def read_part(self, content: bytes) -> list[ObjectMetadata]:
+        # Parse every line in one json.loads call over a JSON array instead of one call per line.
+        lines = [line for line in content.decode("utf-8").split("\n") if line.strip()]
         object_metadata = []
-        for line in io.TextIOWrapper(io.BytesIO(content), encoding="utf-8"):
-            object_metadatum_dict = json.loads(line)
+        for object_metadatum_dict in json.loads(f"[{','.join(lines)}]"):
             object_metadatum_dict["content_length"] = object_metadatum_dict.pop("size_bytes")
 
             # Extract physical_path before from_dict (to set as attribute after)
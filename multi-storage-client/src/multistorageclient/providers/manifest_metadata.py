@@ -15,10 +15,14 @@
 
 from __future__ import annotations  # Enables forward references in type hints
 
+import bisect
+import itertools
 import json
 import logging
 import os
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -43,6 +47,7 @@ DEFAULT_MANIFEST_BASE_DIR = ".msc_manifests"
 MANIFEST_INDEX_FILENAME = "msc_manifest_index.json"
 MANIFEST_PARTS_CHILD_DIR = "parts"
 MANIFEST_PART_PREFIX = "msc_manifest_part"
+MANIFEST_PART_PREFETCH_FACTOR = 2  # Manifest part reads kept in flight per worker ahead of the consumer
 SEQUENCE_PADDING = 6  # Define padding for the sequence number (e.g., 6 for "000001")
 
 
@@ -111,12 +116,14 @@ class Manifest:
 class ManifestMetadataProvider(MetadataProvider):
     _storage_provider: StorageProvider
     _files: dict[str, ManifestObjectMetadata]
+    _sorted_keys: list[str]
     _pending_adds: dict[str, ManifestObjectMetadata]
     _pending_removes: set[str]
     _manifest_path: str
     _writable: bool
     _allow_overwrites: bool
     _format: ManifestFormat | str
+    _max_workers: int | None
 
     def __init__(
         self,
@@ -125,6 +132,7 @@ class ManifestMetadataProvider(MetadataProvider):
         writable: bool = False,
         allow_overwrites: bool = False,
         manifest_format: ManifestFormat | str = ManifestFormat.JSONL,
+        max_workers: int | None = None,
     ) -> None:
         """
         Creates a :py:class:`ManifestMetadataProvider`.
@@ -134,9 +142,11 @@ class ManifestMetadataProvider(MetadataProvider):
         :param writable: If true, allows modifications and new manifests to be written.
         :param allow_overwrites: If true, allows overwriting existing files without error.
         :param manifest_format: Format for manifest parts. Defaults to ManifestFormat.JSONL.
+        :param max_workers: Maximum number of manifest parts to load concurrently. Defaults to ``min(32, <number of parts>)``.
         """
         self._storage_provider = storage_provider
         self._files = {}
+        self._sorted_keys = []
         self._pending_adds = {}
         self._pending_removes = set()
         self._manifest_path = manifest_path
@@ -145,8 +155,10 @@ class ManifestMetadataProvider(MetadataProvider):
         self._format = (
             manifest_format if isinstance(manifest_format, ManifestFormat) else ManifestFormat(manifest_format)
         )
+        self._max_workers = max_workers
 
         self._load_manifest(storage_provider, self._manifest_path)
+        self._sorted_keys = sorted(self._files)
 
     def _load_manifest(self, storage_provider: StorageProvider, manifest_path: str) -> None:
         """
@@ -201,20 +213,51 @@ class ManifestMetadataProvider(MetadataProvider):
             if manifest.version != "1":
                 raise ValueError(f"Manifest version {manifest.version} is not supported.")
 
-            # Load manifest parts.
-            for manifest_part_reference in manifest.parts:
-                object_metadata_list: list[ManifestObjectMetadata] = self._load_manifest_part_file(
+            # Load manifest parts. Results are applied in part order so later parts still win on duplicate keys.
+            def load_part(manifest_part_reference: ManifestPartReference) -> list[ManifestObjectMetadata]:
+                return self._load_manifest_part_file(
                     storage_provider=storage_provider,
                     manifest_base=manifest_base,
                     manifest_part_reference=manifest_part_reference,
                     manifest_format=manifest.format,
                 )
 
-                for object_metadatum in object_metadata_list:
-                    self._files[object_metadatum.key] = object_metadatum
+            for object_metadata_list in self._prefetch_manifest_parts(load_part, manifest.parts):
+                self._files.update(
+                    (object_metadatum.key, object_metadatum) for object_metadatum in object_metadata_list
+                )
         else:
             raise NotImplementedError(f"Manifest file type {file_type} is not supported.")
 
+    def _prefetch_manifest_parts(
+        self,
+        load_part: Callable[[ManifestPartReference], list[ManifestObjectMetadata]],
+        manifest_part_references: list[ManifestPartReference],
+    ) -> Iterator[list[ManifestObjectMetadata]]:
+        """
+        Yields loaded manifest parts in order while keeping a bounded window of part reads in flight.
+
+        :param load_part: Function that fetches and parses a single manifest part.
+        :param manifest_part_references: Manifest part references in manifest order.
+        """
+        max_workers = min(self._max_workers or 32, len(manifest_part_references))
+        if max_workers <= 1:
+            yield from map(load_part, manifest_part_references)
+            return
+
+        references = iter(manifest_part_references)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque(
+                executor.submit(load_part, reference)
+                for reference in itertools.islice(references, MANIFEST_PART_PREFETCH_FACTOR * max_workers)
+            )
+            while pending:
+                object_metadata_list = pending.popleft().result()
+                next_reference = next(references, None)
+                if next_reference is not None:
+                    pending.append(executor.submit(load_part, next_reference))
+                yield object_metadata_list
+
     def _load_manifest_part_file(
         self,
         storage_provider: StorageProvider,
@@ -343,10 +386,9 @@ class ManifestMetadataProvider(MetadataProvider):
             synthetic_directories: set[str] = set()
             files: list[ObjectMetadata] = []
 
-            for key, obj_metadata in sorted(self._files.items()):
-                if not key.startswith(path) or (
-                    evaluator is not None and not matches_attribute_filter_expression(obj_metadata, evaluator)
-                ):
+            for key in self._iter_sorted_keys(path):
+                obj_metadata = self._files[key]
+                if evaluator is not None and not matches_attribute_filter_expression(obj_metadata, evaluator):
                     continue
 
                 relative = key[len(path) :].lstrip("/")
@@ -400,21 +442,33 @@ class ManifestMetadataProvider(MetadataProvider):
             yield from sorted(files, key=lambda obj: obj.key)
             return
 
-        # Note that this is a generator, not a tuple (there's no tuple comprehension).
-        keys = (
-            key
-            for key, obj_metadata in self._files.items()
-            if key.startswith(path)
-            and obj_metadata.type != "directory"
-            and (start_after is None or start_after < key)
-            and (end_at is None or key <= end_at)
-            and (
+        for key in self._iter_sorted_keys(path, start_after=start_after, end_at=end_at):
+            obj_metadata = self._files[key]
+            if obj_metadata.type != "directory" and (
                 evaluator is None or matches_attribute_filter_expression(obj_metadata, evaluator)
-            )  # filter by evaluator if present
-        )
+            ):  # filter by evaluator if present
+                yield obj_metadata
 
-        for key in sorted(keys):
-            yield self._files[key]
+    def _iter_sorted_keys(
+        self, prefix: str, start_after: str | None = None, end_at: str | None = None
+    ) -> Iterator[str]:
+        """
+        Yields committed keys with the given prefix in sorted order, bounded by ``start_after`` and ``end_at``.
+
+        :param prefix: The key prefix.
+        :param start_after: The key to start after (exclusive).
+        :param end_at: The key to end at (inclusive).
+        """
+        sorted_keys = self._sorted_keys
+        start = bisect.bisect_left(sorted_keys, prefix)
+        if start_after is not None:
+            start = max(start, bisect.bisect_right(sorted_keys, start_after))
+        stop = len(sorted_keys) if end_at is None else bisect.bisect_right(sorted_keys, end_at)
+
+        for key in itertools.islice(sorted_keys, start, stop):
+            if not key.startswith(prefix):
+                return
+            yield key
 
     def get_object_metadata(self, path: str, include_pending: bool = False) -> ObjectMetadata:
         if path in self._files:
@@ -432,7 +486,7 @@ class ManifestMetadataProvider(MetadataProvider):
         dir_prefix = path.rstrip("/") + "/"
 
         has_committed = any(
-            k.startswith(dir_prefix) and (not include_pending or k not in self._pending_removes) for k in self._files
+            not include_pending or k not in self._pending_removes for k in self._iter_sorted_keys(dir_prefix)
         )
         has_pending = include_pending and any(k.startswith(dir_prefix) for k in self._pending_adds)
 
@@ -562,12 +616,18 @@ class ManifestMetadataProvider(MetadataProvider):
             return
 
         if self._pending_adds:
+            # Appending the sorted new keys leaves two sorted runs, which list.sort merges in linear time.
+            sorted_keys = self._sorted_keys + sorted(path for path in self._pending_adds if path not in self._files)
+            sorted_keys.sort()
+            self._sorted_keys = sorted_keys
             self._files.update(self._pending_adds)
             self._pending_adds = {}
 
-        for path in self._pending_removes:
-            self._files.pop(path)
-        self._pending_removes = set()
+        if self._pending_removes:
+            for path in self._pending_removes:
+                self._files.pop(path)
+            self._sorted_keys = [key for key in self._sorted_keys if key not in self._pending_removes]
+            self._pending_removes = set()
 
         # Serialize ManifestObjectMetadata directly
         # to_dict() will include all fields including physical_path
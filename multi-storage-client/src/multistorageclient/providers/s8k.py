@@ -13,13 +13,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import mimetypes
+import os
 from typing import IO
 
 from .s3 import S3StorageProvider
 
 PROVIDER = "s8k"
 
+#: Content types for common extensions, matching the defaults built into :py:mod:`mimetypes`.
+#:
+#: Resolving these from a fixed table keeps uploads independent of the host's mime.types files
+#: and skips the :py:mod:`mimetypes` registry entirely for the extensions seen most often.
+_CONTENT_TYPES_BY_EXTENSION: dict[str, str] = {
+    "csv": "text/csv",
+    "gif": "image/gif",
+    "htm": "text/html",
+    "html": "text/html",
+    "ico": "image/vnd.microsoft.icon",
+    "jpeg": "image/jpeg",
+    "jpg": "image/jpeg",
+    "json": "application/json",
+    "mov": "video/quicktime",
+    "mp3": "audio/mpeg",
+    "mp4": "video/mp4",
+    "mpeg": "video/mpeg",
+    "mpg": "video/mpeg",
+    "pdf": "application/pdf",
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "tar": "application/x-tar",
+    "tif": "image/tiff",
+    "tiff": "image/tiff",
+    "tsv": "text/tab-separated-values",
+    "txt": "text/plain",
+    "wav": "audio/x-wav",
+    "zip": "application/zip",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type_from_suffixes(suffixes: str) -> str | None:
+    """
+    Guess the content type for a file name's suffixes (e.g. ``wav`` or ``tar.gz``).
+
+    :py:func:`mimetypes.guess_type` only looks at a file name's trailing suffixes, so results are cached per suffix
+    chain rather than per path.
+    """
+    if not suffixes:
+        return None
+    # Encoding suffixes (e.g. gz) are never in the table, so "tar.gz" still reaches mimetypes.
+    content_type = _CONTENT_TYPES_BY_EXTENSION.get(suffixes.rpartition(".")[2].lower())
+    if content_type is None:
+        content_type, _ = mimetypes.guess_type(f"file.{suffixes}")
+    return content_type
+
 
 class S8KStorageProvider(S3StorageProvider):
     """
@@ -32,7 +81,8 @@ class S8KStorageProvider(S3StorageProvider):
 
     :param infer_content_type: When True, automatically infers MIME types from file extensions during upload operations.
         For example, ``.wav`` files are uploaded with ``Content-Type: audio/x-wav``, enabling browsers to play
-        media files inline rather than downloading them. Uses Python's built-in ``mimetypes`` module for inference.
+        media files inline rather than downloading them. Common extensions are resolved from a fixed table, and
+        other extensions fall back to Python's built-in ``mimetypes`` module.
         Default is False. Only affects write operations (``upload_file``, ``write``, ``put_object``).
 
     .. note::
@@ -79,9 +129,9 @@ class S8KStorageProvider(S3StorageProvider):
         if not self._infer_content_type:
             return None
 
-        # Use mimetypes to guess the content type based on file extension
-        content_type, _ = mimetypes.guess_type(file_path)
-        return content_type
+        # Leading dots mark hidden files (e.g. ".json") rather than an extension, so strip them first.
+        _, _, suffixes = os.path.basename(file_path).lstrip(".").partition(".")
+        return _guess_content_type_from_suffixes(suffixes)
 
     def _put_object(
         self,
@@ -104,8 +154,8 @@ class S8KStorageProvider(S3StorageProvider):
         :param attributes: Optional attributes to attach to the object.
         :param content_type: Optional explicit Content-Type. If not provided, will be inferred if enabled.
         """
-        # Infer content type from the path if not explicitly provided
-        if content_type is None:
+        # Infer content type from the path if enabled and not explicitly provided
+        if content_type is None and self._infer_content_type:
             content_type = self._guess_content_type(path)
 
         # Delegate to parent with inferred or explicit content_type
@@ -128,8 +178,8 @@ class S8KStorageProvider(S3StorageProvider):
         :param attributes: Optional attributes to attach to the file.
         :param content_type: Optional explicit Content-Type. If not provided, will be inferred if enabled.
         """
-        # Infer content type if not explicitly provided
-        if content_type is None:
+        # Infer content type if enabled and not explicitly provided
+        if content_type is None and self._infer_content_type:
             # For file paths, infer from the local file path
             # For file objects, infer from the remote path (destination key)
             if isinstance(f, str):
@@ -18,7 +18,7 @@ import logging
 import os
 import tempfile
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO, StringIO
 from typing import IO
 
@@ -31,11 +31,47 @@ logger = logging.getLogger(__name__)
 # The async uploads are network-bound, so such a large pool wastes memory and harms context-switch performance.
 DEFAULT_REPLICA_UPLOAD_WORKERS = 8
 
-_REPLICA_THREAD_POOL = ThreadPoolExecutor(
-    max_workers=int(os.getenv("MSC_REPLICA_UPLOAD_THREADS", DEFAULT_REPLICA_UPLOAD_WORKERS))
-)
+_REPLICA_THREAD_POOL: ThreadPoolExecutor | None = None
+_REPLICA_THREAD_POOL_LOCK = threading.Lock()
 
-atexit.register(lambda: _REPLICA_THREAD_POOL.shutdown(wait=False))
+
+def _get_replica_thread_pool() -> ThreadPoolExecutor:
+    """
+    Get the thread pool for background replica uploads, creating it on first use in this process.
+
+    The pool size is read from ``MSC_REPLICA_UPLOAD_THREADS`` when the pool is created.
+    """
+    global _REPLICA_THREAD_POOL
+
+    with _REPLICA_THREAD_POOL_LOCK:
+        if _REPLICA_THREAD_POOL is None:
+            _REPLICA_THREAD_POOL = ThreadPoolExecutor(
+                max_workers=int(os.getenv("MSC_REPLICA_UPLOAD_THREADS", DEFAULT_REPLICA_UPLOAD_WORKERS)),
+                thread_name_prefix="msc-replica-upload",
+            )
+        return _REPLICA_THREAD_POOL
+
+
+def _shutdown_replica_thread_pool() -> None:
+    if _REPLICA_THREAD_POOL is not None:
+        _REPLICA_THREAD_POOL.shutdown(wait=False)
+
+
+def _reinitialize_after_fork() -> None:
+    """
+    Drop the parent's replica upload pool after fork. Its worker threads do not exist in the child process, so the
+    child creates a new pool on first use.
+    """
+    global _REPLICA_THREAD_POOL, _REPLICA_THREAD_POOL_LOCK
+
+    _REPLICA_THREAD_POOL = None
+    _REPLICA_THREAD_POOL_LOCK = threading.Lock()
+
+
+atexit.register(_shutdown_replica_thread_pool)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reinitialize_after_fork)
 
 
 class ReplicaManager:
@@ -47,6 +83,8 @@ class ReplicaManager:
         self._storage_client = storage_client
         # Thread-safe set to track files currently being uploaded
         self._uploading_files = set()
+        # Background uploads submitted by this manager that have not finished yet
+        self._upload_futures: set[Future] = set()
         self._upload_lock = threading.Lock()
 
     def download_from_replica_or_primary(
@@ -91,17 +129,32 @@ class ReplicaManager:
 
             # Submit replica upload - (fire-and-forget, non-blocking)
             # Pass the file object directly to avoid pickle issues
-            _REPLICA_THREAD_POOL.submit(
+            upload_future = _get_replica_thread_pool().submit(
                 self._upload_to_replicas,
                 file,
                 remote_path,
                 replicas_that_need_updates,
             )
+            with self._upload_lock:
+                self._upload_futures.add(upload_future)
+            upload_future.add_done_callback(self._discard_upload_future)
 
             logger.debug(
                 f"Submitted background replica upload for {remote_path} to {len(replicas_that_need_updates)} replicas"
             )
 
+    def _discard_upload_future(self, upload_future: Future) -> None:
+        with self._upload_lock:
+            self._upload_futures.discard(upload_future)
+
+    def _pending_uploads(self) -> set[Future]:
+        """Return the background replica uploads that have not finished yet.
+
+        :return: futures of the in-flight uploads submitted by this manager
+        """
+        with self._upload_lock:
+            return set(self._upload_futures)
+
     def _prepare_file_for_upload(self, file: str | IO) -> tuple[str, bool]:
         """Convert file object to path and determine if cleanup is needed.
 
@@ -13,10 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from collections import Counter
 from typing import Any
 
-from jsonschema import validate
+from jsonschema import exceptions, validators
+from jsonschema.protocols import Validator
 
 EXTENSION_SCHEMA = {
     "type": "object",
@@ -66,6 +68,11 @@ CACHE_SCHEMA = {
             "type": "string",
             "pattern": "(?i)^[0-9]+[MGT]$",  # Accepts size with M, G suffix
         },
+        "coalesce_window": {
+            "type": "string",
+            "pattern": "(?i)^[0-9]+[MGT]$",  # Accepts size with M, G suffix
+        },
+        "download_parallelism": {"type": "integer", "minimum": 1},
         "eviction_policy": {
             "type": "object",
             "properties": {
@@ -188,7 +195,7 @@ POSIX_SCHEMA = {
         "mountpoint": {
             "type": "string",
             "description": "File system path where the FUSE mount will be created",
-            "pattern": "^/([^/\0]+/)*[^/\0]*$",  # Valid absolute path: starts with /, no null chars, no double slashes
+            "pattern": "^/(?:[^/\\x00]+/)*[^/\\x00]*$",  # Valid absolute path: starts with /, no null chars, no double slashes
             "default": "/mnt",
         },
         "allow_other": {
@@ -245,11 +252,41 @@ def _reject_deprecated_cache_keys(config_dict: dict[str, Any]) -> None:
         raise ValueError("cache.use_etag is no longer supported. Use cache.check_source_version instead.")
 
 
+def _build_validator(schema: dict[str, Any]) -> Validator:
+    # Checking the schema and building its validator dominates validation time, so callers cache the result
+    validator_class = validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@functools.cache
+def _config_validator() -> Validator:
+    return _build_validator(CONFIG_SCHEMA)
+
+
+@functools.cache
+def _benchmark_validator() -> Validator:
+    return _build_validator(BENCHMARK_SCHEMA)
+
+
+def validate_benchmark_config(config_dict: dict[str, Any]) -> None:
+    """
+    Validate a benchmark configuration against :py:data:`BENCHMARK_SCHEMA`.
+
+    :raises jsonschema.exceptions.ValidationError: If the configuration is invalid.
+    """
+    error = exceptions.best_match(_benchmark_validator().iter_errors(config_dict))
+    if error is not None:
+        raise error
+
+
 def validate_config(config_dict: dict[str, Any]) -> None:
     _reject_deprecated_cache_keys(config_dict)
 
     try:
-        validate(instance=config_dict, schema=CONFIG_SCHEMA)
+        error = exceptions.best_match(_config_validator().iter_errors(config_dict))
+        if error is not None:
+            raise error
     except Exception as e:
         raise RuntimeError("Failed to validate the config file", e)
 
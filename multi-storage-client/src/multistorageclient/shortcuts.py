@@ -13,11 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import builtins
 import logging
 import os
 import re
 import threading
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 from urllib.parse import ParseResult, urlparse
 
@@ -441,6 +442,7 @@ def sync_replicas(
     patterns: PatternList | None = None,
     ignore_hidden: bool = True,
     symlink_handling: SymlinkHandling = SymlinkHandling.FOLLOW,
+    batch_size: int | None = None,
 ) -> None:
     """
     Syncs files from the source storage to all the replicas.
@@ -456,6 +458,8 @@ def sync_replicas(
         :py:attr:`SymlinkHandling.SKIP` excludes symlinks from the sync.
         :py:attr:`SymlinkHandling.PRESERVE` recreates symlinks on each replica via
         :py:meth:`AbstractStorageClient.make_symlink` instead of copying bytes.
+    :param batch_size: Maximum number of sync operations to batch together before enqueueing. If ``None`` (default),
+        the ``MSC_SYNC_BATCH_SIZE`` environment variable is used, falling back to ``DEFAULT_SYNC_BATCH_SIZE``.
     """
     source_client, source_path = resolve_storage_client(source_url)
     source_client.sync_replicas(
@@ -466,6 +470,7 @@ def sync_replicas(
         patterns=patterns,
         ignore_hidden=ignore_hidden,
         symlink_handling=symlink_handling,
+        batch_size=batch_size,
     )
 
 
@@ -590,6 +595,24 @@ def delete(url: str, recursive: bool = False) -> None:
     client.delete(path, recursive=recursive)
 
 
+def delete_many(urls: Iterable[str]) -> None:
+    """
+    Deletes multiple files, issuing one bulk delete per storage client instead of one request per file.
+
+    URLs are grouped by the :py:class:`multistorageclient.StorageClient` they resolve to, and each group is deleted
+    with :py:meth:`multistorageclient.StorageClient.delete_many`. Only files are supported; directories are not deleted.
+
+    :param urls: The URLs of the files to delete. (example: ``["msc://profile/prefix/a.txt", "msc://profile/prefix/b.txt"]``)
+    """
+    paths_by_client: dict[int, tuple[StorageClient, builtins.list[str]]] = {}
+    for url in urls:
+        client, path = resolve_storage_client(url)
+        paths_by_client.setdefault(id(client), (client, []))[1].append(path)
+
+    for client, paths in paths_by_client.values():
+        client.delete_many(paths)
+
+
 def info(url: str) -> ObjectMetadata:
     """
     Retrieves metadata or information about an object stored at the specified path.
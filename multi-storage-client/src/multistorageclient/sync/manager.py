@@ -169,9 +169,10 @@ class SyncManager:
         # Create the file and result queues.
         if execution_mode == ExecutionMode.LOCAL:
             if num_worker_processes == 1:
-                file_queue = queue.Queue()
-                result_queue = queue.Queue()
-                error_queue = queue.Queue()
+                # SimpleQueue is implemented in C and skips the condition variables and task tracking of queue.Queue.
+                file_queue = queue.SimpleQueue()
+                result_queue = queue.SimpleQueue()
+                error_queue = queue.SimpleQueue()
                 shutdown_event = threading.Event()
             else:
                 # Use spawn context to ensure fork-safety with boto3/cloud SDK clients.
@@ -395,7 +396,7 @@ class SyncManager:
         if pattern_matcher and pattern_matcher.has_patterns():
             logger.debug(f"Using pattern filtering: {pattern_matcher}")
 
-        file_queue: queue.Queue = queue.Queue()
+        file_queue: queue.SimpleQueue = queue.SimpleQueue()
         shutdown_event = threading.Event()
 
         progress = ProgressBar(desc=f"{description} (dryrun)", show_progress=True, total_items=0)
@@ -179,10 +179,15 @@ class ProducerThread(threading.Thread):
 
         # Check file size is the same and the target's last_modified is not older than the source.
         # Compare timestamps at seconds resolution to avoid spurious mismatches from sub-second differences.
-        source_sec = source_info.last_modified.replace(microsecond=0)
-        target_sec = target_info.last_modified.replace(microsecond=0)
+        # Truncation preserves ordering, so it is only needed when the exact timestamps say the target is older.
+        if source_info.content_length != target_info.content_length:
+            return False
 
-        if source_info.content_length != target_info.content_length or source_sec > target_sec:
+        source_modified = source_info.last_modified
+        target_modified = target_info.last_modified
+        if source_modified > target_modified and (
+            source_modified.replace(microsecond=0) > target_modified.replace(microsecond=0)
+        ):
             return False
 
         if self.preserve_source_attributes and getattr(self.target_client, "_metadata_provider", None):
@@ -194,8 +199,7 @@ class ProducerThread(threading.Thread):
         """Check if a path contains any hidden components (starting with dot)."""
         if not self.ignore_hidden:
             return False
-        parts = path.split("/")
-        return any(part.startswith(".") for part in parts)
+        return path.startswith(".") or "/." in path
 
     def _create_listing_iterator(
         self,
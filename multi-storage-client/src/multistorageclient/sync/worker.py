@@ -14,10 +14,12 @@
 # limitations under the License.
 
 import contextlib
+import errno
 import json
 import logging
 import os
 import shutil
+import sys
 import tempfile
 import threading
 import traceback
@@ -58,6 +60,48 @@ def build_target_file_path(source_path: str, target_path: str, file_metadata: Ob
     return target_file_path
 
 
+def copy_posix_file(source_path: str, target_path: str) -> None:
+    """Copy a file's contents and metadata like :py:func:`shutil.copy2`.
+
+    On Linux the contents are copied with ``copy_file_range(2)``, which stays in the kernel and lets file systems
+    that support it reflink (e.g. btrfs, XFS) or copy server-side (e.g. NFS 4.2). Falls back to
+    :py:func:`shutil.copyfile` when the call is not supported for the two files.
+
+    :raises shutil.SameFileError: If the source and target are the same file (e.g. the same path or a hardlink).
+    """
+    # Checked before the target is opened for writing, which would otherwise truncate the source.
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        raise shutil.SameFileError(f"{source_path!r} and {target_path!r} are the same file")
+
+    if not _copy_file_range(source_path, target_path):
+        shutil.copyfile(source_path, target_path)
+    shutil.copystat(source_path, target_path)
+
+
+def _copy_file_range(source_path: str, target_path: str) -> bool:
+    """Copy file contents with ``copy_file_range(2)``. Returns False if nothing was copied and a fallback is needed."""
+    if sys.platform != "linux":
+        return False
+
+    with open(source_path, "rb") as source, open(target_path, "wb") as target:
+        source_fd, target_fd = source.fileno(), target.fileno()
+        source_size = os.fstat(source_fd).st_size
+        block_size = min(max(source_size, 8 * 1024 * 1024), 1024 * 1024 * 1024)
+        copied = 0
+        while True:
+            try:
+                count = os.copy_file_range(source_fd, target_fd, block_size)
+            except OSError as e:
+                # Unsupported file systems fail on the first call; anything later is a real error.
+                if copied == 0 and e.errno != errno.ENOSPC:
+                    return False
+                raise
+            if count == 0:
+                # Some special files (e.g. procfs) report a size but copy nothing.
+                return copied > 0 or source_size == 0
+            copied += count
+
+
 def check_skip_and_track_with_metadata_provider(
     target_client: "AbstractStorageClient",
     target_file_path: str,
@@ -353,22 +397,19 @@ class BatchSyncHandler(ABC):
 
 
 class PosixToPosixHandler(BatchSyncHandler):
-    """Handles sync from POSIX source to POSIX target using shutil.copy2.
+    """Handles sync from POSIX source to POSIX target using :py:func:`copy_posix_file`.
 
     Individual copies are sequential within a batch; the worker-level thread
-    pool provides concurrency across batches.
+    pool provides concurrency across batches. Target directories are created
+    once per batch rather than once per file.
     """
 
-    @staticmethod
-    def _copy_to_posix_target(source_physical_path: str, target_physical_path: str) -> None:
-        safe_makedirs(os.path.dirname(target_physical_path))
-        shutil.copy2(source_physical_path, target_physical_path)
-
     def _execute_batch_transfer(
         self,
         worker_id: str,
         transfer_items: list[tuple[ObjectMetadata, str]],
     ) -> None:
+        created_dirs: set[str] = set()
         for file_metadata, target_file_path in transfer_items:
             source_physical_path = self.source_client.get_posix_path(file_metadata.key)
             target_physical_path = self.target_client.get_posix_path(target_file_path)
@@ -376,7 +417,11 @@ class PosixToPosixHandler(BatchSyncHandler):
                 raise ValueError(f"Source key '{file_metadata.key}' has no POSIX path")
             if target_physical_path is None:
                 raise ValueError(f"Target path '{target_file_path}' has no POSIX path")
-            self._copy_to_posix_target(source_physical_path, target_physical_path)
+            target_dir = os.path.dirname(target_physical_path)
+            if target_dir not in created_dirs:
+                safe_makedirs(target_dir)
+                created_dirs.add(target_dir)
+            copy_posix_file(source_physical_path, target_physical_path)
             update_posix_metadata(self.target_client, target_physical_path, target_file_path, file_metadata)
 
 
@@ -415,12 +460,16 @@ class RemoteToPosixHandler(BatchSyncHandler):
         target_local_paths: list[str] = []
         source_metadata: list[ObjectMetadata] = []
         items_with_physical: list[tuple[ObjectMetadata, str, str]] = []
+        created_dirs: set[str] = set()
 
         for file_metadata, target_file_path in transfer_items:
             target_physical_path = self.target_client.get_posix_path(target_file_path)
             if target_physical_path is None:
                 raise ValueError(f"Target path '{target_file_path}' has no POSIX path")
-            safe_makedirs(os.path.dirname(target_physical_path))
+            target_dir = os.path.dirname(target_physical_path)
+            if target_dir not in created_dirs:
+                safe_makedirs(target_dir)
+                created_dirs.add(target_dir)
             source_remote_paths.append(file_metadata.key)
             target_local_paths.append(target_physical_path)
             source_metadata.append(file_metadata)
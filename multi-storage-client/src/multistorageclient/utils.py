@@ -14,7 +14,9 @@
 # limitations under the License.
 
 import fnmatch
+import functools
 import importlib
+import itertools
 import logging
 import math
 import multiprocessing
@@ -23,6 +25,7 @@ import re
 import shutil
 import time
 from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -642,6 +645,75 @@ class NullStorageClient:
         return True
 
 
+_GLOB_SPECIAL_CHARACTERS = frozenset("*?[")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Compile glob patterns into a single regular expression matching any of them.
+
+    This uses standard fnmatch translation, compatible with AWS S3 sync. Results are memoized so pattern matchers
+    built from the same patterns, e.g. one per sync or list call, translate and compile them only once per process.
+
+    :param patterns: The glob patterns to compile
+    :return: A compiled regular expression to be used with :py:meth:`re.Pattern.match`
+    """
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns))
+
+
+@dataclass(frozen=True)
+class _PatternRun:
+    """
+    A run of consecutive patterns of the same type, grouped by how each pattern is matched.
+
+    Literal patterns and patterns whose only wildcard is a single leading or trailing ``*`` are matched with
+    plain string operations. Only the remaining patterns are combined into a regular expression.
+    """
+
+    pattern_type: PatternType
+    exact_matches: frozenset[str]
+    prefixes: tuple[str, ...]
+    suffixes: tuple[str, ...]
+    regex: re.Pattern[str] | None
+
+    @classmethod
+    def from_patterns(cls, pattern_type: PatternType, patterns: list[str]) -> "_PatternRun":
+        exact_matches: set[str] = set()
+        prefixes: list[str] = []
+        suffixes: list[str] = []
+        glob_patterns: list[str] = []
+        for pattern in patterns:
+            normalized_pattern = os.path.normcase(pattern)
+            if _GLOB_SPECIAL_CHARACTERS.isdisjoint(normalized_pattern):
+                exact_matches.add(normalized_pattern)
+            elif normalized_pattern.startswith("*") and _GLOB_SPECIAL_CHARACTERS.isdisjoint(normalized_pattern[1:]):
+                suffixes.append(normalized_pattern[1:])
+            elif normalized_pattern.endswith("*") and _GLOB_SPECIAL_CHARACTERS.isdisjoint(normalized_pattern[:-1]):
+                prefixes.append(normalized_pattern[:-1])
+            else:
+                glob_patterns.append(pattern)
+
+        return cls(
+            pattern_type=pattern_type,
+            exact_matches=frozenset(exact_matches),
+            prefixes=tuple(prefixes),
+            suffixes=tuple(suffixes),
+            regex=_compile_globs(tuple(glob_patterns)) if glob_patterns else None,
+        )
+
+    def matches(self, normalized_path: str) -> bool:
+        """
+        Check whether any pattern of the run matches a path already normalized with :py:func:`os.path.normcase`.
+        """
+        return (
+            normalized_path in self.exact_matches
+            or normalized_path.endswith(self.suffixes)
+            or normalized_path.startswith(self.prefixes)
+            or (self.regex is not None and self.regex.match(normalized_path) is not None)
+        )
+
+
 class PatternMatcher:
     """
     A pattern matcher that implements AWS S3 sync-style include/exclude filtering.
@@ -659,16 +731,37 @@ class PatternMatcher:
     """
 
     patterns: PatternList
+    _default_included: bool
+    _pattern_runs: list[_PatternRun]
 
     def __init__(self, ordered_patterns: PatternList):
         """
         Create a PatternMatcher from an ordered list of pattern operations.
 
+        Consecutive patterns of the same type are grouped into runs so each file path is checked once per run of
+        patterns instead of once per pattern. Literal, ``prefix*`` and ``*suffix`` patterns are matched with string
+        comparisons, and the other patterns of a run are compiled into a single regular expression.
+
         :param ordered_patterns: List of (PatternType, pattern) tuples in order
         :return: PatternMatcher instance
         """
         self.patterns = ordered_patterns.copy()
 
+        # Determine initial state based on pattern types
+        has_exclude_patterns = any(pt == PatternType.EXCLUDE for pt, _ in self.patterns)
+        has_include_patterns = any(pt == PatternType.INCLUDE for pt, _ in self.patterns)
+
+        # If we have ONLY include patterns (no exclude patterns), start with all files excluded and only include
+        # those that match. If we have exclude patterns OR no patterns at all, start with all files included.
+        self._default_included = not (has_include_patterns and not has_exclude_patterns)
+
+        # Later patterns override earlier ones, so runs are stored last-first and the first match decides.
+        self._pattern_runs = [
+            _PatternRun.from_patterns(pattern_type, [pattern for _, pattern in run])
+            for pattern_type, run in itertools.groupby(self.patterns, key=lambda rule: rule[0])
+        ]
+        self._pattern_runs.reverse()
+
     def should_include_file(self, file_path: str) -> bool:
         """
         Determine if a file should be included based on the include/exclude patterns.
@@ -681,45 +774,18 @@ class PatternMatcher:
         :param file_path: The file path to check (relative to the sync root)
         :return: True if the file should be included, False otherwise
         """
-        # Determine initial state based on pattern types
-        has_exclude_patterns = any(pt == PatternType.EXCLUDE for pt, _ in self.patterns)
-        has_include_patterns = any(pt == PatternType.INCLUDE for pt, _ in self.patterns)
+        included = self._default_included
 
-        if has_include_patterns and not has_exclude_patterns:
-            # If we have ONLY include patterns (no exclude patterns),
-            # start with all files excluded and only include those that match
-            included = False
-        else:
-            # If we have exclude patterns OR no patterns at all,
-            # start with all files included and exclude those that match exclude patterns
-            included = True
-
-        # Apply patterns in order - later patterns override earlier ones
-        for pattern_type, pattern in self.patterns:
-            if self._matches_pattern(file_path, pattern):
-                if pattern_type == PatternType.EXCLUDE:
-                    logger.debug(f"File {file_path} excluded by pattern: {pattern}")
-                    included = False
-                elif pattern_type == PatternType.INCLUDE:
-                    logger.debug(f"File {file_path} included by pattern: {pattern}")
-                    included = True
+        # The last matching pattern decides, so check runs from last to first and stop at the first match
+        normalized_path = os.path.normcase(file_path)
+        for pattern_run in self._pattern_runs:
+            if pattern_run.matches(normalized_path):
+                included = pattern_run.pattern_type == PatternType.INCLUDE
+                break
 
         logger.debug(f"File {file_path} final decision: {'included' if included else 'excluded'}")
         return included
 
-    def _matches_pattern(self, file_path: str, pattern: str) -> bool:
-        """
-        Check if a file path matches a glob pattern.
-
-        This method uses standard fnmatch patterns compatible with AWS S3 sync.
-
-        :param file_path: The file path to check
-        :param pattern: The glob pattern to match against
-        :return: True if the path matches the pattern, False otherwise
-        """
-        # Use standard fnmatch for AWS S3 compatible patterns
-        return fnmatch.fnmatch(file_path, pattern)
-
     def has_patterns(self) -> bool:
         """
         Check if any include or exclude patterns are configured.
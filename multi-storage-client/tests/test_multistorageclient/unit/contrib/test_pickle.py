@@ -13,14 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mmap
 import os
 import pickle
 import tempfile
 import uuid
+from unittest import mock
 
 import pytest
 
 import multistorageclient as msc
+from multistorageclient.contrib.pickle import _BufferPool
+from multistorageclient.file import RemoteFileReader
 from multistorageclient.types import MSC_PROTOCOL
 from test_multistorageclient.unit.utils import config, tempdatastore
 
@@ -58,6 +62,123 @@ def test_pickle_load(pickle_file_path, sample_data):
     assert result == sample_data
 
 
+def test_pickle_load_maps_posix_files(pickle_file_path, sample_data, tmp_path):
+    with mock.patch.object(mmap, "mmap", wraps=mmap.mmap) as mapped:
+        assert msc.pickle.load(pickle_file_path) == sample_data
+        assert msc.pickle.load(msc.Path(pickle_file_path)) == sample_data
+    assert mapped.call_count == 2
+
+    empty_file_path = tmp_path / "empty.pkl"
+    empty_file_path.touch()
+    with pytest.raises(EOFError):
+        msc.pickle.load(str(empty_file_path))
+
+
+def test_pickle_load_buffers_remote_reads(tmp_path):
+    msc.shortcuts._STORAGE_CLIENT_CACHE.clear()
+
+    with tempdatastore.TemporaryAWSS3Bucket() as temp_data_store:
+        config.setup_msc_config(
+            config_dict={
+                "profiles": {
+                    "test": temp_data_store.profile_config_dict() | {"caching_enabled": True},
+                },
+                "cache": {
+                    "size": "50M",
+                    "cache_line_size": "1M",
+                    "location": str(tmp_path / "cache"),
+                    "prefetch_file": False,
+                },
+            }
+        )
+
+        # Protocol 2 has no framing, so an unbuffered load issues a read per opcode.
+        data = [{"index": i, "name": f"item-{i}"} for i in range(1000)]
+        url = f"{MSC_PROTOCOL}test/data.pkl"
+        msc.write(url, pickle.dumps(data, protocol=2))
+
+        with mock.patch.object(RemoteFileReader, "read", autospec=True, side_effect=RemoteFileReader.read) as read:
+            assert msc.pickle.load(url) == data
+            assert msc.pickle.load(msc.Path(url)) == data
+
+        assert 0 < read.call_count <= 4
+
+
+def test_pickle_load_many(tmp_path):
+    file_paths = []
+    for i in range(20):
+        file_path = str(tmp_path / f"shard-{i}.pkl")
+        msc.pickle.dump({"shard": i}, file_path)
+        file_paths.append(file_path)
+
+    assert msc.pickle.load_many(file_paths, max_workers=4) == [{"shard": i} for i in range(20)]
+    assert msc.pickle.load_many([msc.Path(file_paths[1]), file_paths[0]]) == [{"shard": 1}, {"shard": 0}]
+    assert msc.pickle.load_many([tmp_path / "shard-2.pkl", file_paths[3]]) == [{"shard": 2}, {"shard": 3}]
+    assert msc.pickle.load_many([]) == []
+
+    with pytest.raises(FileNotFoundError):
+        msc.pickle.load_many([file_paths[0], str(tmp_path / "missing.pkl")])
+
+
+def test_pickle_dump_uploads_remote_objects_once(sample_data):
+    msc.shortcuts._STORAGE_CLIENT_CACHE.clear()
+
+    with tempdatastore.TemporaryAWSS3Bucket() as temp_data_store:
+        config.setup_msc_config(config_dict={"profiles": {"test": temp_data_store.profile_config_dict()}})
+        url = f"{MSC_PROTOCOL}test/data.pkl"
+
+        with mock.patch.object(
+            msc.StorageClient, "upload_file", autospec=True, side_effect=msc.StorageClient.upload_file
+        ) as upload_file:
+            msc.pickle.dump(sample_data, url)
+
+        upload_file.assert_called_once()
+        assert msc.pickle.load(url) == sample_data
+
+
+def test_pickle_dump_streams_remote_objects_above_threshold():
+    msc.shortcuts._STORAGE_CLIENT_CACHE.clear()
+    data = {"payload": os.urandom(64 * 1024)}
+
+    with tempdatastore.TemporaryAWSS3Bucket() as temp_data_store:
+        config.setup_msc_config(config_dict={"profiles": {"test": temp_data_store.profile_config_dict()}})
+        url = f"{MSC_PROTOCOL}test/data.pkl"
+
+        with (
+            mock.patch.object(
+                msc.StorageClient, "upload_file", autospec=True, side_effect=msc.StorageClient.upload_file
+            ) as upload_file,
+            mock.patch.object(msc.StorageClient, "open", autospec=True, side_effect=msc.StorageClient.open) as open_,
+        ):
+            msc.pickle.dump(data, url, in_memory_threshold=16 * 1024)
+
+        upload_file.assert_not_called()
+        open_.assert_called_once()
+        assert msc.pickle.load(url) == data
+
+
+def test_buffer_pool():
+    pool = _BufferPool(slab_sizes=(16, 64), max_pooled_bytes=80)
+
+    small = pool.acquire(10)
+    large = pool.acquire(17)
+    assert small is not None and len(small) == 16
+    assert large is not None and len(large) == 64
+    assert pool.acquire(65) is None
+
+    pool.release(small)
+    pool.release(large)
+    assert pool.acquire(1) is small
+    assert pool.acquire(64) is large
+
+    # The second slab would exceed max_pooled_bytes, so it is dropped instead of pooled.
+    first, second = bytearray(64), bytearray(64)
+    pool.release(first)
+    pool.release(second)
+    assert pool.acquire(64) is first
+    assert pool.acquire(64) is not second
+
+
 def test_pickle_dump(sample_data):
     with tempfile.NamedTemporaryFile(delete=True) as temp:
         msc_path = temp.name
@@ -82,6 +203,49 @@ def test_pickle_dump(sample_data):
             msc.pickle.dump(sample_data, msc.open(msc_path, "wb"))
 
 
+def test_pickle_dump_out_of_band(tmp_path):
+    payload = bytearray(os.urandom(64 * 1024))
+    data = {"name": "payload", "payload": pickle.PickleBuffer(payload)}
+
+    for file_path in (str(tmp_path / "data.pkl"), msc.Path(str(tmp_path / "path.pkl"))):
+        msc.pickle.dump(data, file_path, out_of_band=True)
+
+        assert os.path.getsize(str(file_path)) < len(payload)
+        assert os.path.getsize(f"{file_path}.buf0") == len(payload)
+        assert not os.path.exists(f"{file_path}.buf1")
+
+        result = msc.pickle.load(file_path, out_of_band=True)
+        assert result == {"name": "payload", "payload": payload}
+
+    with pytest.raises(ValueError):
+        msc.pickle.dump(data, str(tmp_path / "data.pkl"), out_of_band=True, buffer_callback=lambda buffer: None)
+    with pytest.raises(ValueError):
+        msc.pickle.load(str(tmp_path / "data.pkl"), out_of_band=True, buffers=[])
+
+
+def test_pickle_out_of_band_resolves_storage_client_once(tmp_path):
+    payloads = [bytearray(os.urandom(1024)) for _ in range(3)]
+    data = [pickle.PickleBuffer(payload) for payload in payloads]
+    file_path = str(tmp_path / "data.pkl")
+
+    with mock.patch(
+        "multistorageclient.contrib.pickle.resolve_storage_client", wraps=msc.resolve_storage_client
+    ) as resolve:
+        msc.pickle.dump(data, file_path, out_of_band=True)
+        assert resolve.call_count == 1
+
+        assert msc.pickle.load(file_path, out_of_band=True) == payloads
+        assert resolve.call_count == 2
+
+
+def test_pickle_dump_defaults_to_highest_protocol(tmp_path, sample_data):
+    file_path = str(tmp_path / "data.pkl")
+    msc.pickle.dump(sample_data, file_path)
+
+    with open(file_path, "rb") as f:
+        assert f.read(2) == bytes([pickle.PROTO[0], pickle.HIGHEST_PROTOCOL])
+
+
 @pytest.mark.parametrize(
     argnames=["temp_data_store_type"],
     argvalues=[
@@ -17,6 +17,8 @@
 """Most basic MCP server tests - just verify it can be imported and initialized."""
 
 import asyncio
+import json
+import os
 
 import pytest
 
@@ -75,3 +77,52 @@ class TestMCP:
 
         prompt_names = asyncio.run(check_prompts())
         assert len(prompt_names) == 1
+
+    def test_storage_clients_are_reused_across_tool_calls(self):
+        """Test that storage clients are cached per profile and configuration."""
+        from multistorageclient.mcp.utils import get_storage_client_for_url
+        from test_multistorageclient.unit.utils import config, tempdatastore
+
+        with tempdatastore.TemporaryPOSIXDirectory() as temp_data_store:
+            config.setup_msc_config({"profiles": {"data": temp_data_store.profile_config_dict()}})
+
+            client, path = get_storage_client_for_url("msc://data/a.txt")
+            other_client, other_path = get_storage_client_for_url("msc://data/b.txt")
+            assert client is other_client
+            assert (path, other_path) == ("a.txt", "b.txt")
+
+            config.setup_msc_config({"profiles": {"data": temp_data_store.profile_config_dict()}})
+            reconfigured_client, _ = get_storage_client_for_url("msc://data/a.txt")
+            assert reconfigured_client is not client
+
+            # Editing the config file in place invalidates the cached client as well.
+            config_file_path = os.environ["MSC_CONFIG"]
+            config_file_stat = os.stat(config_file_path)
+            with open(config_file_path, "w") as f:
+                profile_config = temp_data_store.profile_config_dict()
+                json.dump({"profiles": {"data": profile_config, "other": profile_config}}, f)
+            os.utime(config_file_path, ns=(config_file_stat.st_atime_ns, config_file_stat.st_mtime_ns + 1))
+            edited_client, _ = get_storage_client_for_url("msc://data/a.txt")
+            assert edited_client is not reconfigured_client
+            assert get_storage_client_for_url("msc://data/a.txt")[0] is edited_client
+
+    def test_storage_client_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that the least recently used storage clients are evicted once the cache is full."""
+        from multistorageclient.mcp import utils
+        from test_multistorageclient.unit.utils import config, tempdatastore
+
+        monkeypatch.setattr(utils, "_MCP_CLIENT_CACHE_MAXSIZE", 2)
+        monkeypatch.setattr(utils, "_MCP_CLIENT_CACHE", utils.OrderedDict())
+
+        with tempdatastore.TemporaryPOSIXDirectory() as temp_data_store:
+            profile_config = temp_data_store.profile_config_dict()
+            config.setup_msc_config({"profiles": {"a": profile_config, "b": profile_config, "c": profile_config}})
+
+            client_a, _ = utils.get_storage_client_for_url("msc://a/x.txt")
+            client_b, _ = utils.get_storage_client_for_url("msc://b/x.txt")
+            assert utils.get_storage_client_for_url("msc://a/x.txt")[0] is client_a
+            utils.get_storage_client_for_url("msc://c/x.txt")
+
+            assert len(utils._MCP_CLIENT_CACHE) == 2
+            assert utils.get_storage_client_for_url("msc://a/x.txt")[0] is client_a
+            assert utils.get_storage_client_for_url("msc://b/x.txt")[0] is not client_b
@@ -212,6 +212,52 @@ class TestMCPServerBasicOperations:
                 found = any(expected_file in key for key in returned_keys)
                 assert found, f"Should find {expected_file} in returned keys: {returned_keys}"
 
+    @pytest.mark.asyncio
+    async def test_msc_list_with_limit(self, mcp_server_parametrized):
+        """Test that msc_list stops at the limit and marks the result as truncated."""
+
+        from fastmcp import Client  # pyright: ignore[reportMissingImports]
+        from mcp.types import TextContent  # pyright: ignore[reportMissingImports]
+
+        mcp_server, profile_name = mcp_server_parametrized
+
+        test_prefix = f"limit-test-{uuid.uuid4()}"
+        for i in range(5):
+            create_test_file(profile_name, f"{test_prefix}/file{i}.txt", b"content")
+
+        async with Client(mcp_server) as client:
+            result = await client.call_tool("msc_list", {"url": f"msc://{profile_name}/{test_prefix}/", "limit": 3})
+
+            assert isinstance(result.content[0], TextContent)
+            textContent: TextContent = result.content[0]
+            response: dict[str, Any] = json.loads(textContent.text)
+
+            assert response["success"] is True
+            assert response["count"] == 3
+            assert len(response["objects"]) == 3
+            assert response["truncated"] is True
+            assert list(response) == ["success", "url", "count", "objects", "truncated", "message"]
+
+            result = await client.call_tool("msc_list", {"url": f"msc://{profile_name}/{test_prefix}/"})
+
+            assert isinstance(result.content[0], TextContent)
+            textContent = result.content[0]
+            response = json.loads(textContent.text)
+
+            assert response["count"] == 5
+            assert "truncated" not in response
+
+            result = await client.call_tool(
+                "msc_list", {"url": f"msc://{profile_name}/{test_prefix}/", "include_url_prefix": False}
+            )
+
+            assert isinstance(result.content[0], TextContent)
+            textContent = result.content[0]
+            response = json.loads(textContent.text)
+
+            assert response["count"] == 5
+            assert all(not obj["key"].startswith("msc://") for obj in response["objects"])
+
     @pytest.mark.asyncio
     async def test_mcp_info_tool(self, mcp_server_parametrized):
         """Test that msc_info tool returns file metadata."""
@@ -65,6 +65,22 @@ def test_jsonl_format_round_trip():
     assert result_metadata[1].metadata == {"tag": "value2"}
 
 
+def test_jsonl_format_read_part_skips_blank_lines():
+    format_handler = JsonlManifestFormatHandler()
+
+    content = (
+        b'{"key": "file1.txt", "size_bytes": 100, "last_modified": "2025-01-01T00:00:00.000000Z"}\n'
+        b"\n"
+        b'{"key": "file2.txt", "size_bytes": 200, "last_modified": "2025-01-01T00:00:00.000000Z", "physical_path": "p2"}\n'
+    )
+
+    result_metadata = format_handler.read_part(content)
+    assert [m.key for m in result_metadata] == ["file1.txt", "file2.txt"]
+    assert [m.content_length for m in result_metadata] == [100, 200]
+    assert result_metadata[1].physical_path == "p2"  # type: ignore[attr-defined]
+    assert format_handler.read_part(b"") == []
+
+
 @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="PyArrow not installed")
 def test_parquet_format_round_trip():
     format_handler = ParquetManifestFormatHandler()
@@ -24,9 +24,13 @@ from unittest.mock import MagicMock
 import pytest
 
 from multistorageclient import StorageClient, StorageClientConfig
+from multistorageclient.providers.manifest_formats import JsonlManifestFormatHandler
 from multistorageclient.providers.manifest_metadata import (
     DEFAULT_MANIFEST_BASE_DIR,
+    MANIFEST_PART_PREFETCH_FACTOR,
+    Manifest,
     ManifestMetadataProvider,
+    ManifestPartReference,
 )
 from multistorageclient.providers.manifest_object_metadata import ManifestObjectMetadata
 from multistorageclient.types import ObjectMetadata, ResolvedPathState
@@ -1029,6 +1033,7 @@ def _make_manifest_provider(files: dict[str, ManifestObjectMetadata]) -> Manifes
         writable=False,
     )
     provider._files = files
+    provider._sorted_keys = sorted(files)
     return provider
 
 
@@ -1185,3 +1190,76 @@ def test_realpath_symlink_cycle_raises():
     provider = _make_manifest_provider(files)
     with pytest.raises(ValueError, match="cycle"):
         provider.realpath("a")
+
+
+def test_load_manifest_parts_concurrently_preserves_part_order():
+    now = datetime.now(tz=timezone.utc)
+    handler = JsonlManifestFormatHandler()
+    parts = {
+        f"manifest/parts/part{i}.jsonl": handler.write_part(
+            [
+                ObjectMetadata(key=f"file{i}.txt", content_length=i, last_modified=now),
+                ObjectMetadata(key="shared.txt", content_length=i, last_modified=now),
+            ]
+        )
+        for i in range(8)
+    }
+    main_manifest = Manifest(
+        version="1", parts=[ManifestPartReference(path=os.path.relpath(path, "manifest")) for path in parts]
+    )
+    objects = {"manifest/msc_manifest_index.json": main_manifest.to_json().encode("utf-8"), **parts}
+
+    storage_provider = MagicMock()
+    storage_provider.is_file.side_effect = lambda path: path in objects
+    storage_provider.get_object.side_effect = lambda path: objects[path]
+
+    provider = ManifestMetadataProvider(storage_provider, "manifest/msc_manifest_index.json", max_workers=4)
+
+    assert storage_provider.get_object.call_count == 9
+    assert len(provider._files) == 9
+    assert provider._files["shared.txt"].content_length == 7
+    assert provider._files["file3.txt"].content_length == 3
+
+
+def test_prefetch_manifest_parts_bounds_reads_in_flight():
+    provider = _make_manifest_provider({})
+    provider._max_workers = 2
+    references = [ManifestPartReference(path=f"parts/part{i}.jsonl") for i in range(20)]
+    loaded = []
+
+    def load_part(reference: ManifestPartReference) -> list[ManifestObjectMetadata]:
+        loaded.append(reference.path)
+        return [ManifestObjectMetadata(key=reference.path, content_length=0, last_modified=datetime.now(timezone.utc))]
+
+    results = provider._prefetch_manifest_parts(load_part, references)
+    assert next(results)[0].key == "parts/part0.jsonl"
+    assert len(loaded) <= MANIFEST_PART_PREFETCH_FACTOR * 2 + 1
+
+    assert [result[0].key for result in results] == [reference.path for reference in references[1:]]
+    assert sorted(loaded) == sorted(reference.path for reference in references)
+
+
+def test_list_objects_keeps_sorted_keys_in_sync_with_commits():
+    now = datetime.now(tz=timezone.utc)
+    provider = _make_manifest_provider(
+        {
+            key: ManifestObjectMetadata(key=key, content_length=1, last_modified=now)
+            for key in ["a/1.txt", "a/3.txt", "ab/1.txt", "b/1.txt"]
+        }
+    )
+    provider._writable = True
+
+    assert [obj.key for obj in provider.list_objects("a")] == ["a/1.txt", "a/3.txt"]
+    assert [obj.key for obj in provider.list_objects("", start_after="a/1.txt", end_at="ab/1.txt")] == [
+        "a/3.txt",
+        "ab/1.txt",
+    ]
+
+    provider.add_file("a/2.txt", ObjectMetadata(key="a/2.txt", content_length=1, last_modified=now))
+    provider.add_file("0.txt", ObjectMetadata(key="0.txt", content_length=1, last_modified=now))
+    provider.remove_file("a/3.txt")
+    provider.commit_updates()
+
+    assert provider._sorted_keys == ["0.txt", "a/1.txt", "a/2.txt", "ab/1.txt", "b/1.txt"]
+    assert [obj.key for obj in provider.list_objects("a")] == ["a/1.txt", "a/2.txt"]
+    assert [obj.key for obj in provider.list_objects("", include_directories=True)] == ["a", "ab", "b", "0.txt"]
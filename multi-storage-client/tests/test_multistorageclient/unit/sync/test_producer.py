@@ -82,6 +82,35 @@ class RecordingProgress:
         pass
 
 
+@pytest.mark.parametrize(
+    argnames=["path", "expected_hidden"],
+    argvalues=[
+        ["file.txt", False],
+        ["dir/file.txt", False],
+        ["dir.d/file.v2.txt", False],
+        [".hidden", True],
+        ["dir/.hidden", True],
+        [".dir/file.txt", True],
+        ["a/b/.c/d.txt", True],
+    ],
+)
+def test_is_hidden(path: str, expected_hidden: bool):
+    producer = ProducerThread(
+        source_client=cast(StorageClient, MockStorageClient()),
+        source_path="",
+        target_client=cast(StorageClient, MockStorageClient()),
+        target_path="",
+        progress=ProgressBar(desc="", show_progress=False),
+        file_queue=queue.Queue(),
+        num_workers=1,
+        shutdown_event=threading.Event(),
+    )
+    assert producer._is_hidden(path) is expected_hidden
+
+    producer.ignore_hidden = False
+    assert producer._is_hidden(path) is False
+
+
 def test_match_file_metadata_seconds_resolution():
     """_match_file_metadata compares last_modified at seconds resolution."""
     source_client = MockStorageClient()
@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import errno
 import json
 import os
 import queue
+import shutil
 import sys
 from datetime import datetime, timezone
 from unittest import mock
@@ -82,6 +84,50 @@ def test_object_metadata_replace():
     assert replaced.metadata == {"version": "2", "owner": "ml-team"}
 
 
+@pytest.mark.parametrize("content", [b"", b"test content" * 1024])
+def test_copy_posix_file(tmp_path, content: bytes):
+    source_path = tmp_path / "source.bin"
+    target_path = tmp_path / "target.bin"
+    source_path.write_bytes(content)
+    os.utime(source_path, (1_700_000_000, 1_700_000_000))
+
+    sync_worker_module.copy_posix_file(str(source_path), str(target_path))
+
+    assert target_path.read_bytes() == content
+    assert os.stat(target_path).st_mtime == 1_700_000_000
+
+
+def test_copy_posix_file_falls_back_when_copy_file_range_is_unsupported(tmp_path):
+    source_path = tmp_path / "source.bin"
+    target_path = tmp_path / "target.bin"
+    source_path.write_bytes(b"test content")
+
+    with (
+        mock.patch.object(
+            sync_worker_module.os, "copy_file_range", create=True, side_effect=OSError(errno.EXDEV, "cross-device")
+        ),
+        mock.patch.object(sync_worker_module.shutil, "copyfile", wraps=sync_worker_module.shutil.copyfile) as copyfile,
+    ):
+        sync_worker_module.copy_posix_file(str(source_path), str(target_path))
+
+    assert target_path.read_bytes() == b"test content"
+    copyfile.assert_called_once_with(str(source_path), str(target_path))
+
+
+@pytest.mark.parametrize("hardlink", [False, True])
+def test_copy_posix_file_rejects_same_file(tmp_path, hardlink: bool):
+    source_path = tmp_path / "source.bin"
+    target_path = tmp_path / "hardlink.bin" if hardlink else source_path
+    source_path.write_bytes(b"test content")
+    if hardlink:
+        os.link(source_path, target_path)
+
+    with pytest.raises(shutil.SameFileError):
+        sync_worker_module.copy_posix_file(str(source_path), str(target_path))
+
+    assert source_path.read_bytes() == b"test content"
+
+
 def test_sync_with_worker_error_fail_fast():
     """Test sync operation with worker error - sync should fail fast."""
     msc.shortcuts._STORAGE_CLIENT_CACHE.clear()
@@ -112,20 +158,20 @@ def test_sync_with_worker_error_fail_fast():
         source_client, source_path = msc.resolve_storage_client(source_url)
         target_client, target_path = msc.resolve_storage_client(target_url)
 
-        # Mock shutil.copy2 to raise error on first file (POSIX to POSIX uses shutil.copy2)
+        # Mock copy_posix_file to raise error on first file (POSIX to POSIX uses copy_posix_file)
         sync_module = sys.modules["multistorageclient.sync"]
-        original_copy2 = sync_module.worker.shutil.copy2
+        original_copy_posix_file = sync_module.worker.copy_posix_file
         call_count = [0]
 
-        def mock_copy2(src: str, dst: str, **kwargs):
+        def mock_copy_posix_file(src: str, dst: str):
             call_count[0] += 1
             if call_count[0] == 1:
                 raise PermissionError("Simulated permission error")
-            return original_copy2(src, dst, **kwargs)
+            return original_copy_posix_file(src, dst)
 
         # Sync should raise SyncError containing worker errors
         with (
-            mock.patch.object(sync_module.worker.shutil, "copy2", side_effect=mock_copy2),
+            mock.patch.object(sync_module.worker, "copy_posix_file", side_effect=mock_copy_posix_file),
             pytest.raises(SyncError, match="Errors in sync operation"),
         ):
             target_client.sync_from(source_client, source_path, target_path)
@@ -181,6 +227,56 @@ def test_batch_posix_to_posix():
         assert target_client.read(target_name) == content
 
 
+def test_batch_posix_to_posix_creates_each_target_directory_once():
+    msc.shortcuts._STORAGE_CLIENT_CACHE.clear()
+
+    with (
+        tempdatastore.TemporaryPOSIXDirectory() as temp_source,
+        tempdatastore.TemporaryPOSIXDirectory() as temp_target,
+    ):
+        source_client, target_client = _setup_test_clients("source-test", "target-test", temp_source, temp_target)
+
+        files = {f"{directory}/file{i}.txt": f"{directory}-{i}".encode() for directory in ("a", "b") for i in range(5)}
+        for name, content in files.items():
+            source_client.write(name, content)
+
+        batch = OperationBatch(
+            operation=OperationType.ADD,
+            items=[
+                (
+                    ObjectMetadata(
+                        key=name,
+                        content_length=len(content),
+                        last_modified=datetime.now(tz=timezone.utc),
+                    ),
+                    None,
+                )
+                for name, content in files.items()
+            ],
+        )
+        error_queue = queue.Queue()
+
+        handler = sync_worker_module.create_sync_handler(
+            source_client=source_client,
+            source_path="",
+            target_client=target_client,
+            target_path="subdir",
+            preserve_source_attributes=False,
+            result_queue=queue.Queue(),
+            error_queue=error_queue,
+        )
+
+        with mock.patch.object(
+            sync_worker_module, "safe_makedirs", wraps=sync_worker_module.safe_makedirs
+        ) as safe_makedirs:
+            handler.process_add_batch(worker_id="test-worker", batch=batch)
+
+        assert error_queue.empty(), f"Unexpected error: {error_queue.get()}"
+        assert safe_makedirs.call_count == 2
+        for name, content in files.items():
+            assert target_client.read(f"subdir/{name}") == content
+
+
 @pytest.mark.parametrize(
     argnames=["temp_data_store_type"],
     argvalues=[[tempdatastore.TemporaryAWSS3Bucket]],
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import errno
 import os
 import shutil
 import tempfile
@@ -37,15 +38,30 @@ from test_multistorageclient.unit.utils import tempdatastore
 from test_multistorageclient.unit.utils.tempdatastore import create_test_data
 
 
+def _skip_without_xattr(tmpdir) -> None:
+    probe_path = os.path.join(tmpdir, "xattr-probe")
+    with open(probe_path, "wb") as probe_file:
+        probe_file.write(b"probe")
+    try:
+        xattr.setxattr(probe_path, "user.etag", b"probe")
+        xattr.getxattr(probe_path, "user.etag")
+    except OSError:
+        pytest.skip("xattr is not supported on this filesystem")
+    finally:
+        os.unlink(probe_path)
+
+
 class RangeAwareStorageProvider:
     def __init__(self, data: bytes) -> None:
         self._data = data
         self.call_count = 0
+        self.byte_ranges: list[Range | None] = []
         self._lock = threading.Lock()
 
     def get_object(self, _key: str, byte_range: Range | None = None) -> bytes:
         with self._lock:
             self.call_count += 1
+            self.byte_ranges.append(byte_range)
 
         if byte_range is None:
             return self._data
@@ -321,6 +337,9 @@ def test_cache_manager_open_file(profile_name, tmpdir, cache_manager):
 
 
 def test_partial_chunk_publish_is_atomic_without_source_version(tmpdir, monkeypatch):
+    # Exercise the named temporary file path, which publishes through os.replace
+    monkeypatch.setattr(cache_module, "_O_TMPFILE", 0)
+
     cache_manager = CacheManager(
         profile="test",
         cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir)),
@@ -379,16 +398,10 @@ def test_partial_chunk_publish_is_atomic_without_source_version(tmpdir, monkeypa
 
 
 def test_partial_chunk_metadata_is_set_before_publish(tmpdir, monkeypatch):
-    probe_path = os.path.join(tmpdir, "xattr-probe")
-    with open(probe_path, "wb") as probe_file:
-        probe_file.write(b"probe")
-    try:
-        xattr.setxattr(probe_path, "user.etag", b"probe")
-        xattr.getxattr(probe_path, "user.etag")
-    except OSError:
-        pytest.skip("xattr is not supported on this filesystem")
-    finally:
-        os.unlink(probe_path)
+    _skip_without_xattr(tmpdir)
+
+    # Exercise the named temporary file path, which publishes through os.replace
+    monkeypatch.setattr(cache_module, "_O_TMPFILE", 0)
 
     cache_manager = CacheManager(
         profile="test",
@@ -430,6 +443,256 @@ def test_partial_chunk_metadata_is_set_before_publish(tmpdir, monkeypatch):
     assert xattr.getxattr(chunk_path, "user.etag").decode("utf-8") == source_version
 
 
+def _read_two_chunks(cache_manager: CacheManager, key: str) -> None:
+    storage_provider = RangeAwareStorageProvider(create_test_data(2))
+    for chunk_idx in range(2):
+        byte_range = Range(offset=chunk_idx * 1024 * 1024, size=16 * 1024)
+        result = cache_manager.read(key, byte_range=byte_range, storage_provider=storage_provider)  # type: ignore[arg-type]
+        assert result == storage_provider._data[byte_range.offset : byte_range.offset + byte_range.size]
+
+    # Only the published chunks remain next to each other, without any temporary files.
+    cache_path = cache_manager._get_cache_file_path(key)
+    chunk_names = {os.path.basename(cache_manager._get_chunk_path(cache_path, chunk_idx)) for chunk_idx in range(2)}
+    assert set(os.listdir(os.path.dirname(cache_path))) == chunk_names
+
+
+@pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="O_TMPFILE is Linux-only")
+def test_partial_chunk_write_links_anonymous_files(tmpdir, monkeypatch):
+    fd = None
+    try:
+        fd = os.open(str(tmpdir), os.O_TMPFILE | os.O_WRONLY, 0o600)
+        os.link(f"/proc/self/fd/{fd}", os.path.join(tmpdir, "link-probe"))
+    except OSError:
+        pytest.skip("unnamed files cannot be created or linked on this filesystem")
+    finally:
+        if fd is not None:
+            os.close(fd)
+    os.unlink(os.path.join(tmpdir, "link-probe"))
+
+    link_calls = 0
+    original_link = cache_module.os.link
+
+    def counting_link(src: str, dst: str) -> None:
+        nonlocal link_calls
+        link_calls += 1
+        original_link(src, dst)
+
+    monkeypatch.setattr(cache_module.os, "link", counting_link)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir)),
+    )
+    _read_two_chunks(cache_manager, "bucket/anonymous.bin")
+
+    assert link_calls == 2
+    assert cache_manager._anonymous_chunk_files
+
+
+def test_partial_chunk_write_falls_back_to_named_files(tmpdir, monkeypatch):
+    link_calls = 0
+
+    def counting_link(src: str, dst: str) -> None:
+        nonlocal link_calls
+        link_calls += 1
+
+    monkeypatch.setattr(cache_module.os, "link", counting_link)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir)),
+    )
+    cache_manager._anonymous_chunk_files = False
+    _read_two_chunks(cache_manager, "bucket/named.bin")
+
+    assert link_calls == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "O_TMPFILE"), reason="O_TMPFILE is Linux-only")
+@pytest.mark.parametrize(
+    "failing_call,error_number,still_enabled",
+    [
+        ("open", errno.EOPNOTSUPP, False),
+        ("open", errno.EINVAL, False),
+        ("open", errno.ENOSPC, True),
+        ("open", errno.EMFILE, True),
+        ("open", errno.ENOENT, True),
+        ("link", errno.EXDEV, False),
+        ("link", errno.EPERM, False),
+        ("link", errno.ENOSPC, True),
+        ("link", errno.ENOENT, True),
+    ],
+)
+def test_anonymous_chunk_files_are_disabled_only_when_unsupported(
+    tmpdir, monkeypatch, failing_call, error_number, still_enabled
+):
+    original_open = cache_module.os.open
+
+    def failing_open(path, flags, *args, **kwargs):
+        if failing_call == "open" and flags & cache_module._O_TMPFILE == cache_module._O_TMPFILE:
+            raise OSError(error_number, os.strerror(error_number))
+        return original_open(path, flags, *args, **kwargs)
+
+    def failing_link(src: str, dst: str) -> None:
+        raise OSError(error_number, os.strerror(error_number))
+
+    monkeypatch.setattr(cache_module.os, "open", failing_open)
+    if failing_call == "link":
+        try:
+            os.close(original_open(str(tmpdir), os.O_TMPFILE | os.O_WRONLY, 0o600))
+        except OSError:
+            pytest.skip("unnamed files cannot be created on this filesystem")
+        monkeypatch.setattr(cache_module.os, "link", failing_link)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir)),
+    )
+    # The chunks are published through named temporary files either way.
+    _read_two_chunks(cache_manager, "bucket/fallback.bin")
+
+    assert cache_manager._anonymous_chunk_files is still_enabled
+
+
+def test_chunk_files_are_preallocated(tmpdir, monkeypatch):
+    fallocate_lengths = []
+
+    def failing_fallocate(fd: int, offset: int, length: int) -> None:
+        fallocate_lengths.append(length)
+        raise OSError(95, "Operation not supported")
+
+    # Preallocation is advisory, so chunks are still written when the filesystem rejects it.
+    monkeypatch.setattr(cache_module.os, "posix_fallocate", failing_fallocate, raising=False)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir)),
+    )
+    test_content = create_test_data(2)[: 1024 * 1024 + 1024]
+    storage_provider = RangeAwareStorageProvider(test_content)
+    key = "bucket/preallocated.bin"
+
+    result = cache_manager.read(
+        key,
+        byte_range=Range(offset=0, size=len(test_content)),
+        storage_provider=storage_provider,  # type: ignore[arg-type]
+        source_size=len(test_content),
+    )
+
+    assert result == test_content
+    # A chunk may be preallocated twice if publishing an unnamed file falls back to a named one.
+    assert set(fallocate_lengths) == {1024 * 1024, 1024}
+    cache_path = cache_manager._get_cache_file_path(key)
+    assert os.path.getsize(cache_manager._get_chunk_path(cache_path, 1)) == 1024
+
+
+def test_chunk_metadata_is_read_once_per_chunk_file(tmpdir, monkeypatch):
+    _skip_without_xattr(tmpdir)
+
+    getxattr_calls: list[str] = []
+    original_getxattr = cache_module.xattr.getxattr
+
+    def counting_getxattr(path, attr, *args, **kwargs):
+        getxattr_calls.append(attr)
+        return original_getxattr(path, attr, *args, **kwargs)
+
+    monkeypatch.setattr(cache_module.xattr, "getxattr", counting_getxattr)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=True, location=str(tmpdir)),
+    )
+    storage_provider = RangeAwareStorageProvider(create_test_data(2))
+    key = "bucket/metadata.bin"
+    byte_range = Range(offset=0, size=16 * 1024)
+
+    def read_range(source_version: str) -> None:
+        result = cache_manager.read(
+            key,
+            source_version=source_version,
+            byte_range=byte_range,
+            storage_provider=storage_provider,  # type: ignore[arg-type]
+            source_size=len(storage_provider._data),
+        )
+        assert result == storage_provider._data[: byte_range.size]
+
+    # The first read downloads the chunk, the second validates it, the third reuses the parsed metadata.
+    for _ in range(3):
+        read_range("etag-1")
+    assert getxattr_calls.count("user.etag") == 1
+    assert getxattr_calls.count("user.cache_line_size") == 1
+    assert storage_provider.call_count == 1
+
+    # A new source version still invalidates the chunk, and the replacement chunk is validated afresh.
+    read_range("etag-2")
+    read_range("etag-2")
+    assert storage_provider.call_count == 2
+    assert getxattr_calls.count("user.etag") == 2
+
+
+def test_full_file_etag_is_read_once_per_cached_file(tmpdir, monkeypatch):
+    _skip_without_xattr(tmpdir)
+
+    getxattr_calls = 0
+    original_getxattr = cache_module.xattr.getxattr
+
+    def counting_getxattr(*args, **kwargs):
+        nonlocal getxattr_calls
+        getxattr_calls += 1
+        return original_getxattr(*args, **kwargs)
+
+    monkeypatch.setattr(cache_module.xattr, "getxattr", counting_getxattr)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=True, location=str(tmpdir)),
+    )
+    key = "bucket/full.bin"
+    cache_manager.set(key, b"version 1", source_version="etag-1")
+
+    # Reads refresh the LRU access time, which must not invalidate the memoized etag.
+    for _ in range(3):
+        assert cache_manager.contains(key, source_version="etag-1")
+        assert cache_manager.read(key, source_version="etag-1", byte_range=Range(offset=0, size=7)) == b"version"
+    assert getxattr_calls == 1
+
+    # Rewriting the entry with the same content and size publishes a new file, so the new etag is read.
+    cache_manager.set(key, b"version 1", source_version="etag-2")
+    assert not cache_manager.contains(key, source_version="etag-1")
+    assert cache_manager.contains(key, source_version="etag-2")
+    assert cache_manager.read(key, source_version="etag-2", byte_range=Range(offset=0, size=7)) == b"version"
+    assert getxattr_calls == 2
+
+
+def test_full_file_etag_is_set_before_publish(tmpdir, monkeypatch):
+    _skip_without_xattr(tmpdir)
+
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=True, location=str(tmpdir)),
+    )
+    key = "bucket/full.bin"
+    file_path = cache_manager._get_cache_file_path(key)
+    observed_etags: list[str] = []
+    original_rename = cache_module.os.rename
+
+    def checking_rename(src: str, dst: str) -> None:
+        if dst == file_path:
+            observed_etags.append(xattr.getxattr(src, "user.etag").decode("utf-8"))
+        original_rename(src, dst)
+
+    monkeypatch.setattr(cache_module.os, "rename", checking_rename)
+
+    cache_manager.set(key, b"version 1", source_version="etag-1")
+    source_path = os.path.join(tmpdir, "downloaded.bin")
+    with open(source_path, "wb") as source_file:
+        source_file.write(b"version 1")
+    cache_manager.set(key, source_path, source_version="etag-2")
+
+    assert observed_etags == ["etag-1", "etag-2"]
+    assert xattr.getxattr(file_path, "user.etag").decode("utf-8") == "etag-2"
+
+
 def test_assemble_result_handles_short_final_chunk(tmpdir):
     cache_manager = CacheManager(
         profile="test",
@@ -518,6 +781,159 @@ def test_short_final_chunk_without_xattr_falls_back_to_remote_read(tmpdir, monke
     assert storage_provider.call_count == 2, "Read should fall back to a direct remote range fetch"
 
 
+def test_coalesce_missing_chunks(tmpdir):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(
+            size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir), coalesce_window="3M"
+        ),
+    )
+
+    chunk_runs = cache_manager._coalesce_missing_chunks([0, 1, 2, 3, 4, 6, 8, 9], 1024 * 1024)
+
+    assert chunk_runs == [[0, 1, 2], [3, 4], [6], [8, 9]]
+
+
+def test_read_chunk_metadata_memo_is_keyed_on_ctime(monkeypatch):
+    xattrs = iter([b"etag-1", b"1048576", b"etag-2", b"1048576"])
+    monkeypatch.setattr(cache_module.xattr, "getxattr", lambda path, name: next(xattrs))
+    chunk_path = f"/cache/{uuid.uuid4()}#chunk0"
+
+    assert cache_module._read_chunk_metadata(chunk_path, 1, 2, 3) == ("etag-1", 1048576)
+    assert cache_module._read_chunk_metadata(chunk_path, 1, 2, 3) == ("etag-1", 1048576)
+    # Rewriting the xattrs changes only ctime, which must bypass the memoized result.
+    assert cache_module._read_chunk_metadata(chunk_path, 1, 2, 4) == ("etag-2", 1048576)
+
+
+def test_read_cached_etag_memo_is_keyed_on_file_identity(monkeypatch):
+    xattrs = iter([b"etag-1", b"etag-2", b"etag-3"])
+    monkeypatch.setattr(cache_module.xattr, "getxattr", lambda path, name: next(xattrs))
+    file_path = f"/cache/{uuid.uuid4()}"
+
+    assert cache_module._read_cached_etag(file_path, 1, 2, 3) == "etag-1"
+    assert cache_module._read_cached_etag(file_path, 1, 2, 3) == "etag-1"
+    # A replaced file has a new inode, and a rewritten one a new modification time.
+    assert cache_module._read_cached_etag(file_path, 4, 2, 3) == "etag-2"
+    assert cache_module._read_cached_etag(file_path, 4, 5, 3) == "etag-3"
+
+
+def test_coalesce_window_defaults_to_cache_lines(tmpdir):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="100M", cache_line_size="8M", check_source_version=False, location=str(tmpdir)),
+    )
+
+    chunk_runs = cache_manager._coalesce_missing_chunks(list(range(6)), 8 * 1024 * 1024)
+
+    assert chunk_runs == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_missing_chunk_runs_are_fetched_with_one_request_each(tmpdir):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(
+            size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir), coalesce_window="4M"
+        ),
+    )
+    test_content = create_test_data(6)
+    storage_provider = RangeAwareStorageProvider(test_content)
+    key = "bucket/coalesced.bin"
+    cache_path = cache_manager._get_cache_file_path(key)
+
+    # Cache chunk 1 on its own so the next read has missing chunks on both sides of it.
+    cache_manager.read(
+        key,
+        byte_range=Range(offset=1024 * 1024, size=1024),
+        storage_provider=storage_provider,  # type: ignore[arg-type]
+    )
+    assert storage_provider.call_count == 1
+
+    # Chunk 0 is fetched alone, chunks 2-5 together, and chunk 5 is the short final chunk.
+    byte_range = Range(offset=0, size=len(test_content))
+    result = cache_manager.read(
+        key,
+        byte_range=byte_range,
+        storage_provider=storage_provider,  # type: ignore[arg-type]
+        source_size=len(test_content),
+    )
+
+    assert result == test_content
+    assert storage_provider.call_count == 3
+    for chunk_idx in range(5):
+        assert os.path.getsize(cache_manager._get_chunk_path(cache_path, chunk_idx)) == 1024 * 1024
+    assert os.path.getsize(cache_manager._get_chunk_path(cache_path, 5)) == len(test_content) - 5 * 1024 * 1024
+
+
+def test_missing_chunk_runs_are_fetched_concurrently(tmpdir):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(
+            size="10M",
+            cache_line_size="1M",
+            check_source_version=False,
+            location=str(tmpdir),
+            coalesce_window="1M",
+            download_parallelism=4,
+        ),
+    )
+    test_content = create_test_data(4)
+    inflight_requests = 0
+    max_inflight_requests = 0
+    inflight_lock = threading.Lock()
+
+    class SlowStorageProvider(RangeAwareStorageProvider):
+        def get_object(self, _key: str, byte_range: Range | None = None) -> bytes:
+            nonlocal inflight_requests, max_inflight_requests
+            with inflight_lock:
+                inflight_requests += 1
+                max_inflight_requests = max(max_inflight_requests, inflight_requests)
+            try:
+                time.sleep(0.2)
+                return super().get_object(_key, byte_range)
+            finally:
+                with inflight_lock:
+                    inflight_requests -= 1
+
+    storage_provider = SlowStorageProvider(test_content)
+    result = cache_manager.read(
+        "bucket/parallel.bin",
+        byte_range=Range(offset=0, size=len(test_content)),
+        storage_provider=storage_provider,  # type: ignore[arg-type]
+        source_size=len(test_content),
+    )
+
+    assert result == test_content
+    assert storage_provider.call_count == 4
+    assert max_inflight_requests > 1
+
+
+def test_chunk_requests_end_at_object_size(tmpdir):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(
+            size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir), coalesce_window="2M"
+        ),
+    )
+    test_content = create_test_data(4)
+    storage_provider = RangeAwareStorageProvider(test_content)
+
+    # The final chunk alone, then the last two chunks as one coalesced run.
+    for key, offset in (("bucket/single.bin", 3 * 1024 * 1024), ("bucket/run.bin", 2 * 1024 * 1024)):
+        byte_range = Range(offset=offset, size=len(test_content) - offset)
+        result = cache_manager.read(
+            key,
+            byte_range=byte_range,
+            storage_provider=storage_provider,  # type: ignore[arg-type]
+            source_size=len(test_content),
+        )
+        assert result == test_content[offset:]
+
+    assert storage_provider.byte_ranges == [
+        Range(offset=3 * 1024 * 1024, size=len(test_content) - 3 * 1024 * 1024),
+        Range(offset=2 * 1024 * 1024, size=len(test_content) - 2 * 1024 * 1024),
+    ]
+
+
 def test_cache_manager_generate_temp_file_path(cache_manager):
     """Test that CacheManager can generate a temporary file path."""
     temp_file_path = cache_manager.generate_temp_file_path()
@@ -526,6 +942,69 @@ def test_cache_manager_generate_temp_file_path(cache_manager):
     assert cache_manager._cache_temp_dir == os.path.join(cache_manager._cache_dir, f".tmp-{cache_manager._profile}")
 
 
+@pytest.mark.parametrize("directory_exists", [False, True])
+def test_chunk_directories_are_created_once(tmpdir, monkeypatch, directory_exists):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(size="10M", cache_line_size="1M", check_source_version=False, location=str(tmpdir)),
+    )
+    cache_path = cache_manager._get_cache_file_path("bucket/a/b/c/nested.bin")
+    chunk_dir = os.path.dirname(cache_path)
+    if directory_exists:
+        os.makedirs(chunk_dir)
+    assert os.path.isdir(chunk_dir) is directory_exists
+
+    makedirs_calls: list[str] = []
+    original_safe_makedirs = cache_module.safe_makedirs
+
+    def recording_safe_makedirs(path: str, *args, **kwargs) -> None:
+        makedirs_calls.append(path)
+        original_safe_makedirs(path, *args, **kwargs)
+
+    monkeypatch.setattr(cache_module, "safe_makedirs", recording_safe_makedirs)
+
+    # Write the chunks directly, since the chunk lock taken by read() may create the directory itself.
+    for chunk_idx in range(3):
+        chunk_path = cache_manager._get_chunk_path(cache_path, chunk_idx)
+        cache_manager._write_chunk_to_cache(chunk_path, b"chunk", None, chunk_idx, 1024 * 1024, None)
+        assert os.path.isdir(chunk_dir)
+        assert os.path.isfile(chunk_path)
+
+    assert makedirs_calls == ([] if directory_exists else [chunk_dir])
+
+
+def test_cache_scan_skips_lock_and_temporary_files(tmpdir):
+    cache_manager = CacheManager(
+        profile="test",
+        cache_config=CacheConfig(
+            size="1M",
+            cache_line_size="1M",
+            check_source_version=False,
+            location=str(tmpdir),
+            eviction_policy=EvictionPolicyConfig(policy="fifo", refresh_interval=300),
+        ),
+    )
+    nested_dir = os.path.join(tmpdir, "test", "bucket", "a", "b")
+    os.makedirs(nested_dir)
+    file_sizes = {
+        "data.bin": 700 * 1024,
+        ".data.bin#chunk0": 600 * 1024,
+        ".other.bin.lock": 10,
+        ".chunk_tmp_abc": 20,
+    }
+    for name, size in file_sizes.items():
+        with open(os.path.join(nested_dir, name), "wb") as f:
+            f.write(b"x" * size)
+
+    assert cache_manager.cache_size() == 700 * 1024 + 600 * 1024 + 20
+
+    # Over budget: one of the two cached entries is evicted, lock and temporary files are not candidates.
+    cache_manager.evict_files()
+    remaining = set(os.listdir(nested_dir))
+    assert {".other.bin.lock", ".chunk_tmp_abc"} <= remaining
+    assert len(remaining & {"data.bin", ".data.bin#chunk0"}) == 1
+
+
 def test_cache_manager_refresh_cache(tmpdir):
     """Test that cache refresh works correctly."""
     # Use a separate cache directory for this test
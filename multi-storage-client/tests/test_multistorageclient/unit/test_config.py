@@ -1177,6 +1177,55 @@ def test_cache_config_line_size_within_cache_size_no_error():
     assert config.cache_config is not None
     assert config.cache_config.size == "64M"
     assert config.cache_config.cache_line_size == "32M"
+    assert config.cache_config.coalesce_window is None
+    assert config.cache_config.coalesce_window_bytes() == 4 * 32 * 1024 * 1024
+    assert config.cache_config.download_parallelism == 8
+
+
+def test_cache_config_coalesce_window():
+    config_dict = {
+        "profiles": {
+            "test": {
+                "storage_provider": {"type": "file", "options": {"base_path": "/tmp/test_storage"}},
+                "caching_enabled": True,
+            }
+        },
+        "cache": {
+            "size": "64M",
+            "cache_line_size": "1M",
+            "coalesce_window": "8M",
+            "location": "/tmp/msc_cache",
+        },
+    }
+
+    config = StorageClientConfig.from_dict(config_dict, "test")
+    assert config.cache_config is not None
+    assert config.cache_config.coalesce_window == "8M"
+    assert config.cache_config.coalesce_window_bytes() == 8 * 1024 * 1024
+
+
+def test_cache_config_download_parallelism():
+    config_dict = {
+        "profiles": {
+            "test": {
+                "storage_provider": {"type": "file", "options": {"base_path": "/tmp/test_storage"}},
+                "caching_enabled": True,
+            }
+        },
+        "cache": {
+            "size": "64M",
+            "download_parallelism": 2,
+            "location": "/tmp/msc_cache",
+        },
+    }
+
+    config = StorageClientConfig.from_dict(config_dict, "test")
+    assert config.cache_config is not None
+    assert config.cache_config.download_parallelism == 2
+
+    config_dict["cache"]["download_parallelism"] = 0
+    with pytest.raises(RuntimeError):
+        StorageClientConfig.from_dict(config_dict, "test")
 
 
 def test_profile_name_with_underscore() -> None:
@@ -13,13 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
-import tempfile
 import time
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, NamedTuple
 
+import pytest
 import xattr
 
 from multistorageclient import StorageClient, StorageClientConfig
@@ -30,20 +34,48 @@ from test_multistorageclient.unit.utils.tempdatastore import create_test_data
 # Type alias for configuration dictionary
 ConfigDict = dict[str, Any]
 
+# 4MB payload used to overwrite an object with different content, built once per module
+UPDATED_TEST_DATA = b"UPDATED_CONTENT_" * (4 * 1024 * 1024 // 16)
+
+# 3MB of uniform filler for the prefetch tests, built once per module
+FILLER_DATA_3MB = b"X" * (3 * 1024 * 1024)
+
+
+@functools.cache
+def shared_test_data(size_mb: int) -> bytes:
+    """Return :func:`create_test_data` output, generated once per size for the whole module."""
+    return create_test_data(size_mb)
+
+
+@pytest.fixture(scope="module")
+def origin_store() -> Iterator[tempdatastore.TemporaryDataStore]:
+    """Origin bucket shared by every test in this module. Tests isolate themselves with distinct object keys."""
+    with tempdatastore.TemporaryAWSS3Bucket() as store:
+        yield store
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> str:
+    """Fresh cache location for each test."""
+    return str(tmp_path)
+
 
 def create_partial_caching_config(
     origin_store: tempdatastore.TemporaryDataStore,
+    cache_location: str,
     origin_profile: str = "origin",
-    cache_location: str | None = None,
 ) -> ConfigDict:
-    """Create a configuration with origin store and partial file caching enabled."""
+    """Create a configuration with origin store and partial file caching enabled.
+
+    The cache location is owned by the caller so it is removed together with the test's temporary directory.
+    """
     return {
         "profiles": {
             origin_profile: origin_store.profile_config_dict() | {"caching_enabled": True},
         },
         "cache": {
             "size": "50M",
-            "location": cache_location or tempfile.mkdtemp(),
+            "location": cache_location,
             "cache_line_size": "1M",  # 1MB cache lines for testing
             "check_source_version": True,
             "eviction_policy": {
@@ -54,235 +86,221 @@ def create_partial_caching_config(
     }
 
 
-def test_partial_file_caching_range_read() -> None:
-    """Test partial file caching with range reads."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+class CachePaths(NamedTuple):
+    """Cache locations of a single object, resolved once per test."""
 
-        # Create 3 test files, each 4MB
-        test_files = []
-        for i in range(3):
-            file_path = f"test-data-{uuid.uuid4()}/file_{i}.bin"
-            test_content = create_test_data(4)  # 4MB file
-            test_files.append((file_path, test_content))
+    file_dir: str
+    base_name: str
 
-        # Write test files to origin store
-        for file_path, content in test_files:
-            client.write(file_path, content)
-            # Note: We don't do a full read here to avoid caching the full file,
-            # which would prevent chunk-based range reads from being tested
+    @property
+    def full_path(self) -> str:
+        return os.path.join(self.file_dir, self.base_name)
 
-        # Test partial file caching with range read
-        test_file_path, test_content = test_files[0]  # Use first file for testing
+    def chunk_name(self, chunk_idx: int) -> str:
+        return f".{self.base_name}#chunk{chunk_idx}"
 
-        # Read 16KB starting at offset 512KB (should be in chunk 0)
-        range_read = Range(offset=512 * 1024, size=16 * 1024)  # 16KB at 512KB offset
-        partial_content = client.read(test_file_path, byte_range=range_read)
+    def chunk_path(self, chunk_idx: int) -> str:
+        return os.path.join(self.file_dir, self.chunk_name(chunk_idx))
 
-        # Verify the range read returned correct data
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, (
-            f"Range read content mismatch: expected {len(expected_content)} bytes, got {len(partial_content)} bytes"
-        )
 
-        # Verify that only the first chunk (1MB) was downloaded to cache
-        # The chunk should be stored as .file_0.bin#chunk0
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        # The cache path mirrors the file structure
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(test_file_path))
-        base_name = os.path.basename(test_file_path)
-        chunk_path = os.path.join(file_dir, f".{base_name}#chunk0")
-
-        # Check that the chunk file exists and is 1MB
-        assert os.path.exists(chunk_path), f"Chunk file {chunk_path} should exist"
-        chunk_size = os.path.getsize(chunk_path)
-        assert chunk_size == 1024 * 1024, f"Chunk size should be 1MB, got {chunk_size} bytes"
+def cache_paths(cache_location: str, file_path: str, profile: str = "origin") -> CachePaths:
+    """Resolve where the cache stores an object, mirroring the object key under the profile directory."""
+    file_dir, base_name = os.path.split(os.path.join(cache_location, profile, file_path))
+    return CachePaths(file_dir=file_dir, base_name=base_name)
 
-        # Verify that no other chunks were downloaded (chunk1, chunk2, chunk3 should not exist)
-        for chunk_idx in [1, 2, 3]:
-            other_chunk_path = os.path.join(file_dir, f".{base_name}#chunk{chunk_idx}")
-            assert not os.path.exists(other_chunk_path), f"Chunk {chunk_idx} should not exist yet"
-
-        # Test another range read that spans two chunks
-        # Read 1.5MB starting at offset 512KB (spans chunk 0 and chunk 1)
-        range_read_spanning = Range(offset=512 * 1024, size=1536 * 1024)  # 1.5MB at 512KB offset
-        spanning_content = client.read(test_file_path, byte_range=range_read_spanning)
-
-        # Verify the spanning range read returned correct data
-        expected_spanning_content = test_content[
-            range_read_spanning.offset : range_read_spanning.offset + range_read_spanning.size
-        ]
-        assert spanning_content == expected_spanning_content, (
-            f"Spanning range read content mismatch: expected {len(expected_spanning_content)} bytes, got {len(spanning_content)} bytes"
-        )
 
-        # Verify that both chunk 0 and chunk 1 now exist
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
-        assert os.path.exists(chunk1_path), "Chunk 1 should exist after spanning read"
-        chunk1_size = os.path.getsize(chunk1_path)
-        assert chunk1_size == 1024 * 1024, f"Chunk 1 size should be 1MB, got {chunk1_size} bytes"
+def cached_file_size(path: str) -> int | None:
+    """Return the size of a cached file, or ``None`` if it does not exist, with a single stat call."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
 
-        # Verify chunk 2 and 3 still don't exist
-        for chunk_idx in [2, 3]:
-            other_chunk_path = os.path.join(file_dir, f".{base_name}#chunk{chunk_idx}")
-            assert not os.path.exists(other_chunk_path), f"Chunk {chunk_idx} should not exist yet"
 
+def read_cached_etag(path: str) -> str:
+    """Read the source ETag recorded on a cached file. Raises :py:class:`OSError` if the file does not exist."""
+    return xattr.getxattr(path, "user.etag").decode("utf-8")
 
-def test_partial_file_caching_without_source_version() -> None:
-    """Test partial file caching when source_version is disabled (None)."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled but source version disabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        config["cache"]["check_source_version"] = False  # Disable source version checking
-
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/file.bin"
-        test_content = create_test_data(4)  # 4MB file
-        client.write(file_path, test_content)
-
-        # Read a range that should trigger chunking
-        range_read = Range(offset=512 * 1024, size=16 * 1024)  # 16KB at 512KB offset
-        partial_content = client.read(
-            file_path, byte_range=range_read, check_source_version=SourceVersionCheckMode.DISABLE
-        )
 
-        # Verify the range read returned correct data
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, (
-            f"Range read content mismatch: expected {len(expected_content)} bytes, got {len(partial_content)} bytes"
-        )
+def snapshot_cache_dir(file_dir: str) -> dict[str, int]:
+    """Map each entry in a cache directory to its size with a single directory scan."""
+    try:
+        with os.scandir(file_dir) as entries:
+            return {entry.name: entry.stat(follow_symlinks=False).st_size for entry in entries}
+    except FileNotFoundError:
+        return {}
 
-        # Verify that chunk was created (should work without xattr validation)
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        chunk_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        full_cache_path = os.path.join(file_dir, base_name)
-
-        # When size=None, chunk 0 gets renamed to the original file name
-        # Check that either the chunk file exists OR the full file exists (renamed chunk)
-        chunk_exists = os.path.exists(chunk_path)
-        full_file_exists = os.path.exists(full_cache_path)
-
-        assert chunk_exists or full_file_exists, (
-            f"Either chunk file {chunk_path} or full file {full_cache_path} should exist"
-        )
 
-        # Check the size of whichever file exists
-        if chunk_exists:
-            chunk_size = os.path.getsize(chunk_path)
-            assert chunk_size == 1024 * 1024, f"Chunk size should be 1MB, got {chunk_size} bytes"
-        else:
-            full_file_size = os.path.getsize(full_cache_path)
-            assert full_file_size == 1024 * 1024, f"Full file size should be 1MB, got {full_file_size} bytes"
+def assert_payload_equal(actual: bytes | memoryview, expected: bytes | memoryview, message: str) -> None:
+    """Assert that two payloads are equal, reporting only where they first differ.
 
+    A plain ``assert actual == expected`` makes pytest render a diff of both multi-megabyte values on failure.
+    """
+    if actual == expected:
+        return
+    mismatch_offset = next(
+        (offset for offset, (a, b) in enumerate(zip(actual, expected)) if a != b), min(len(actual), len(expected))
+    )
+    actual_window = bytes(actual[mismatch_offset : mismatch_offset + 64])
+    expected_window = bytes(expected[mismatch_offset : mismatch_offset + 64])
+    pytest.fail(
+        f"{message}: got {len(actual)} bytes, expected {len(expected)} bytes, first difference at byte "
+        f"{mismatch_offset}: {actual_window!r} != {expected_window!r}"
+    )
+
+
+# Each read is (byte range, chunks expected in the cache afterwards, chunks expected to be absent afterwards).
+# Chunk expectations are None when the read only checks returned content.
+RangeReadStep = tuple[Range, set[int] | None, set[int] | None]
+
+
+@pytest.mark.parametrize(
+    argnames=["reads"],
+    argvalues=[
+        [
+            [
+                # 16KB at 512KB offset (chunk 0 only)
+                (Range(offset=512 * 1024, size=16 * 1024), {0}, {1, 2, 3}),
+                # 1.5MB at 512KB offset (spans chunk 0 and chunk 1)
+                (Range(offset=512 * 1024, size=1536 * 1024), {0, 1}, {2, 3}),
+            ]
+        ],
+        [
+            [
+                # Chunk boundary (start of chunk 1)
+                (Range(offset=1024 * 1024, size=1024), None, None),
+                # End of file
+                (Range(offset=4 * 1024 * 1024 - 1024, size=1024), None, None),
+                # Entire chunk 1
+                (Range(offset=1024 * 1024, size=1024 * 1024), None, None),
+                # 2MB spanning 3 chunks
+                (Range(offset=512 * 1024, size=2 * 1024 * 1024), None, None),
+            ]
+        ],
+        [
+            [
+                # First read downloads the chunk, second read is served from it
+                (Range(offset=512 * 1024, size=16 * 1024), {0}, None),
+                (Range(offset=512 * 1024, size=16 * 1024), {0}, None),
+            ]
+        ],
+    ],
+    ids=["range_read", "edge_cases", "repeated_reads"],
+)
+def test_partial_file_caching_range_read(
+    reads: list[RangeReadStep], origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
+    """Test partial file caching with a sequence of range reads against a 4MB file."""
+    # Create configuration with partial file caching enabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Note: We don't do a full read here to avoid caching the full file,
+    # which would prevent chunk-based range reads from being tested
+    file_path = f"test-data-{uuid.uuid4()}/file.bin"
+    test_content = shared_test_data(4)  # 4MB file
+    client.write(file_path, test_content)
+
+    # The cache path mirrors the file structure, chunks are stored as .file.bin#chunkN
+    paths = cache_paths(cache_dir, file_path)
+
+    for range_read, present_chunks, absent_chunks in reads:
+        partial_content = client.read(file_path, byte_range=range_read)
 
-def test_partial_file_caching_edge_cases() -> None:
-    """Test edge cases for partial file caching."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+        # Verify the range read returned correct data
+        expected_content = memoryview(test_content)[range_read.offset : range_read.offset + range_read.size]
+        assert_payload_equal(partial_content, expected_content, f"Range read {range_read} content mismatch")
 
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/edge_case.bin"
-        test_content = create_test_data(4)  # 4MB file
-        client.write(file_path, test_content)
+        if present_chunks is None and absent_chunks is None:
+            continue
 
-        # Test 1: Read at chunk boundary (start of chunk 1)
-        range_read = Range(offset=1024 * 1024, size=1024)  # 1KB at 1MB offset
-        partial_content = client.read(file_path, byte_range=range_read)
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, "Chunk boundary read failed"
+        snapshot = snapshot_cache_dir(paths.file_dir)
 
-        # Test 2: Read at end of file
-        range_read = Range(offset=4 * 1024 * 1024 - 1024, size=1024)  # Last 1KB
-        partial_content = client.read(file_path, byte_range=range_read)
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, "End of file read failed"
+        # Verify that the expected chunks exist and are 1MB
+        for chunk_idx in present_chunks or ():
+            chunk_size = snapshot.get(paths.chunk_name(chunk_idx))
+            assert chunk_size == 1024 * 1024, f"Chunk {chunk_idx} should exist and be 1MB, got {chunk_size}"
 
-        # Test 3: Read entire chunk
-        range_read = Range(offset=1024 * 1024, size=1024 * 1024)  # Entire chunk 1
-        partial_content = client.read(file_path, byte_range=range_read)
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, "Entire chunk read failed"
+        # Verify that no other chunks were downloaded
+        unexpected_chunks = snapshot.keys() & {paths.chunk_name(chunk_idx) for chunk_idx in absent_chunks or ()}
+        assert not unexpected_chunks, f"Chunks should not exist yet: {sorted(unexpected_chunks)}"
 
-        # Test 4: Read across multiple chunks
-        range_read = Range(offset=512 * 1024, size=2 * 1024 * 1024)  # 2MB spanning 3 chunks
-        partial_content = client.read(file_path, byte_range=range_read)
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, "Multi-chunk read failed"
 
+def test_partial_file_caching_without_source_version(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
+    """Test partial file caching when source_version is disabled (None)."""
+    # Create configuration with partial file caching enabled but source version disabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    config["cache"]["check_source_version"] = False  # Disable source version checking
+
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Create a test file
+    file_path = f"test-data-{uuid.uuid4()}/file.bin"
+    test_content = shared_test_data(4)  # 4MB file
+    client.write(file_path, test_content)
+
+    # Read a range that should trigger chunking
+    range_read = Range(offset=512 * 1024, size=16 * 1024)  # 16KB at 512KB offset
+    partial_content = client.read(file_path, byte_range=range_read, check_source_version=SourceVersionCheckMode.DISABLE)
+
+    # Verify the range read returned correct data
+    expected_content = memoryview(test_content)[range_read.offset : range_read.offset + range_read.size]
+    assert_payload_equal(partial_content, expected_content, "Range read content mismatch")
+
+    # Verify that chunk was created (should work without xattr validation)
+    paths = cache_paths(cache_dir, file_path)
+    chunk_name = paths.chunk_name(0)
+    snapshot = snapshot_cache_dir(paths.file_dir)
+
+    # When size=None, chunk 0 gets renamed to the original file name
+    # Check that either the chunk file exists OR the full file exists (renamed chunk)
+    chunk_exists = chunk_name in snapshot
+    full_file_exists = paths.base_name in snapshot
+
+    assert chunk_exists or full_file_exists, (
+        f"Either chunk file {chunk_name} or full file {paths.base_name} should exist in {paths.file_dir}"
+    )
+
+    # Check the size of whichever file exists
+    if chunk_exists:
+        chunk_size = snapshot[chunk_name]
+        assert chunk_size == 1024 * 1024, f"Chunk size should be 1MB, got {chunk_size} bytes"
+    else:
+        full_file_size = snapshot[paths.base_name]
+        assert full_file_size == 1024 * 1024, f"Full file size should be 1MB, got {full_file_size} bytes"
 
-def test_partial_file_caching_repeated_reads() -> None:
-    """Test that repeated reads use cached chunks."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/repeated.bin"
-        test_content = create_test_data(4)  # 4MB file
-        client.write(file_path, test_content)
+def test_partial_file_caching_different_files(origin_store: tempdatastore.TemporaryDataStore, cache_dir: str) -> None:
+    """Test partial file caching with multiple files."""
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        # First read - should download chunk
-        range_read = Range(offset=512 * 1024, size=16 * 1024)
-        partial_content1 = client.read(file_path, byte_range=range_read)
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content1 == expected_content
+    # Create multiple test files
+    test_files = []
+    for i in range(3):
+        file_path = f"test-data-{uuid.uuid4()}/multi_file_{i}.bin"
+        test_content = shared_test_data(4)  # 4MB file
+        test_files.append((file_path, test_content))
 
-        # Second read - should use cached chunk
-        partial_content2 = client.read(file_path, byte_range=range_read)
-        assert partial_content2 == expected_content
-        assert partial_content1 == partial_content2
+    with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+        list(executor.map(lambda file: client.write(*file), test_files))
 
-        # Verify chunk file exists
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        chunk_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        assert os.path.exists(chunk_path), "Chunk should exist after first read"
+    # Read from each file
+    for file_path, test_content in test_files:
+        range_read = Range(offset=512 * 1024, size=16 * 1024)
+        partial_content = client.read(file_path, byte_range=range_read)
+        expected_content = memoryview(test_content)[range_read.offset : range_read.offset + range_read.size]
+        assert_payload_equal(partial_content, expected_content, f"Read failed for {file_path}")
 
+    # Verify chunks exist for each file
+    for file_path, _ in test_files:
+        paths = cache_paths(cache_dir, file_path)
+        assert os.path.exists(paths.chunk_path(0)), f"Chunk should exist for {file_path}"
 
-def test_partial_file_caching_different_files() -> None:
-    """Test partial file caching with multiple files."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create multiple test files
-        test_files = []
-        for i in range(3):
-            file_path = f"test-data-{uuid.uuid4()}/multi_file_{i}.bin"
-            test_content = create_test_data(4)  # 4MB file
-            test_files.append((file_path, test_content))
-            client.write(file_path, test_content)
-
-        # Read from each file
-        for file_path, test_content in test_files:
-            range_read = Range(offset=512 * 1024, size=16 * 1024)
-            partial_content = client.read(file_path, byte_range=range_read)
-            expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-            assert partial_content == expected_content, f"Read failed for {file_path}"
-
-        # Verify chunks exist for each file
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-
-        for file_path, _ in test_files:
-            file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-            base_name = os.path.basename(file_path)
-            chunk_path = os.path.join(file_dir, f".{base_name}#chunk0")
-            assert os.path.exists(chunk_path), f"Chunk should exist for {file_path}"
-
-
-def test_partial_file_caching_large_chunk_size() -> None:
+
+def test_partial_file_caching_large_chunk_size(origin_store: tempdatastore.TemporaryDataStore, cache_dir: str) -> None:
     """Test partial file caching with a custom chunk size of 2MB.
 
     This test verifies that:
@@ -291,60 +309,57 @@ def test_partial_file_caching_large_chunk_size() -> None:
     3. Full chunks are cached for future use
     4. Data integrity is maintained across chunk boundaries
     """
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with large chunk size
-        config = {
-            "profiles": {
-                "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
-            },
-            "cache": {
-                "size": "50M",
-                "location": cache_dir,
-                "cache_line_size": "2M",  # 2MB cache lines
-                "check_source_version": True,
-                "eviction_policy": {
-                    "policy": "lru",
-                    "refresh_interval": 300,
-                },
+    # Create configuration with large chunk size
+    config = {
+        "profiles": {
+            "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
+        },
+        "cache": {
+            "size": "50M",
+            "location": cache_dir,
+            "cache_line_size": "2M",  # 2MB cache lines
+            "check_source_version": True,
+            "eviction_policy": {
+                "policy": "lru",
+                "refresh_interval": 300,
             },
-        }
+        },
+    }
 
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/large_chunk.bin"
-        test_content = create_test_data(8)  # 8MB file
-        client.write(file_path, test_content)
+    # Create a test file
+    file_path = f"test-data-{uuid.uuid4()}/large_chunk.bin"
+    test_content = shared_test_data(8)  # 8MB file
+    client.write(file_path, test_content)
 
-        # Read that spans multiple 2MB chunks
-        range_read = Range(offset=1024 * 1024, size=3 * 1024 * 1024)  # 3MB read
-        partial_content = client.read(file_path, byte_range=range_read)
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content
+    # Read that spans multiple 2MB chunks
+    range_read = Range(offset=1024 * 1024, size=3 * 1024 * 1024)  # 3MB read
+    partial_content = client.read(file_path, byte_range=range_read)
+    expected_content = memoryview(test_content)[range_read.offset : range_read.offset + range_read.size]
+    assert_payload_equal(partial_content, expected_content, "Range read content mismatch")
 
-        # Verify chunks exist with correct sizes
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
+    # Verify chunks exist with correct sizes
+    paths = cache_paths(cache_dir, file_path)
 
-        # Should have chunk0 and chunk1
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
+    # Should have chunk0 and chunk1
+    snapshot = snapshot_cache_dir(paths.file_dir)
 
-        assert os.path.exists(chunk0_path), "Chunk 0 should exist"
-        assert os.path.exists(chunk1_path), "Chunk 1 should exist"
+    assert paths.chunk_name(0) in snapshot, "Chunk 0 should exist"
+    assert paths.chunk_name(1) in snapshot, "Chunk 1 should exist"
 
-        chunk0_size = os.path.getsize(chunk0_path)
-        chunk1_size = os.path.getsize(chunk1_path)
+    chunk0_size = snapshot[paths.chunk_name(0)]
+    chunk1_size = snapshot[paths.chunk_name(1)]
 
-        # Both chunks should be 2MB (full chunks)
-        expected_size = 2 * 1024 * 1024  # 2MB
-        assert chunk0_size == expected_size, f"Chunk 0 should be 2MB, got {chunk0_size} bytes"
-        assert chunk1_size == expected_size, f"Chunk 1 should be 2MB, got {chunk1_size} bytes"
+    # Both chunks should be 2MB (full chunks)
+    expected_size = 2 * 1024 * 1024  # 2MB
+    assert chunk0_size == expected_size, f"Chunk 0 should be 2MB, got {chunk0_size} bytes"
+    assert chunk1_size == expected_size, f"Chunk 1 should be 2MB, got {chunk1_size} bytes"
 
 
-def test_partial_file_caching_chunk_invalidation() -> None:
+def test_partial_file_caching_chunk_invalidation(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
     """Test partial file caching chunk invalidation when source version changes.
 
     This test verifies that:
@@ -353,585 +368,591 @@ def test_partial_file_caching_chunk_invalidation() -> None:
     3. New chunks are fetched with the new version
     4. Data integrity is maintained throughout the process
     """
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with small chunk size for easier testing
-        config = {
-            "profiles": {
-                "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
-            },
-            "cache": {
-                "size": "50M",
-                "location": cache_dir,
-                "cache_line_size": "1M",  # 1MB cache lines for easier testing
-                "check_source_version": True,
-                "eviction_policy": {
-                    "policy": "lru",
-                    "refresh_interval": 300,
-                },
+    # Create configuration with small chunk size for easier testing
+    config = {
+        "profiles": {
+            "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
+        },
+        "cache": {
+            "size": "50M",
+            "location": cache_dir,
+            "cache_line_size": "1M",  # 1MB cache lines for easier testing
+            "check_source_version": True,
+            "eviction_policy": {
+                "policy": "lru",
+                "refresh_interval": 300,
             },
-        }
-
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/version_test.bin"
-        test_content_v1 = create_test_data(4)  # 4MB file
-        client.write(file_path, test_content_v1)
-
-        # Get initial metadata (version1)
-        metadata_v1 = client.info(file_path)
-        etag_v1 = metadata_v1.etag
-
-        # Read first chunk (0-1MB) - this should cache chunk0
-        range_read_1 = Range(offset=0, size=1 * 1024 * 1024)  # 1MB read
-        partial_content_1 = client.read(file_path, byte_range=range_read_1)
-        expected_content_1 = test_content_v1[range_read_1.offset : range_read_1.offset + range_read_1.size]
-        assert partial_content_1 == expected_content_1
-
-        # Verify chunk0 exists with version1
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        assert os.path.exists(chunk0_path), "Chunk 0 should exist after first read"
-
-        # Verify chunk0 has version1 etag
-        chunk_etag = xattr.getxattr(chunk0_path, "user.etag").decode("utf-8")
-        assert chunk_etag == etag_v1, f"Chunk should have version1 etag, got {chunk_etag}"
-
-        # Update the file content (this changes the ETag)
-        # Create completely different content
-        test_content_v2 = b"UPDATED_CONTENT_" * (4 * 1024 * 1024 // 16)  # Different 4MB content
-        client.write(file_path, test_content_v2)
-
-        # Get new metadata (version2)
-        metadata_v2 = client.info(file_path)
-        etag_v2 = metadata_v2.etag
-
-        assert etag_v2 != etag_v1, "ETag should have changed after file update"
-
-        # Read a range that spans both chunks (0-2MB) - this should invalidate chunk0 and fetch both chunks with version2
-        range_read_2 = Range(offset=0, size=2 * 1024 * 1024)  # 2MB read spanning chunks 0 and 1
-        partial_content_2 = client.read(file_path, byte_range=range_read_2)
-        expected_content_2 = test_content_v2[range_read_2.offset : range_read_2.offset + range_read_2.size]
-        assert partial_content_2 == expected_content_2
-
-        # Verify chunk0 was invalidated and replaced with version2
-        assert os.path.exists(chunk0_path), "Chunk 0 should still exist"
-        chunk_etag_after = xattr.getxattr(chunk0_path, "user.etag").decode("utf-8")
-        assert chunk_etag_after == etag_v2, f"Chunk should have version2 etag, got {chunk_etag_after}"
-
-        # Verify chunk1 exists with version2
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
-        assert os.path.exists(chunk1_path), "Chunk 1 should exist after second read"
-        chunk1_etag = xattr.getxattr(chunk1_path, "user.etag").decode("utf-8")
-        assert chunk1_etag == etag_v2, f"Chunk 1 should have version2 etag, got {chunk1_etag}"
-
-        # Verify that reading the first chunk again returns version2 data
-        partial_content_1_after = client.read(file_path, byte_range=range_read_1)
-        expected_content_1_after = test_content_v2[range_read_1.offset : range_read_1.offset + range_read_1.size]
-        assert partial_content_1_after == expected_content_1_after, "First chunk should return version2 data"
-        assert partial_content_1_after != expected_content_1, "First chunk should not return version1 data"
-
-        # Verify both chunks have the correct size
-        chunk0_size = os.path.getsize(chunk0_path)
-        chunk1_size = os.path.getsize(chunk1_path)
-        expected_chunk_size = 1 * 1024 * 1024  # 1MB
-        assert chunk0_size == expected_chunk_size, f"Chunk 0 should be 1MB, got {chunk0_size} bytes"
-        assert chunk1_size == expected_chunk_size, f"Chunk 1 should be 1MB, got {chunk1_size} bytes"
-
-
-def test_partial_file_caching_cleanup() -> None:
+        },
+    }
+
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Create a test file
+    file_path = f"test-data-{uuid.uuid4()}/version_test.bin"
+    test_content_v1 = shared_test_data(4)  # 4MB file
+    client.write(file_path, test_content_v1)
+
+    # Get initial metadata (version1)
+    metadata_v1 = client.info(file_path)
+    etag_v1 = metadata_v1.etag
+
+    # Read first chunk (0-1MB) - this should cache chunk0
+    range_read_1 = Range(offset=0, size=1 * 1024 * 1024)  # 1MB read
+    partial_content_1 = client.read(file_path, byte_range=range_read_1)
+    expected_content_1 = memoryview(test_content_v1)[range_read_1.offset : range_read_1.offset + range_read_1.size]
+    assert_payload_equal(partial_content_1, expected_content_1, "Range read content mismatch")
+
+    # Verify chunk0 exists with version1 etag
+    paths = cache_paths(cache_dir, file_path)
+    chunk_etag = read_cached_etag(paths.chunk_path(0))
+    assert chunk_etag == etag_v1, f"Chunk should have version1 etag, got {chunk_etag}"
+
+    # Update the file content (this changes the ETag)
+    test_content_v2 = UPDATED_TEST_DATA
+    client.write(file_path, test_content_v2)
+
+    # Get new metadata (version2)
+    metadata_v2 = client.info(file_path)
+    etag_v2 = metadata_v2.etag
+
+    assert etag_v2 != etag_v1, "ETag should have changed after file update"
+
+    # Read a range that spans both chunks (0-2MB) - this should invalidate chunk0 and fetch both chunks with version2
+    range_read_2 = Range(offset=0, size=2 * 1024 * 1024)  # 2MB read spanning chunks 0 and 1
+    partial_content_2 = client.read(file_path, byte_range=range_read_2)
+    expected_content_2 = memoryview(test_content_v2)[range_read_2.offset : range_read_2.offset + range_read_2.size]
+    assert_payload_equal(partial_content_2, expected_content_2, "Range read content mismatch")
+
+    # Verify chunk0 was invalidated and replaced with version2
+    chunk_etag_after = read_cached_etag(paths.chunk_path(0))
+    assert chunk_etag_after == etag_v2, f"Chunk should have version2 etag, got {chunk_etag_after}"
+
+    # Verify chunk1 exists with version2
+    chunk1_etag = read_cached_etag(paths.chunk_path(1))
+    assert chunk1_etag == etag_v2, f"Chunk 1 should have version2 etag, got {chunk1_etag}"
+
+    # Verify that reading the first chunk again returns version2 data
+    partial_content_1_after = client.read(file_path, byte_range=range_read_1)
+    expected_content_1_after = memoryview(test_content_v2)[
+        range_read_1.offset : range_read_1.offset + range_read_1.size
+    ]
+    assert_payload_equal(partial_content_1_after, expected_content_1_after, "First chunk should return version2 data")
+    assert partial_content_1_after != expected_content_1, "First chunk should not return version1 data"
+
+    # Verify both chunks have the correct size
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    chunk0_size = snapshot.get(paths.chunk_name(0))
+    chunk1_size = snapshot.get(paths.chunk_name(1))
+    expected_chunk_size = 1 * 1024 * 1024  # 1MB
+    assert chunk0_size == expected_chunk_size, f"Chunk 0 should be 1MB, got {chunk0_size} bytes"
+    assert chunk1_size == expected_chunk_size, f"Chunk 1 should be 1MB, got {chunk1_size} bytes"
+
+
+def test_partial_file_caching_cleanup(origin_store: tempdatastore.TemporaryDataStore, cache_dir: str) -> None:
     """Test partial file caching cleanup with automatic eviction."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        config = {
-            "profiles": {
-                "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
-            },
-            "cache": {
-                "size": "2M",  # Very small cache size to force eviction of chunks
-                "location": cache_dir,
-                "cache_line_size": "1M",  # 1MB cache lines
-                "check_source_version": True,
-                "eviction_policy": {"policy": "lru"},
-            },
-        }
-
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/cleanup_test.bin"
-        test_content = create_test_data(5)  # 5MB file
-        client.write(file_path, test_content)
-
-        # Read first chunk (0-1MB) - this should cache chunk0
-        range_read_1 = Range(offset=0, size=1 * 1024 * 1024)  # 1MB read
-        partial_content_1 = client.read(file_path, byte_range=range_read_1)
-        expected_content_1 = test_content[range_read_1.offset : range_read_1.offset + range_read_1.size]
-        assert partial_content_1 == expected_content_1
-
-        # Read second chunk (1-2MB) - this should cache chunk1
-        range_read_2 = Range(offset=1 * 1024 * 1024, size=1 * 1024 * 1024)  # 1MB read
-        partial_content_2 = client.read(file_path, byte_range=range_read_2)
-        expected_content_2 = test_content[range_read_2.offset : range_read_2.offset + range_read_2.size]
-        assert partial_content_2 == expected_content_2
-
-        # Verify both chunks exist in cache
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
-
-        assert os.path.exists(chunk0_path), "Chunk 0 should exist after first read"
-        assert os.path.exists(chunk1_path), "Chunk 1 should exist after second read"
-
-        # Verify chunk sizes
-        chunk0_size = os.path.getsize(chunk0_path)
-        chunk1_size = os.path.getsize(chunk1_path)
-        expected_chunk_size = 1 * 1024 * 1024  # 1MB
-        assert chunk0_size == expected_chunk_size, f"Chunk 0 should be 1MB, got {chunk0_size} bytes"
-        assert chunk1_size == expected_chunk_size, f"Chunk 1 should be 1MB, got {chunk1_size} bytes"
-
-        cache_manager = client._cache_manager
-        assert cache_manager is not None
-        cache_manager._last_refresh_time = datetime.now(tz=timezone.utc) - timedelta(
-            seconds=cache_manager._cache_refresh_interval + 1
-        )
+    config = {
+        "profiles": {
+            "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
+        },
+        "cache": {
+            "size": "2M",  # Very small cache size to force eviction of chunks
+            "location": cache_dir,
+            "cache_line_size": "1M",  # 1MB cache lines
+            "check_source_version": True,
+            "eviction_policy": {"policy": "lru"},
+        },
+    }
 
-        # Reading a third chunk should schedule background refresh because the refresh interval has elapsed.
-        range_read_3 = Range(offset=2 * 1024 * 1024, size=1 * 1024 * 1024)  # 1MB read
-        partial_content_3 = client.read(file_path, byte_range=range_read_3)
-        expected_content_3 = test_content[range_read_3.offset : range_read_3.offset + range_read_3.size]
-        assert partial_content_3 == expected_content_3
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Create a test file
+    file_path = f"test-data-{uuid.uuid4()}/cleanup_test.bin"
+    test_content = shared_test_data(5)  # 5MB file
+    client.write(file_path, test_content)
+
+    # Read first chunk (0-1MB) - this should cache chunk0
+    range_read_1 = Range(offset=0, size=1 * 1024 * 1024)  # 1MB read
+    partial_content_1 = client.read(file_path, byte_range=range_read_1)
+    expected_content_1 = memoryview(test_content)[range_read_1.offset : range_read_1.offset + range_read_1.size]
+    assert_payload_equal(partial_content_1, expected_content_1, "Range read content mismatch")
+
+    # Read second chunk (1-2MB) - this should cache chunk1
+    range_read_2 = Range(offset=1 * 1024 * 1024, size=1 * 1024 * 1024)  # 1MB read
+    partial_content_2 = client.read(file_path, byte_range=range_read_2)
+    expected_content_2 = memoryview(test_content)[range_read_2.offset : range_read_2.offset + range_read_2.size]
+    assert_payload_equal(partial_content_2, expected_content_2, "Range read content mismatch")
+
+    # Verify both chunks exist in cache
+    paths = cache_paths(cache_dir, file_path)
+
+    snapshot = snapshot_cache_dir(paths.file_dir)
+
+    assert paths.chunk_name(0) in snapshot, "Chunk 0 should exist after first read"
+    assert paths.chunk_name(1) in snapshot, "Chunk 1 should exist after second read"
+
+    # Verify chunk sizes
+    chunk0_size = snapshot[paths.chunk_name(0)]
+    chunk1_size = snapshot[paths.chunk_name(1)]
+    expected_chunk_size = 1 * 1024 * 1024  # 1MB
+    assert chunk0_size == expected_chunk_size, f"Chunk 0 should be 1MB, got {chunk0_size} bytes"
+    assert chunk1_size == expected_chunk_size, f"Chunk 1 should be 1MB, got {chunk1_size} bytes"
+
+    cache_manager = client._cache_manager
+    assert cache_manager is not None
+    cache_manager._last_refresh_time = datetime.now(tz=timezone.utc) - timedelta(
+        seconds=cache_manager._cache_refresh_interval + 1
+    )
+
+    # Reading a third chunk should schedule background refresh because the refresh interval has elapsed.
+    range_read_3 = Range(offset=2 * 1024 * 1024, size=1 * 1024 * 1024)  # 1MB read
+    partial_content_3 = client.read(file_path, byte_range=range_read_3)
+    expected_content_3 = memoryview(test_content)[range_read_3.offset : range_read_3.offset + range_read_3.size]
+    assert_payload_equal(partial_content_3, expected_content_3, "Range read content mismatch")
+
+    for _ in range(100):
+        if not os.path.exists(paths.chunk_path(0)):
+            break
+        time.sleep(0.05)
+
+    # Verify that background LRU eviction worked correctly:
+    # - chunk0 (oldest) should be deleted
+    # - chunk1 and chunk2 should remain
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    assert paths.chunk_name(0) not in snapshot, "Chunk 0 should be deleted after cleanup (LRU eviction)"
+    assert paths.chunk_name(1) in snapshot, "Chunk 1 should remain (within cache size limit)"
+
+    # Verify the new chunk was also created
+    assert paths.chunk_name(2) in snapshot, "Chunk 2 should exist after third read"
+
+
+def test_partial_file_caching_full_file_optimization(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
+    """Test that range reads use full cached files when available instead of chunking."""
+    # Create configuration with partial file caching enabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        for _ in range(100):
-            if not os.path.exists(chunk0_path):
-                break
-            time.sleep(0.05)
+    # Create a 3MB test file
+    file_path = f"test-data-{uuid.uuid4()}/full_file_test.bin"
+    test_content = shared_test_data(3)  # 3MB file
+    client.write(file_path, test_content)
 
-        # Verify that background LRU eviction worked correctly:
-        # - chunk0 (oldest) should be deleted
-        # - chunk1 and chunk2 should remain
-        assert not os.path.exists(chunk0_path), "Chunk 0 should be deleted after cleanup (LRU eviction)"
-        assert os.path.exists(chunk1_path), "Chunk 1 should remain (within cache size limit)"
+    # Verify file was written correctly, populating the full-file cache as a side effect
+    assert client.info(file_path).content_length == len(test_content), "File size mismatch"
+    assert_payload_equal(client.read(file_path), test_content, "File content mismatch")
 
-        # Verify the new chunk was also created
-        chunk2_path = os.path.join(file_dir, f".{base_name}#chunk2")
-        assert os.path.exists(chunk2_path), "Chunk 2 should exist after third read"
+    # Get cache paths
+    paths = cache_paths(cache_dir, file_path)
 
+    # Verify full file is cached
+    assert os.path.exists(paths.full_path), "Full file should be cached after read"
 
-def test_partial_file_caching_full_file_optimization() -> None:
-    """Test that range reads use full cached files when available instead of chunking."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a 3MB test file
-        file_path = f"test-data-{uuid.uuid4()}/full_file_test.bin"
-        test_content = create_test_data(3)  # 3MB file
-        client.write(file_path, test_content)
-
-        # Verify file was written correctly
-        assert client.read(file_path) == test_content, "File content mismatch"
-
-        # Get cache paths
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        full_cache_path = os.path.join(file_dir, base_name)
-
-        # Verify full file is cached
-        assert os.path.exists(full_cache_path), "Full file should be cached after read"
-
-        # Now perform a range read - this should use the full cached file, not chunks
-        range_read = Range(offset=1 * 1024 * 1024, size=512 * 1024)  # 512KB at 1MB offset
-        partial_content = client.read(file_path, byte_range=range_read)
+    # Now perform a range read - this should use the full cached file, not chunks
+    range_read = Range(offset=1 * 1024 * 1024, size=512 * 1024)  # 512KB at 1MB offset
+    partial_content = client.read(file_path, byte_range=range_read)
 
-        # Verify the range read returned correct data
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, (
-            f"Range read content mismatch: expected {len(expected_content)} bytes, got {len(partial_content)} bytes"
-        )
+    # Verify the range read returned correct data
+    expected_content = memoryview(test_content)[range_read.offset : range_read.offset + range_read.size]
+    assert_payload_equal(partial_content, expected_content, "Range read content mismatch")
 
-        # Verify that NO chunks were created (since we used the full cached file)
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
-        chunk2_path = os.path.join(file_dir, f".{base_name}#chunk2")
+    # Verify that NO chunks were created (since we used the full cached file)
+    snapshot = snapshot_cache_dir(paths.file_dir)
 
-        assert not os.path.exists(chunk0_path), "Chunk 0 should NOT exist (used full cached file)"
-        assert not os.path.exists(chunk1_path), "Chunk 1 should NOT exist (used full cached file)"
-        assert not os.path.exists(chunk2_path), "Chunk 2 should NOT exist (used full cached file)"
+    unexpected_chunks = snapshot.keys() & {paths.chunk_name(chunk_idx) for chunk_idx in range(3)}
+    assert not unexpected_chunks, f"Chunks should NOT exist (used full cached file): {sorted(unexpected_chunks)}"
 
-        # Verify the full cached file still exists and has correct etag
-        assert os.path.exists(full_cache_path), "Full cached file should still exist"
+    # Verify the full cached file still exists and has correct etag
+    assert paths.base_name in snapshot, "Full cached file should still exist"
 
-        # Check that the full cached file has the correct etag
-        try:
-            cached_etag = xattr.getxattr(full_cache_path, "user.etag").decode("utf-8")
-            # The etag should match the source version (we can't easily get the exact etag,
-            # but we can verify it exists and is not empty)
-            assert cached_etag, "Cached file should have an etag"
-        except (OSError, AttributeError):
-            # xattrs might not be supported on some systems, that's okay for this test
-            pass
+    # Check that the full cached file has the correct etag
+    try:
+        cached_etag = xattr.getxattr(paths.full_path, "user.etag").decode("utf-8")
+        # The etag should match the source version (we can't easily get the exact etag,
+        # but we can verify it exists and is not empty)
+        assert cached_etag, "Cached file should have an etag"
+    except (OSError, AttributeError):
+        # xattrs might not be supported on some systems, that's okay for this test
+        pass
 
-        # Test multiple range reads to ensure they all use the full cached file
-        range_read_2 = Range(offset=0, size=256 * 1024)  # First 256KB
-        range_read_3 = Range(offset=2 * 1024 * 1024, size=256 * 1024)  # Last 256KB
+    # Test multiple range reads to ensure they all use the full cached file
+    range_read_2 = Range(offset=0, size=256 * 1024)  # First 256KB
+    range_read_3 = Range(offset=2 * 1024 * 1024, size=256 * 1024)  # Last 256KB
 
-        partial_content_2 = client.read(file_path, byte_range=range_read_2)
-        partial_content_3 = client.read(file_path, byte_range=range_read_3)
+    partial_content_2 = client.read(file_path, byte_range=range_read_2)
+    partial_content_3 = client.read(file_path, byte_range=range_read_3)
 
-        expected_content_2 = test_content[range_read_2.offset : range_read_2.offset + range_read_2.size]
-        expected_content_3 = test_content[range_read_3.offset : range_read_3.offset + range_read_3.size]
+    expected_content_2 = memoryview(test_content)[range_read_2.offset : range_read_2.offset + range_read_2.size]
+    expected_content_3 = memoryview(test_content)[range_read_3.offset : range_read_3.offset + range_read_3.size]
 
-        assert partial_content_2 == expected_content_2, "Second range read content mismatch"
-        assert partial_content_3 == expected_content_3, "Third range read content mismatch"
+    assert_payload_equal(partial_content_2, expected_content_2, "Second range read content mismatch")
+    assert_payload_equal(partial_content_3, expected_content_3, "Third range read content mismatch")
 
-        # Verify still no chunks were created
-        assert not os.path.exists(chunk0_path), "Chunk 0 should still NOT exist after multiple range reads"
-        assert not os.path.exists(chunk1_path), "Chunk 1 should still NOT exist after multiple range reads"
-        assert not os.path.exists(chunk2_path), "Chunk 2 should still NOT exist after multiple range reads"
+    # Verify still no chunks were created
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    unexpected_chunks = snapshot.keys() & {paths.chunk_name(chunk_idx) for chunk_idx in range(3)}
+    assert not unexpected_chunks, (
+        f"Chunks should still NOT exist after multiple range reads: {sorted(unexpected_chunks)}"
+    )
 
 
-def test_partial_file_caching_full_file_read_optimization() -> None:
+def test_partial_file_caching_full_file_read_optimization(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
     """Test that byte_range with offset=0 and size>=file_size caches whole file instead of chunking."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a 3MB test file (larger than 1MB chunk size)
-        file_path = f"test-data-{uuid.uuid4()}/full_file_read_test.bin"
-        test_content = create_test_data(3)  # 3MB file
-        client.write(file_path, test_content)
-
-        # Get cache paths
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        full_cache_path = os.path.join(file_dir, base_name)
-
-        # Verify file is NOT cached initially
-        assert not os.path.exists(full_cache_path), "Full file should not be cached initially"
-
-        # Perform a range read with offset=0 and size >= file_size (full file read)
-        # This should cache the whole file instead of chunking
-        file_size = len(test_content)
-        range_read = Range(offset=0, size=file_size)  # Full file read
-        full_content = client.read(file_path, byte_range=range_read)
-
-        # Verify the full file read returned correct data
-        assert full_content == test_content, "Full file read content mismatch"
-
-        # Verify that the whole file is cached (not chunks)
-        assert os.path.exists(full_cache_path), "Full file should be cached after full file range read"
-        cached_file_size = os.path.getsize(full_cache_path)
-        assert cached_file_size == file_size, f"Expected cached file size {file_size}, got {cached_file_size}"
-
-        # Verify that NO chunks were created (since we cached the whole file)
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
-        chunk2_path = os.path.join(file_dir, f".{base_name}#chunk2")
-
-        assert not os.path.exists(chunk0_path), "Chunk 0 should NOT exist (whole file cached instead)"
-        assert not os.path.exists(chunk1_path), "Chunk 1 should NOT exist (whole file cached instead)"
-        assert not os.path.exists(chunk2_path), "Chunk 2 should NOT exist (whole file cached instead)"
-
-        # Test with size > file_size (should still cache whole file)
-        range_read_larger = Range(offset=0, size=file_size + 1024)  # Size larger than file
-        full_content_larger = client.read(file_path, byte_range=range_read_larger)
-
-        # Should return the whole file (truncated to file_size)
-        assert len(full_content_larger) == file_size, "Should return file_size bytes even if requested size is larger"
-        assert full_content_larger == test_content, "Content should match full file"
-
-        # Verify still no chunks were created
-        assert not os.path.exists(chunk0_path), "Chunk 0 should still NOT exist"
-        assert not os.path.exists(chunk1_path), "Chunk 1 should still NOT exist"
-        assert not os.path.exists(chunk2_path), "Chunk 2 should still NOT exist"
-
-
-def test_partial_file_caching_full_file_read_optimization_with_source_version_disabled() -> None:
-    """Test that when check_source_version is DISABLED, optimization doesn't apply and chunking is used."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a 3MB test file (larger than 1MB chunk size)
-        file_path = f"test-data-{uuid.uuid4()}/test.bin"
-        test_content = create_test_data(3)  # 3MB file
-        client.write(file_path, test_content)
-
-        # Get cache paths
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        full_cache_path = os.path.join(file_dir, base_name)
-
-        # Perform a range read with offset=0 and size >= file_size (full file read)
-        # with check_source_version DISABLED - optimization should NOT apply (no metadata fetch)
-        # so it should use chunk-based caching instead
-        range_read = Range(offset=0, size=len(test_content))
-        full_content = client.read(
-            file_path, byte_range=range_read, check_source_version=SourceVersionCheckMode.DISABLE
-        )
+    # Create configuration with partial file caching enabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Create a 3MB test file (larger than 1MB chunk size)
+    file_path = f"test-data-{uuid.uuid4()}/full_file_read_test.bin"
+    test_content = shared_test_data(3)  # 3MB file
+    client.write(file_path, test_content)
+
+    # Get cache paths
+    paths = cache_paths(cache_dir, file_path)
+
+    # Verify file is NOT cached initially
+    assert not os.path.exists(paths.full_path), "Full file should not be cached initially"
 
-        # Verify the full file read returned correct data
-        assert full_content == test_content, "Full file read content mismatch"
+    # Perform a range read with offset=0 and size >= file_size (full file read)
+    # This should cache the whole file instead of chunking
+    file_size = len(test_content)
+    range_read = Range(offset=0, size=file_size)  # Full file read
+    full_content = client.read(file_path, byte_range=range_read)
 
-        # Verify that chunks are used (optimization doesn't apply when version checking is disabled)
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        chunk1_path = os.path.join(file_dir, f".{base_name}#chunk1")
-        chunk2_path = os.path.join(file_dir, f".{base_name}#chunk2")
-        assert os.path.exists(chunk0_path), "Chunk 0 should exist (chunking used when version checking disabled)"
-        assert os.path.exists(chunk1_path), "Chunk 1 should exist"
-        assert os.path.exists(chunk2_path), "Chunk 2 should exist"
-        # Full file should NOT be cached (chunks are used instead)
-        assert not os.path.exists(full_cache_path), "Full file should NOT be cached (chunking used instead)"
+    # Verify the full file read returned correct data
+    assert_payload_equal(full_content, test_content, "Full file read content mismatch")
 
+    # Verify that the whole file is cached (not chunks)
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    assert paths.base_name in snapshot, "Full file should be cached after full file range read"
+    cached_file_size = snapshot[paths.base_name]
+    assert cached_file_size == file_size, f"Expected cached file size {file_size}, got {cached_file_size}"
 
-def test_partial_file_caching_chunk_to_full_file_merge() -> None:
+    # Verify that NO chunks were created (since we cached the whole file)
+    unexpected_chunks = snapshot.keys() & {paths.chunk_name(chunk_idx) for chunk_idx in range(3)}
+    assert not unexpected_chunks, f"Chunks should NOT exist (whole file cached instead): {sorted(unexpected_chunks)}"
+
+    # Test with size > file_size (should still cache whole file)
+    range_read_larger = Range(offset=0, size=file_size + 1024)  # Size larger than file
+    full_content_larger = client.read(file_path, byte_range=range_read_larger)
+
+    # Should return the whole file (truncated to file_size)
+    assert len(full_content_larger) == file_size, "Should return file_size bytes even if requested size is larger"
+    assert_payload_equal(full_content_larger, test_content, "Content should match full file")
+
+    # Verify still no chunks were created
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    unexpected_chunks = snapshot.keys() & {paths.chunk_name(chunk_idx) for chunk_idx in range(3)}
+    assert not unexpected_chunks, f"Chunks should still NOT exist: {sorted(unexpected_chunks)}"
+
+
+def test_partial_file_caching_full_file_read_optimization_with_source_version_disabled(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
+    """Test that when check_source_version is DISABLED, optimization doesn't apply and chunking is used."""
+    # Create configuration with partial file caching enabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Create a 3MB test file (larger than 1MB chunk size)
+    file_path = f"test-data-{uuid.uuid4()}/test.bin"
+    test_content = shared_test_data(3)  # 3MB file
+    client.write(file_path, test_content)
+
+    # Get cache paths
+    paths = cache_paths(cache_dir, file_path)
+
+    # Perform a range read with offset=0 and size >= file_size (full file read)
+    # with check_source_version DISABLED - optimization should NOT apply (no metadata fetch)
+    # so it should use chunk-based caching instead
+    range_read = Range(offset=0, size=len(test_content))
+    full_content = client.read(file_path, byte_range=range_read, check_source_version=SourceVersionCheckMode.DISABLE)
+
+    # Verify the full file read returned correct data
+    assert_payload_equal(full_content, test_content, "Full file read content mismatch")
+
+    # Verify that chunks are used (optimization doesn't apply when version checking is disabled)
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    assert paths.chunk_name(0) in snapshot, "Chunk 0 should exist (chunking used when version checking disabled)"
+    assert paths.chunk_name(1) in snapshot, "Chunk 1 should exist"
+    assert paths.chunk_name(2) in snapshot, "Chunk 2 should exist"
+    # Full file should NOT be cached (chunks are used instead)
+    assert paths.base_name not in snapshot, "Full file should NOT be cached (chunking used instead)"
+
+
+def test_partial_file_caching_full_file_read_optimization_with_known_size(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
+    """Test that a caller-provided source size enables the full file optimization without a HEAD request."""
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+
+    file_path = f"test-data-{uuid.uuid4()}/known_size.bin"
+    test_content = shared_test_data(3)  # 3MB file
+    client.write(file_path, test_content)
+    paths = cache_paths(cache_dir, file_path)
+
+    # Record every HeadObject call made by the read
+    head_object_keys: list[str] = []
+    client._storage_provider._s3_client.meta.events.register(  # type: ignore[attr-defined]
+        "provide-client-params.s3.HeadObject", lambda params, **_: head_object_keys.append(params["Key"])
+    )
+
+    range_read = Range(offset=0, size=len(test_content))
+    full_content = client.read(
+        file_path,
+        byte_range=range_read,
+        check_source_version=SourceVersionCheckMode.DISABLE,
+        source_size=len(test_content),
+    )
+
+    assert_payload_equal(full_content, test_content, "Full file read content mismatch")
+    assert head_object_keys == [], "Known size should not require a HEAD request"
+
+    # The whole file is cached instead of chunks
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    assert snapshot.get(paths.base_name) == len(test_content), "Full file should be cached"
+    unexpected_chunks = snapshot.keys() & {paths.chunk_name(chunk_idx) for chunk_idx in range(3)}
+    assert not unexpected_chunks, f"Chunks should NOT exist (whole file cached instead): {sorted(unexpected_chunks)}"
+
+
+def test_partial_file_caching_chunk_to_full_file_merge(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+) -> None:
     """Test that small files are renamed from chunk 0 to original file name for efficiency."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a 512KB test file (smaller than 1MB chunk size)
-        file_path = f"test-data-{uuid.uuid4()}/small_file_test.bin"
-        test_content = create_test_data(1)[: 512 * 1024]  # 512KB file
-        client.write(file_path, test_content)
-
-        # Get cache paths
-        cache_dir = config["cache"]["location"]
-        cache_profile_dir = os.path.join(cache_dir, "origin")
-        file_dir = os.path.join(cache_profile_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        full_cache_path = os.path.join(file_dir, base_name)
-
-        # Verify no full file is cached initially
-        assert not os.path.exists(full_cache_path), "Full file should not be cached initially"
-
-        # Perform a range read - this should create and rename chunk 0 to the original file name
-        range_read = Range(offset=128 * 1024, size=128 * 1024)  # 128KB at 128KB offset
-        partial_content = client.read(file_path, byte_range=range_read)
+    # Create configuration with partial file caching enabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        # Verify the range read returned correct data
-        expected_content = test_content[range_read.offset : range_read.offset + range_read.size]
-        assert partial_content == expected_content, (
-            f"Range read content mismatch: expected {len(expected_content)} bytes, got {len(partial_content)} bytes"
-        )
+    # Create a 512KB test file (smaller than 1MB chunk size)
+    file_path = f"test-data-{uuid.uuid4()}/small_file_test.bin"
+    test_content = shared_test_data(1)[: 512 * 1024]  # 512KB file
+    client.write(file_path, test_content)
 
-        # Verify that the original file exists (chunk 0 was renamed to it since file size < chunk size)
-        assert os.path.exists(full_cache_path), "Full file should exist (renamed from chunk 0)"
+    # Get cache paths
+    paths = cache_paths(cache_dir, file_path)
 
-        # Now perform a full file read - this should use the cached file, not re-download
-        full_content = client.read(file_path)
+    # Verify no full file is cached initially
+    assert not os.path.exists(paths.full_path), "Full file should not be cached initially"
 
-        # Verify the full file read returned correct data
-        assert full_content == test_content, "Full file read content mismatch"
+    # Perform a range read - this should create and rename chunk 0 to the original file name
+    range_read = Range(offset=128 * 1024, size=128 * 1024)  # 128KB at 128KB offset
+    partial_content = client.read(file_path, byte_range=range_read)
 
-        # Verify that the full cached file still exists (was reused)
-        assert os.path.exists(full_cache_path), "Full cached file should still exist after full file read"
+    # Verify the range read returned correct data
+    expected_content = memoryview(test_content)[range_read.offset : range_read.offset + range_read.size]
+    assert_payload_equal(partial_content, expected_content, "Range read content mismatch")
 
-        # Verify the full cached file contains the correct data
-        with open(full_cache_path, "rb") as f:
-            cached_data = f.read()
-        # The cached file should contain the full file data (512KB)
-        assert len(cached_data) == len(test_content), (
-            f"Cached file should contain full file data, got {len(cached_data)} bytes"
-        )
-        assert cached_data == test_content, "Cached file data should match full file content"
+    # Verify that the original file exists (chunk 0 was renamed to it since file size < chunk size)
+    assert os.path.exists(paths.full_path), "Full file should exist (renamed from chunk 0)"
+
+    # Now perform a full file read - this should use the cached file, not re-download
+    full_content = client.read(file_path)
+
+    # Verify the full file read returned correct data
+    assert_payload_equal(full_content, test_content, "Full file read content mismatch")
+
+    # Verify that the full cached file still exists (was reused)
+    assert os.path.exists(paths.full_path), "Full cached file should still exist after full file read"
 
+    # Verify the full cached file contains the correct data
+    with open(paths.full_path, "rb") as f:
+        cached_data = f.read()
+    # The cached file should contain the full file data (512KB)
+    assert len(cached_data) == len(test_content), (
+        f"Cached file should contain full file data, got {len(cached_data)} bytes"
+    )
+    assert_payload_equal(cached_data, test_content, "Cached file data should match full file content")
 
-def test_partial_file_caching_3mb_file_1mb_read():
+
+def test_partial_file_caching_3mb_file_1mb_read(origin_store: tempdatastore.TemporaryDataStore, cache_dir: str):
     """Test that reading 1MB from a 3MB file creates and saves a chunk in cache."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        config["cache"]["cache_line_size"] = "1M"  # 1MB cache lines
-        config["cache"]["size"] = "2M"  # 2MB cache size (smaller than 3MB file)
-
-        # Create storage client
-        msc = StorageClient(StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a 3MB test file
-        test_content = b"X" * (3 * 1024 * 1024)  # 3MB of data
-        test_file_path = "test_3mb_file.bin"
-
-        # Write the file to S3
-        msc.write(test_file_path, test_content)
-
-        # Read 1MB from the file with prefetch_file=False
-        with msc.open(test_file_path, "rb", prefetch_file=False) as f:
-            # 1. f (ObjectFile) receives calls (f.read(), f.seek())
-            # 2. f delegates to f._file (RemoteFileReader)
-            # 3. f._file (RemoteFileReader) does the actual work:
-            # - Converts read(size) → Range(offset=self._pos, size=size)
-            # - Calls storage_client.read(byte_range=range)
-            # - Updates self._pos
-
-            # Seek to beginning and read 1MB
-            f.seek(0)
-            data = f.read(1024 * 1024)  # Read 1MB
-
-            # Verify we got the expected data
-            assert len(data) == 1024 * 1024, f"Expected 1MB, got {len(data)} bytes"
-            assert data == test_content[: 1024 * 1024], "Data should match first 1MB of test content"
-
-        # Debug: Check what was created in the cache
-        cache_dir = config["cache"]["location"]
-        origin_dir = os.path.join(cache_dir, "origin")
-
-        # Check if chunk0 was created (chunks are stored directly in origin directory)
-        chunk0_path = os.path.join(origin_dir, f".{test_file_path}#chunk0")
-
-        assert os.path.exists(chunk0_path), "Chunk 0 should be created in cache"
-
-        # Verify chunk0 contains the correct data (1MB)
-        with open(chunk0_path, "rb") as f:
-            chunk_data = f.read()
-        assert len(chunk_data) == 1024 * 1024, f"Chunk should contain 1MB, got {len(chunk_data)} bytes"
-        assert chunk_data == test_content[: 1024 * 1024], "Chunk data should match first 1MB of test content"
-
-        # Verify xattrs are set correctly
-        try:
-            import xattr
-
-            etag_attr = xattr.getxattr(chunk0_path, "user.etag")
-            cache_line_size_attr = xattr.getxattr(chunk0_path, "user.cache_line_size")
-            size_attr = xattr.getxattr(chunk0_path, "user.size")
-
-            assert etag_attr is not None, "ETag xattr should be set"
-            assert cache_line_size_attr.decode("utf-8") == "1048576", "Cache line size xattr should be 1MB"
-            assert size_attr.decode("utf-8") == str(len(test_content)), "Size xattr should be total file size (3MB)"
-        except (OSError, AttributeError):
-            # xattrs not supported on this system, skip xattr verification
-            pass
-
-
-def test_open_inherits_prefetch_file_false_from_cache_config():
+    # Create configuration with partial file caching enabled
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    config["cache"]["cache_line_size"] = "1M"  # 1MB cache lines
+    config["cache"]["size"] = "2M"  # 2MB cache size (smaller than 3MB file)
+
+    # Create storage client
+    msc = StorageClient(StorageClientConfig.from_dict(config, profile="origin"))
+
+    # Record the Range parameter of every GetObject call
+    get_object_ranges: list[str | None] = []
+    msc._storage_provider._s3_client.meta.events.register(  # type: ignore[attr-defined]
+        "provide-client-params.s3.GetObject", lambda params, **_: get_object_ranges.append(params.get("Range"))
+    )
+
+    # Create a 3MB test file
+    test_content = FILLER_DATA_3MB  # 3MB of data
+    test_file_path = f"test-data-{uuid.uuid4()}/test_3mb_file.bin"
+
+    # Write the file to S3
+    msc.write(test_file_path, test_content)
+
+    # Read 1MB from the file with prefetch_file=False
+    with msc.open(test_file_path, "rb", prefetch_file=False) as f:
+        # 1. f (ObjectFile) receives calls (f.read(), f.seek())
+        # 2. f delegates to f._file (RemoteFileReader)
+        # 3. f._file (RemoteFileReader) does the actual work:
+        # - Converts read(size) → Range(offset=self._pos, size=size)
+        # - Calls storage_client.read(byte_range=range)
+        # - Updates self._pos
+
+        # Seek to beginning and read 1MB
+        f.seek(0)
+        data = f.read(1024 * 1024)  # Read 1MB
+
+        # Verify we got the expected data
+        assert len(data) == 1024 * 1024, f"Expected 1MB, got {len(data)} bytes"
+        assert_payload_equal(
+            data, memoryview(test_content)[: 1024 * 1024], "Data should match first 1MB of test content"
+        )
+
+    # Chunk downloads must use bounded ranges, never open-ended "bytes=N-" requests
+    assert get_object_ranges == [f"bytes=0-{1024 * 1024 - 1}"]
+
+    # Check if chunk0 was created (chunks are stored directly in origin directory)
+    chunk0_path = cache_paths(cache_dir, test_file_path).chunk_path(0)
+
+    chunk0_size = cached_file_size(chunk0_path)
+    assert chunk0_size is not None, "Chunk 0 should be created in cache"
+    assert chunk0_size == 1024 * 1024, f"Chunk should contain 1MB, got {chunk0_size} bytes"
+
+    # Verify chunk0 contains the correct data (1MB)
+    with open(chunk0_path, "rb") as f:
+        chunk_data = f.read()
+    assert_payload_equal(
+        chunk_data, memoryview(test_content)[: 1024 * 1024], "Chunk data should match first 1MB of test content"
+    )
+
+    # Verify xattrs are set correctly
+    try:
+        import xattr
+
+        etag_attr = xattr.getxattr(chunk0_path, "user.etag")
+        cache_line_size_attr = xattr.getxattr(chunk0_path, "user.cache_line_size")
+        size_attr = xattr.getxattr(chunk0_path, "user.size")
+
+        assert etag_attr is not None, "ETag xattr should be set"
+        assert cache_line_size_attr.decode("utf-8") == "1048576", "Cache line size xattr should be 1MB"
+        assert size_attr.decode("utf-8") == str(len(test_content)), "Size xattr should be total file size (3MB)"
+    except (OSError, AttributeError):
+        # xattrs not supported on this system, skip xattr verification
+        pass
+
+
+def test_open_inherits_prefetch_file_false_from_cache_config(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+):
     """Test that open() uses partial file caching when cache.prefetch_file is false."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        config["cache"]["prefetch_file"] = False
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    config["cache"]["prefetch_file"] = False
 
-        client = StorageClient(StorageClientConfig.from_dict(config, profile="origin"))
+    client = StorageClient(StorageClientConfig.from_dict(config, profile="origin"))
 
-        test_content = b"X" * (3 * 1024 * 1024)
-        test_file_path = "config_prefetch_false.bin"
-        client.write(test_file_path, test_content)
+    test_content = FILLER_DATA_3MB
+    test_file_path = f"test-data-{uuid.uuid4()}/config_prefetch_false.bin"
+    client.write(test_file_path, test_content)
 
-        with client.open(test_file_path, "rb") as f:
-            data = f.read(1024 * 1024)
+    with client.open(test_file_path, "rb") as f:
+        data = f.read(1024 * 1024)
 
-        assert data == test_content[: 1024 * 1024]
+    assert data == memoryview(test_content)[: 1024 * 1024]
 
-        origin_dir = os.path.join(cache_dir, "origin")
-        chunk0_path = os.path.join(origin_dir, f".{test_file_path}#chunk0")
-        full_cache_path = os.path.join(origin_dir, test_file_path)
+    paths = cache_paths(cache_dir, test_file_path)
 
-        assert os.path.exists(chunk0_path), "Chunk 0 should be created when prefetch_file is inherited as false"
-        assert os.path.getsize(chunk0_path) == 1024 * 1024
-        assert not os.path.exists(full_cache_path), "Full file should not be cached for partial open reads"
+    chunk0_size = cached_file_size(paths.chunk_path(0))
+    assert chunk0_size is not None, "Chunk 0 should be created when prefetch_file is inherited as false"
+    assert chunk0_size == 1024 * 1024
+    assert not os.path.exists(paths.full_path), "Full file should not be cached for partial open reads"
 
 
-def test_open_explicit_prefetch_file_true_overrides_cache_config():
+def test_open_explicit_prefetch_file_true_overrides_cache_config(
+    origin_store: tempdatastore.TemporaryDataStore, cache_dir: str
+):
     """Test that explicit prefetch_file=True overrides cache.prefetch_file=false."""
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        config = create_partial_caching_config(origin_store, cache_location=cache_dir)
-        config["cache"]["prefetch_file"] = False
+    config = create_partial_caching_config(origin_store, cache_location=cache_dir)
+    config["cache"]["prefetch_file"] = False
 
-        client = StorageClient(StorageClientConfig.from_dict(config, profile="origin"))
+    client = StorageClient(StorageClientConfig.from_dict(config, profile="origin"))
 
-        test_content = b"X" * (3 * 1024 * 1024)
-        test_file_path = "explicit_prefetch_true.bin"
-        client.write(test_file_path, test_content)
+    test_content = FILLER_DATA_3MB
+    test_file_path = f"test-data-{uuid.uuid4()}/explicit_prefetch_true.bin"
+    client.write(test_file_path, test_content)
 
-        with client.open(test_file_path, "rb", prefetch_file=True) as f:
-            data = f.read(1024 * 1024)
+    with client.open(test_file_path, "rb", prefetch_file=True) as f:
+        data = f.read(1024 * 1024)
 
-        assert data == test_content[: 1024 * 1024]
+    assert data == memoryview(test_content)[: 1024 * 1024]
 
-        origin_dir = os.path.join(cache_dir, "origin")
-        chunk0_path = os.path.join(origin_dir, f".{test_file_path}#chunk0")
-        full_cache_path = os.path.join(origin_dir, test_file_path)
+    paths = cache_paths(cache_dir, test_file_path)
 
-        assert os.path.exists(full_cache_path), "Full file should be cached when explicitly prefetching"
-        assert os.path.getsize(full_cache_path) == len(test_content)
-        assert not os.path.exists(chunk0_path), "Chunk cache should not be used when explicit prefetch wins"
+    full_file_size = cached_file_size(paths.full_path)
+    assert full_file_size is not None, "Full file should be cached when explicitly prefetching"
+    assert full_file_size == len(test_content)
+    assert not os.path.exists(paths.chunk_path(0)), "Chunk cache should not be used when explicit prefetch wins"
 
 
-def test_chunk_download_lock_file_cleanup():
+def test_chunk_download_lock_file_cleanup(origin_store: tempdatastore.TemporaryDataStore, cache_dir: str):
     """Test that lock files are automatically cleaned up when FileLock context manager exits.
 
     This test verifies that when _download_missing_chunks completes, the lock files
     created by the FileLock context manager are automatically cleaned up.
     """
 
-    with tempdatastore.TemporaryAWSS3Bucket() as origin_store, tempfile.TemporaryDirectory() as cache_dir:
-        # Create configuration with partial file caching enabled
-        config = {
-            "profiles": {
-                "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
-            },
-            "cache": {
-                "size": "10M",
-                "location": cache_dir,
-                "cache_line_size": "1M",  # 1MB cache lines for testing
-                "check_source_version": True,
-                "eviction_policy": {
-                    "policy": "lru",
-                    "refresh_interval": 300,
-                },
+    # Create configuration with partial file caching enabled
+    config = {
+        "profiles": {
+            "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
+        },
+        "cache": {
+            "size": "10M",
+            "location": cache_dir,
+            "cache_line_size": "1M",  # 1MB cache lines for testing
+            "check_source_version": True,
+            "eviction_policy": {
+                "policy": "lru",
+                "refresh_interval": 300,
             },
-        }
+        },
+    }
 
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        # Create a test file
-        file_path = f"test-data-{uuid.uuid4()}/lock_cleanup_test.bin"
-        test_content = create_test_data(2)  # 2MB file
-        client.write(file_path, test_content)
+    # Create a test file
+    file_path = f"test-data-{uuid.uuid4()}/lock_cleanup_test.bin"
+    test_content = shared_test_data(2)  # 2MB file
+    client.write(file_path, test_content)
 
-        # Ensure the cache directory structure exists
-        cache_dir = os.path.join(config["cache"]["location"], "origin")
-        os.makedirs(cache_dir, exist_ok=True)
+    # Ensure the cache directory structure exists
+    os.makedirs(os.path.join(cache_dir, "origin"), exist_ok=True)
 
-        # Read a byte range to trigger chunk download
-        byte_range = Range(offset=0, size=512 * 1024)  # 512KB starting at beginning
-        result = client.read(file_path, byte_range=byte_range)
+    # Read a byte range to trigger chunk download
+    byte_range = Range(offset=0, size=512 * 1024)  # 512KB starting at beginning
+    result = client.read(file_path, byte_range=byte_range)
 
-        # Verify we got the expected data
-        assert result == test_content[byte_range.offset : byte_range.offset + byte_range.size]
+    # Verify we got the expected data
+    assert result == memoryview(test_content)[byte_range.offset : byte_range.offset + byte_range.size]
 
-        # Check that chunk files were created
-        file_dir = os.path.join(cache_dir, os.path.dirname(file_path))
-        base_name = os.path.basename(file_path)
-        chunk0_path = os.path.join(file_dir, f".{base_name}#chunk0")
-        assert os.path.exists(chunk0_path), "Chunk 0 should exist after range read"
+    # Check that chunk files were created
+    paths = cache_paths(cache_dir, file_path)
+    snapshot = snapshot_cache_dir(paths.file_dir)
+    assert paths.chunk_name(0) in snapshot, "Chunk 0 should exist after range read"
 
-        # Verify that NO lock files remain after chunk download completes
-        lock_files = [f for f in os.listdir(file_dir) if f.endswith(".lock")]
-        assert len(lock_files) == 0, f"Expected no lock files after chunk download, found: {lock_files}"
+    # Verify that NO lock files remain after chunk download completes
+    lock_files = [name for name in snapshot if name.endswith(".lock")]
+    assert len(lock_files) == 0, f"Expected no lock files after chunk download, found: {lock_files}"
 
-        # Specifically check that the chunk lock file doesn't exist
-        chunk_lock_path = os.path.join(file_dir, f".{base_name}#chunk0.lock")
-        assert not os.path.exists(chunk_lock_path), "Chunk lock file should be automatically cleaned up"
+    # Specifically check that the chunk lock file doesn't exist
+    assert f"{paths.chunk_name(0)}.lock" not in snapshot, "Chunk lock file should be automatically cleaned up"
 
+    # No temporary chunk files are left behind either
+    temp_files = [name for name in snapshot if name.startswith(".chunk_tmp_")]
+    assert not temp_files, f"Expected no temporary chunk files after chunk download, found: {temp_files}"
 
-def test_cache_directory_structure():
+
+def test_cache_directory_structure(origin_store: tempdatastore.TemporaryDataStore, cache_dir: str):
     """Test that cache directory structure does not create unnecessary intermediate folders.
 
     This test verifies that the cache should not create folders outside the cache directory.
@@ -939,95 +960,72 @@ def test_cache_directory_structure():
     without creating a full nested structure that mirrors the original path exactly.
     """
 
-    with (
-        tempdatastore.TemporaryAWSS3Bucket() as origin_store,
-        tempfile.TemporaryDirectory(prefix="msc_cache_") as temp_cache_dir,
-    ):
-        # Create configuration with partial file caching enabled
-        config = {
-            "profiles": {
-                "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
-            },
-            "cache": {
-                "size": "10M",
-                "location": temp_cache_dir,
-                "cache_line_size": "1M",  # 1MB cache lines for testing
-                "check_source_version": True,
-                "eviction_policy": {
-                    "policy": "lru",
-                    "refresh_interval": 300,
-                },
+    # Create configuration with partial file caching enabled
+    config = {
+        "profiles": {
+            "origin": origin_store.profile_config_dict() | {"caching_enabled": True},
+        },
+        "cache": {
+            "size": "10M",
+            "location": cache_dir,
+            "cache_line_size": "1M",  # 1MB cache lines for testing
+            "check_source_version": True,
+            "eviction_policy": {
+                "policy": "lru",
+                "refresh_interval": 300,
             },
-        }
-
-        client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
-
-        # Create a test file with a nested path structure
-        file_path = "tmp/footest/A/B/C/structure_test.bin"
-        test_content = create_test_data(2)  # 2MB file
-        client.write(file_path, test_content)
-
-        # Ensure the cache directory structure exists
-        cache_dir = os.path.join(config["cache"]["location"], "origin")
-        os.makedirs(cache_dir, exist_ok=True)
-
-        # Read a byte range to trigger chunk download and cache creation
-        byte_range = Range(offset=0, size=512 * 1024)  # 512KB starting at beginning
-        result = client.read(file_path, byte_range=byte_range)
-
-        # Verify we got the expected data
-        assert result == test_content[byte_range.offset : byte_range.offset + byte_range.size]
+        },
+    }
 
-        # Check the cache directory structure
-        expected_chunk_path = os.path.join(
-            cache_dir, os.path.dirname(file_path), f".{os.path.basename(file_path)}#chunk0"
-        )
+    client = StorageClient(config=StorageClientConfig.from_dict(config, profile="origin"))
 
-        # Verify the expected cache structure exists
-        assert os.path.exists(expected_chunk_path), f"Expected chunk at {expected_chunk_path}"
+    # Create a test file with a nested path structure
+    file_path = f"tmp/footest/A/B/C/structure_test-{uuid.uuid4()}.bin"
+    test_content = shared_test_data(2)  # 2MB file
+    client.write(file_path, test_content)
 
-        # Verify the directory structure is correct
-        expected_dir = os.path.join(cache_dir, "tmp", "footest", "A", "B", "C")
-        assert os.path.exists(expected_dir), f"Expected directory structure at {expected_dir}"
+    # Ensure the cache directory structure exists
+    profile_cache_dir = os.path.join(config["cache"]["location"], "origin")
+    os.makedirs(profile_cache_dir, exist_ok=True)
 
-        # The cache creates the full path structure, which is the expected behavior
-        # This documents the current behavior for future reference
+    # Read a byte range to trigger chunk download and cache creation
+    byte_range = Range(offset=0, size=512 * 1024)  # 512KB starting at beginning
+    result = client.read(file_path, byte_range=byte_range)
 
-        # Verify that the chunk file exists (regardless of the directory structure approach)
-        assert os.path.exists(expected_chunk_path), f"Expected chunk at {expected_chunk_path}"
+    # Verify we got the expected data
+    assert result == memoryview(test_content)[byte_range.offset : byte_range.offset + byte_range.size]
 
-        # The current implementation creates the full path structure, so we verify it exists
-        # This documents the current behavior, which may be improved in the future
-        assert os.path.exists(expected_dir), f"Expected directory structure at {expected_dir}"
+    # The cache mirrors the full object key under the profile directory, so the chunk lands in tmp/footest/A/B/C
+    expected_dir = os.path.join(profile_cache_dir, "tmp", "footest", "A", "B", "C")
+    full_cache_path = os.path.join(profile_cache_dir, file_path)
+    assert os.path.dirname(full_cache_path) == expected_dir
 
-        # Verify the full path structure is preserved
-        full_cache_path = os.path.join(cache_dir, file_path)
-        full_cache_dir = os.path.dirname(full_cache_path)
-        assert os.path.exists(full_cache_dir), f"Expected full cache directory structure at {full_cache_dir}"
+    # A single directory scan confirms both the directory structure and the chunk inside it
+    expected_chunk_name = f".{os.path.basename(file_path)}#chunk0"
+    snapshot = snapshot_cache_dir(expected_dir)
+    assert expected_chunk_name in snapshot, f"Expected chunk {expected_chunk_name} in {expected_dir}"
 
-        # CRITICAL: Verify that files are ONLY written to cache, NOT to the original path structure
-        # The cache should not create any files outside the cache directory
+    # CRITICAL: Verify that files are ONLY written to cache, NOT to the original path structure
+    # The cache should not create any files outside the cache directory
 
-        # Check that the specific path structure does NOT exist in the filesystem
-        # e.g., tmp/footest/A/B/C/foo.txt should NOT exist at /tmp/footest/A/B/C/foo.txt
-        # But we need to be careful not to check system directories like /tmp
+    # Check that the specific path structure does NOT exist in the filesystem
+    # e.g., tmp/footest/A/B/C/foo.txt should NOT exist at /tmp/footest/A/B/C/foo.txt
+    # But we need to be careful not to check system directories like /tmp
 
-        # Check the full original path doesn't exist (this is the key test)
-        full_original_path = os.path.join("/", file_path)
-        assert not os.path.exists(full_original_path), (
-            f"ERROR: Cache created {full_original_path} outside cache directory!"
-        )
+    # Check the full original path doesn't exist (this is the key test)
+    full_original_path = os.path.join("/", file_path)
+    assert not os.path.exists(full_original_path), f"ERROR: Cache created {full_original_path} outside cache directory!"
 
-        # Check that the specific nested path doesn't exist
-        # /tmp/footest should not exist (assuming /tmp exists but /tmp/footest should not)
-        footest_path = "/tmp/footest"
-        assert not os.path.exists(footest_path), f"ERROR: Cache created {footest_path} outside cache directory!"
+    # Check that the specific nested path doesn't exist
+    # /tmp/footest should not exist (assuming /tmp exists but /tmp/footest should not)
+    footest_path = "/tmp/footest"
+    assert not os.path.exists(footest_path), f"ERROR: Cache created {footest_path} outside cache directory!"
 
-        # Check that the full nested structure doesn't exist
-        full_nested_path = "/tmp/footest/A/B/C"
-        assert not os.path.exists(full_nested_path), f"ERROR: Cache created {full_nested_path} outside cache directory!"
+    # Check that the full nested structure doesn't exist
+    full_nested_path = "/tmp/footest/A/B/C"
+    assert not os.path.exists(full_nested_path), f"ERROR: Cache created {full_nested_path} outside cache directory!"
 
-        # Verify that the cache path resolution works correctly
-        # The cache should mirror the original file path structure
-        relative_path = os.path.relpath(full_cache_path, cache_dir)
-        assert relative_path == file_path, f"Cache path structure mismatch: expected {file_path}, got {relative_path}"
+    # Verify that the cache path resolution works correctly
+    # The cache should mirror the original file path structure
+    relative_path = os.path.relpath(full_cache_path, profile_cache_dir)
+    assert relative_path == file_path, f"Cache path structure mismatch: expected {file_path}, got {relative_path}"
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import fnmatch
+import os
 
 from multistorageclient.types import PatternType
 from multistorageclient.utils import PatternMatcher
@@ -189,6 +191,67 @@ class TestPatternMatcher:
         assert matcher.should_include_file("file.txt") is True
         assert matcher.should_include_file("file.jpg") is True
 
+    def test_interleaved_pattern_runs(self):
+        """Test that the last matching pattern wins across alternating include/exclude runs."""
+        matcher = PatternMatcher(
+            [
+                (PatternType.EXCLUDE, "*.log"),
+                (PatternType.EXCLUDE, "*.tmp"),
+                (PatternType.INCLUDE, "keep/*"),
+                (PatternType.INCLUDE, "important.*"),
+                (PatternType.EXCLUDE, "keep/*.tmp"),
+            ]
+        )
+
+        # Excluded by the first run, not re-included
+        assert matcher.should_include_file("debug.log") is False
+        assert matcher.should_include_file("scratch.tmp") is False
+
+        # Re-included by the second run
+        assert matcher.should_include_file("keep/debug.log") is True
+        assert matcher.should_include_file("important.log") is True
+
+        # Excluded again by the last run
+        assert matcher.should_include_file("keep/scratch.tmp") is False
+
+        # Matching nothing falls back to the default
+        assert matcher.should_include_file("file.txt") is True
+
+    def test_literal_patterns_match_like_globs(self):
+        """Test that literal, prefix and suffix patterns match exactly the paths their glob form matches."""
+        patterns = ["*", "*.jpg", "images/*", "important.log", "", "*.tar.gz", "a*b", "?ile.txt", "[fi]ile.txt"]
+        paths = [
+            "",
+            "file.txt",
+            "image.jpg",
+            "images/cat.jpg",
+            "images",
+            "archive.tar.gz",
+            "important.log",
+            "logs/important.log",
+            "ab",
+            "a/b",
+            "line\nbreak.jpg",
+        ]
+
+        for pattern in patterns:
+            matcher = PatternMatcher([(PatternType.EXCLUDE, pattern)])
+            for path in paths:
+                expected = not fnmatch.fnmatchcase(os.path.normcase(path), os.path.normcase(pattern))
+                assert matcher.should_include_file(path) is expected, (pattern, path)
+
+    def test_glob_patterns_are_compiled_once(self):
+        """Test that matchers built from the same glob patterns share one compiled regular expression."""
+        patterns = [(PatternType.EXCLUDE, "logs/*.tmp"), (PatternType.EXCLUDE, "?ache/[0-9]*")]
+        first_matcher = PatternMatcher(patterns)
+        second_matcher = PatternMatcher(patterns)
+
+        assert first_matcher._pattern_runs[0].regex is not None
+        assert first_matcher._pattern_runs[0].regex is second_matcher._pattern_runs[0].regex
+        assert second_matcher.should_include_file("logs/debug.tmp") is False
+        assert second_matcher.should_include_file("cache/1.bin") is False
+        assert second_matcher.should_include_file("logs/debug.log") is True
+
     def test_repr(self):
         """Test string representation of PatternMatcher."""
         matcher = PatternMatcher(
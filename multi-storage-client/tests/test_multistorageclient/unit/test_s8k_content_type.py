@@ -16,52 +16,79 @@
 """Unit tests for S8K content type inference."""
 
 import io
-import tempfile
-from unittest.mock import MagicMock, patch
+import mimetypes
+from typing import Any
 
 import pytest
 
+from multistorageclient.providers import s8k
 from multistorageclient.providers.s8k import S8KStorageProvider
 
+pytestmark = pytest.mark.fast
+
+
+class FakeS3Client:
+    """Minimal stand-in for the boto3 S3 client that records the keyword arguments of each put_object call."""
+
+    def __init__(self):
+        self.put_object_calls: list[dict[str, Any]] = []
+
+    def put_object(self, **kwargs: Any) -> dict[str, Any]:
+        self.put_object_calls.append(kwargs)
+        return {"ResponseMetadata": {"HTTPHeaders": {}}}
+
+    def upload_file(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        return {"ResponseMetadata": {"HTTPHeaders": {}}}
+
+    def upload_fileobj(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+@pytest.fixture(scope="module")
+def fake_s3_client():
+    """Create a fake S3 client shared by the tests in this module."""
+    return FakeS3Client()
+
+
+@pytest.fixture(scope="module")
+def fake_s3_client_factory(fake_s3_client):
+    """Make providers created in this module use the fake S3 client instead of building a boto3 one."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(S8KStorageProvider, "_create_s3_client", lambda self, **kwargs: fake_s3_client)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_s3_client(fake_s3_client):
+    """Clear recorded calls so each test only sees its own."""
+    fake_s3_client.put_object_calls.clear()
+
+
+@pytest.fixture(scope="module")
+def s8k_provider_with_inference(fake_s3_client_factory):
+    """Create S8K provider with content type inference enabled."""
+    return S8KStorageProvider(
+        base_path="test-bucket",
+        region_name="us-east-1",
+        endpoint_url="https://test-endpoint.com",
+        infer_content_type=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def s8k_provider_without_inference(fake_s3_client_factory):
+    """Create S8K provider without content type inference."""
+    return S8KStorageProvider(
+        base_path="test-bucket",
+        region_name="us-east-1",
+        endpoint_url="https://test-endpoint.com",
+        infer_content_type=False,
+    )
+
 
 class TestS8KContentTypeInference:
     """Test suite for content type inference in S8K storage provider."""
 
-    @pytest.fixture
-    def mock_s3_client(self):
-        """Create a mock S3 client."""
-        client = MagicMock()
-        client.put_object.return_value = {"ResponseMetadata": {"HTTPHeaders": {}}}
-        client.upload_file.return_value = {"ResponseMetadata": {"HTTPHeaders": {}}}
-        client.upload_fileobj.return_value = None
-        return client
-
-    @pytest.fixture
-    def s8k_provider_with_inference(self, mock_s3_client):
-        """Create S8K provider with content type inference enabled."""
-        with patch("multistorageclient.providers.s3.boto3.client", return_value=mock_s3_client):
-            provider = S8KStorageProvider(
-                base_path="test-bucket",
-                region_name="us-east-1",
-                endpoint_url="https://test-endpoint.com",
-                infer_content_type=True,
-            )
-            provider._s3_client = mock_s3_client
-            return provider
-
-    @pytest.fixture
-    def s8k_provider_without_inference(self, mock_s3_client):
-        """Create S8K provider without content type inference."""
-        with patch("multistorageclient.providers.s3.boto3.client", return_value=mock_s3_client):
-            provider = S8KStorageProvider(
-                base_path="test-bucket",
-                region_name="us-east-1",
-                endpoint_url="https://test-endpoint.com",
-                infer_content_type=False,
-            )
-            provider._s3_client = mock_s3_client
-            return provider
-
     def test_guess_content_type_enabled(self, s8k_provider_with_inference):
         """Test content type inference when enabled."""
         # Test various file types
@@ -82,40 +109,59 @@ class TestS8KContentTypeInference:
         # Unknown extensions should return None
         assert s8k_provider_with_inference._guess_content_type("file.unknown123") is None
 
+    @pytest.mark.parametrize(
+        "file_path",
+        ["file.wav", "dir/FILE.WAV", "archive.tar.gz", "shard.00001.tar", "dir.v2/file", ".json", "dir/.hidden.png"],
+    )
+    def test_guess_content_type_matches_mimetypes(self, s8k_provider_with_inference, file_path):
+        """Test that cached inference by suffix agrees with mimetypes on the full path."""
+        assert s8k_provider_with_inference._guess_content_type(file_path) == mimetypes.guess_type(file_path)[0]
+
+    def test_guess_content_type_is_cached_per_suffix(self, s8k_provider_with_inference):
+        """Test that paths sharing a suffix reuse one cached lookup."""
+        s8k._guess_content_type_from_suffixes.cache_clear()
+
+        for i in range(10):
+            assert s8k_provider_with_inference._guess_content_type(f"dir-{i}/file-{i}.wav") == "audio/x-wav"
+
+        cache_info = s8k._guess_content_type_from_suffixes.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 9)
+
+    def test_content_type_table_matches_mimetypes_defaults(self):
+        """Test that the fixed extension table agrees with the defaults built into mimetypes."""
+        # A fresh MimeTypes instance only holds the built-in defaults, not the host's mime.types files
+        default_mimetypes = mimetypes.MimeTypes()
+        for extension, content_type in s8k._CONTENT_TYPES_BY_EXTENSION.items():
+            assert default_mimetypes.guess_type(f"file.{extension}")[0] == content_type, extension
+
     def test_put_object_with_content_type_inference(self, s8k_provider_with_inference):
         """Test put_object with content type inference."""
         s8k_provider_with_inference._put_object("test-bucket/file.wav", b"test data")
 
         # Verify put_object was called with ContentType
-        call_args = s8k_provider_with_inference._s3_client.put_object.call_args
-        assert call_args[1]["ContentType"] == "audio/x-wav"
-        assert call_args[1]["Key"] == "file.wav"
+        put_object_kwargs = s8k_provider_with_inference._s3_client.put_object_calls[-1]
+        assert put_object_kwargs["ContentType"] == "audio/x-wav"
+        assert put_object_kwargs["Key"] == "file.wav"
 
     def test_put_object_without_content_type_inference(self, s8k_provider_without_inference):
         """Test put_object without content type inference."""
         s8k_provider_without_inference._put_object("test-bucket/file.wav", b"test data")
 
         # Verify put_object was called without ContentType
-        call_args = s8k_provider_without_inference._s3_client.put_object.call_args
-        assert "ContentType" not in call_args[1]
+        put_object_kwargs = s8k_provider_without_inference._s3_client.put_object_calls[-1]
+        assert "ContentType" not in put_object_kwargs
 
-    def test_upload_file_from_path_with_inference(self, s8k_provider_with_inference):
+    def test_upload_file_from_path_with_inference(self, s8k_provider_with_inference, tmp_path):
         """Test upload_file from file path with content type inference."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"test audio data")
-            temp_path = f.name
-
-        try:
-            # Small file test (uses put_object internally)
-            s8k_provider_with_inference._upload_file("test-bucket/audio.wav", temp_path)
+        file_path = tmp_path / "audio.wav"
+        file_path.write_bytes(b"test audio data")
 
-            # Verify put_object was called with ContentType
-            call_args = s8k_provider_with_inference._s3_client.put_object.call_args
-            assert call_args[1]["ContentType"] == "audio/x-wav"
-        finally:
-            import os
+        # Small file test (uses put_object internally)
+        s8k_provider_with_inference._upload_file("test-bucket/audio.wav", str(file_path))
 
-            os.unlink(temp_path)
+        # Verify put_object was called with ContentType
+        put_object_kwargs = s8k_provider_with_inference._s3_client.put_object_calls[-1]
+        assert put_object_kwargs["ContentType"] == "audio/x-wav"
 
     def test_upload_file_from_fileobj_with_inference(self, s8k_provider_with_inference):
         """Test upload_file from file object with content type inference."""
@@ -125,5 +171,5 @@ class TestS8KContentTypeInference:
         s8k_provider_with_inference._upload_file("test-bucket/data.json", file_obj)
 
         # Verify put_object was called with ContentType inferred from remote path
-        call_args = s8k_provider_with_inference._s3_client.put_object.call_args
-        assert call_args[1]["ContentType"] == "application/json"
+        put_object_kwargs = s8k_provider_with_inference._s3_client.put_object_calls[-1]
+        assert put_object_kwargs["ContentType"] == "application/json"
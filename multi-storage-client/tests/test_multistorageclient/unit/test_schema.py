@@ -13,10 +13,244 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import jsonschema
 import pytest
 
+from multistorageclient import schema
 from multistorageclient.config import STORAGE_PROVIDER_MAPPING
-from multistorageclient.schema import validate_config
+from multistorageclient.schema import BENCHMARK_SCHEMA, CONFIG_SCHEMA, validate_benchmark_config, validate_config
+
+pytestmark = pytest.mark.fast
+
+STORAGE_PROVIDERS = tuple(sorted(STORAGE_PROVIDER_MAPPING))
+
+DEFAULT_STORAGE_PROVIDER = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
+BASE_CONFIG = {"profiles": {"default": DEFAULT_STORAGE_PROVIDER}}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_validators():
+    # Build the cached validators up front so their one-time cost isn't attributed to the first test.
+    validate_config(BASE_CONFIG)
+    schema._benchmark_validator()
+
+
+VALID_CONFIGS = [
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "cache": {"eviction_policy": {"policy": "no_eviction"}},
+        },
+        id="cache_no_eviction",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "cache": {
+                "size": "50M",
+                "check_source_version": True,
+                "location": "/path/to/cache",
+                "eviction_policy": {
+                    "policy": "FIFO",
+                    "refresh_interval": 1,
+                },
+            },
+        },
+        id="cache_full",
+    ),
+    pytest.param(
+        {
+            "profiles": {
+                "default": {**DEFAULT_STORAGE_PROVIDER, "caching_enabled": True},
+            }
+        },
+        id="caching_enabled_true",
+    ),
+    pytest.param(
+        {
+            "profiles": {
+                "default": {**DEFAULT_STORAGE_PROVIDER, "caching_enabled": False},
+            }
+        },
+        id="caching_enabled_false",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "opentelemetry": {"metrics": {"exporter": {"type": "console"}}},
+        },
+        id="opentelemetry_metrics",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "msc-fuse-mount",
+            },
+        },
+        id="posix_minimal",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "msc-fuse-mount",
+                "mountpoint": "/mnt/msc",
+                "allow_other": True,
+                "auto_sighup_interval": 300,
+            },
+        },
+        id="posix_full",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "mountpoint": "/mnt",
+                "allow_other": False,
+                "auto_sighup_interval": 0,
+            },
+        },
+        id="posix_default_values",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountpoint": "/mnt/msc",
+                "allow_other": True,
+            },
+        },
+        id="posix_without_mountname",
+    ),
+]
+
+INVALID_CONFIGS = [
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "cache": {
+                "my_prop1": False,
+                "my_prop2": "x",
+            },
+        },
+        id="cache_unknown_properties",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "cache": {
+                "eviction_policy": {
+                    "policy": "FIFO",
+                    "refresh_interval": 0,
+                }
+            },
+        },
+        id="cache_zero_refresh_interval",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "cache": {
+                "eviction_policy": "no_eviction"  # String format is no longer supported
+            },
+        },
+        id="cache_string_eviction_policy",
+    ),
+    pytest.param(
+        {
+            "profiles": {
+                "default": {**DEFAULT_STORAGE_PROVIDER, "caching_enabled": "true"},
+            }
+        },
+        id="caching_enabled_string",
+    ),
+    pytest.param(
+        {
+            "profiles": {
+                "default": {**DEFAULT_STORAGE_PROVIDER, "caching_enabled": 1},
+            }
+        },
+        id="caching_enabled_integer",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "opentelemetry": {"logs": {"exporter": {"type": "console"}}},
+        },
+        id="opentelemetry_unknown_properties",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": 123,  # Should be string
+            },
+        },
+        id="posix_mountname_integer",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "allow_other": "true",  # Should be boolean
+            },
+        },
+        id="posix_allow_other_string",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "auto_sighup_interval": -1,  # Should be >= 0
+            },
+        },
+        id="posix_negative_auto_sighup_interval",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "mountpoint": "relative/path",  # Should be absolute path
+            },
+        },
+        id="posix_relative_mountpoint",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "mountpoint": "/mnt//msc",  # Double slashes not allowed
+            },
+        },
+        id="posix_mountpoint_double_slash",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "mountpoint": "/mnt\0msc",  # Null character not allowed
+            },
+        },
+        id="posix_mountpoint_null_character",
+    ),
+    pytest.param(
+        {
+            **BASE_CONFIG,
+            "posix": {
+                "mountname": "test-mount",
+                "unknown_property": "value",  # Not allowed
+            },
+        },
+        id="posix_unknown_property",
+    ),
+]
 
 
 def test_validate_profiles():
@@ -34,43 +268,57 @@ def test_validate_profiles():
             {
                 "profiles": {
                     "default": {
-                        "storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}},
+                        **DEFAULT_STORAGE_PROVIDER,
                         "provider_bundle": {"type": "module.MyProviderBundle", "options": {}},
                     }
                 }
             }
         )
 
-    # Valid configurations
-    for provider in STORAGE_PROVIDER_MAPPING:
-        validate_config(
-            {
-                "profiles": {
-                    "default": {"storage_provider": {"type": provider, "options": {"base_path": "bucket/prefix"}}}
-                }
-            }
-        )
 
-    # Valid configurations for s3 and swiftstack with Rust client options
-    for provider in ("s3", "s8k"):
-        validate_config(
-            {
-                "profiles": {
-                    "default": {
-                        "storage_provider": {
-                            "type": provider,
-                            "options": {
-                                "base_path": "bucket/prefix",
-                                "endpoint_url": "http://localhost:9000",
-                                "rust_client": {
-                                    "allow_http": True,
-                                },
+@pytest.mark.parametrize("provider", STORAGE_PROVIDERS)
+def test_validate_profiles_storage_provider(provider: str):
+    validate_config(
+        {"profiles": {"default": {"storage_provider": {"type": provider, "options": {"base_path": "bucket/prefix"}}}}}
+    )
+
+
+@pytest.mark.parametrize("provider", ["s3", "s8k"])
+def test_validate_profiles_rust_client_options(provider: str):
+    validate_config(
+        {
+            "profiles": {
+                "default": {
+                    "storage_provider": {
+                        "type": provider,
+                        "options": {
+                            "base_path": "bucket/prefix",
+                            "endpoint_url": "http://localhost:9000",
+                            "rust_client": {
+                                "allow_http": True,
                             },
-                        }
+                        },
                     }
                 }
             }
-        )
+        }
+    )
+
+
+def test_validate_config_reports_jsonschema_error():
+    config = {"profiles": {"default": {"storage_provider": {"type": "file"}}}, "cache": {"size": "10X"}}
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance=config, schema=CONFIG_SCHEMA)
+
+    # Repeated validations reuse one validator and still report the same error as jsonschema.validate()
+    for _ in range(2):
+        with pytest.raises(RuntimeError) as actual:
+            validate_config(config)
+        error = actual.value.args[1]
+        assert isinstance(error, jsonschema.ValidationError)
+        assert error.message == expected.value.message
+        assert list(error.absolute_path) == list(expected.value.absolute_path)
 
 
 def test_validate_storage_provider_profiles():
@@ -119,7 +367,7 @@ def test_validate_storage_provider_profiles():
             {
                 "profiles": {
                     "composite": {
-                        "storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}},
+                        **DEFAULT_STORAGE_PROVIDER,
                         "storage_provider_profiles": ["loc1", "loc2"],
                         **metadata_provider,
                     }
@@ -155,56 +403,11 @@ def test_validate_storage_provider_profiles():
         )
 
 
-def test_validate_cache():
-    default_storage_provider = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
-
-    # Invalid: incorrect properties
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "cache": {
-                    "my_prop1": False,
-                    "my_prop2": "x",
-                },
-            }
-        )
-
-    # Valid configurations
-    validate_config(
-        {
-            "profiles": {
-                "default": default_storage_provider,
-            },
-            "cache": {"eviction_policy": {"policy": "no_eviction"}},
-        }
-    )
-
-    validate_config(
-        {
-            "profiles": {
-                "default": default_storage_provider,
-            },
-            "cache": {
-                "size": "50M",
-                "check_source_version": True,
-                "location": "/path/to/cache",
-                "eviction_policy": {
-                    "policy": "FIFO",
-                    "refresh_interval": 1,
-                },
-            },
-        }
-    )
-
+def test_validate_cache_rejects_use_etag():
     with pytest.raises(ValueError, match="cache.use_etag is no longer supported.*cache.check_source_version"):
         validate_config(
             {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
+                **BASE_CONFIG,
                 "cache": {
                     "size": "50M",
                     "use_etag": True,
@@ -213,275 +416,32 @@ def test_validate_cache():
             }
         )
 
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "cache": {
-                    "eviction_policy": {
-                        "policy": "FIFO",
-                        "refresh_interval": 0,
-                    }
-                },
-            }
-        )
-
-    # Test invalid eviction policy format
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "cache": {
-                    "eviction_policy": "no_eviction"  # String format is no longer supported
-                },
-            }
-        )
 
+@pytest.mark.parametrize("config", VALID_CONFIGS)
+def test_validate_valid_configs(config):
+    validate_config(config)
 
-def test_validate_caching_enabled():
-    """Test that caching_enabled field is properly validated in profiles."""
-    default_storage_provider = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
 
-    # Valid: caching_enabled as boolean
-    validate_config(
-        {
-            "profiles": {
-                "default": {**default_storage_provider, "caching_enabled": True},
-            }
-        }
-    )
-
-    validate_config(
-        {
-            "profiles": {
-                "default": {**default_storage_provider, "caching_enabled": False},
-            }
-        }
-    )
-
-    # Invalid: caching_enabled as string
+@pytest.mark.parametrize("config", INVALID_CONFIGS)
+def test_validate_invalid_configs(config):
     with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": {**default_storage_provider, "caching_enabled": "true"},
-                }
-            }
-        )
+        validate_config(config)
 
-    # Invalid: caching_enabled as integer
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": {**default_storage_provider, "caching_enabled": 1},
-                }
-            }
-        )
-
-
-def test_validate_opentelemetry():
-    default_storage_provider = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
-
-    # Invalid: incorrect properties
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "opentelemetry": {"logs": {"exporter": {"type": "console"}}},
-            }
-        )
 
-    # Valid configurations
+@pytest.mark.parametrize("mountpoint", ["/", "/mnt", "/mnt/", "/tmp/msc", "/home/user/mounts", "/var/lib/msc"])
+def test_validate_posix_mountpoint(mountpoint: str):
     validate_config(
         {
-            "profiles": {
-                "default": default_storage_provider,
-            },
-            "opentelemetry": {"metrics": {"exporter": {"type": "console"}}},
-        }
-    )
-
-
-def test_validate_posix():
-    default_storage_provider = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
-
-    # Valid: minimal posix configuration
-    validate_config(
-        {
-            "profiles": {
-                "default": default_storage_provider,
-            },
-            "posix": {
-                "mountname": "msc-fuse-mount",
-            },
-        }
-    )
-
-    # Valid: full posix configuration
-    validate_config(
-        {
-            "profiles": {
-                "default": default_storage_provider,
-            },
-            "posix": {
-                "mountname": "msc-fuse-mount",
-                "mountpoint": "/mnt/msc",
-                "allow_other": True,
-                "auto_sighup_interval": 300,
-            },
-        }
-    )
-
-    # Valid: posix with default values
-    validate_config(
-        {
-            "profiles": {
-                "default": default_storage_provider,
-            },
+            **BASE_CONFIG,
             "posix": {
                 "mountname": "test-mount",
-                "mountpoint": "/mnt",
-                "allow_other": False,
-                "auto_sighup_interval": 0,
+                "mountpoint": mountpoint,
             },
         }
     )
 
-    # Valid: posix without mountname (optional field)
-    validate_config(
-        {
-            "profiles": {
-                "default": default_storage_provider,
-            },
-            "posix": {
-                "mountpoint": "/mnt/msc",
-                "allow_other": True,
-            },
-        }
-    )
-
-    # Valid: posix with various valid mountpoint paths
-    for valid_path in ["/", "/mnt", "/tmp/msc", "/home/user/mounts", "/var/lib/msc"]:
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "mountpoint": valid_path,
-                },
-            }
-        )
-
-    # Invalid: incorrect type for mountname
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": 123,  # Should be string
-                },
-            }
-        )
-
-    # Invalid: incorrect type for allow_other
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "allow_other": "true",  # Should be boolean
-                },
-            }
-        )
-
-    # Invalid: negative auto_sighup_interval
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "auto_sighup_interval": -1,  # Should be >= 0
-                },
-            }
-        )
-
-    # Invalid: relative mountpoint path
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "mountpoint": "relative/path",  # Should be absolute path
-                },
-            }
-        )
-
-    # Invalid: mountpoint with double slashes
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "mountpoint": "/mnt//msc",  # Double slashes not allowed
-                },
-            }
-        )
-
-    # Invalid: mountpoint with null character
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "mountpoint": "/mnt\0msc",  # Null character not allowed
-                },
-            }
-        )
-
-    # Invalid: unknown property
-    with pytest.raises(RuntimeError):
-        validate_config(
-            {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
-                "posix": {
-                    "mountname": "test-mount",
-                    "unknown_property": "value",  # Not allowed
-                },
-            }
-        )
-
 
 def test_validate_include():
-    default_storage_provider = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
-
     # Valid: include with array of strings
     validate_config(
         {
@@ -490,9 +450,7 @@ def test_validate_include():
                 "/common_config/shared_profiles.yaml",
                 "./local_overrides.yaml",
             ],
-            "profiles": {
-                "default": default_storage_provider,
-            },
+            **BASE_CONFIG,
         }
     )
 
@@ -500,9 +458,7 @@ def test_validate_include():
     validate_config(
         {
             "include": ["/path/to/config.yaml"],
-            "profiles": {
-                "default": default_storage_provider,
-            },
+            **BASE_CONFIG,
         }
     )
 
@@ -510,9 +466,7 @@ def test_validate_include():
     validate_config(
         {
             "include": [],
-            "profiles": {
-                "default": default_storage_provider,
-            },
+            **BASE_CONFIG,
         }
     )
 
@@ -521,9 +475,7 @@ def test_validate_include():
         validate_config(
             {
                 "include": "/single/path.yaml",  # Should be array
-                "profiles": {
-                    "default": default_storage_provider,
-                },
+                **BASE_CONFIG,
             }
         )
 
@@ -532,9 +484,7 @@ def test_validate_include():
         validate_config(
             {
                 "include": ["/valid/path.yaml", 123, "/another/path.yaml"],  # 123 is not a string
-                "profiles": {
-                    "default": default_storage_provider,
-                },
+                **BASE_CONFIG,
             }
         )
 
@@ -543,22 +493,28 @@ def test_validate_include():
         validate_config(
             {
                 "include": [{"path": "/config.yaml"}],  # Should be string, not object
-                "profiles": {
-                    "default": default_storage_provider,
-                },
+                **BASE_CONFIG,
             }
         )
 
 
 def test_validate_unknown_top_level_key():
-    default_storage_provider = {"storage_provider": {"type": "s3", "options": {"base_path": "bucket/prefix"}}}
-
     with pytest.raises(RuntimeError):
         validate_config(
             {
-                "profiles": {
-                    "default": default_storage_provider,
-                },
+                **BASE_CONFIG,
                 "typo": True,
             }
         )
+
+
+def test_validate_benchmark_config():
+    validate_benchmark_config({"processes": [8], "threads": [4], "test_object_sizes": {"4MB": 12800}})
+
+    config = {"processes": 8}
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(instance=config, schema=BENCHMARK_SCHEMA)
+
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        validate_benchmark_config(config)
+    assert actual.value.message == expected.value.message
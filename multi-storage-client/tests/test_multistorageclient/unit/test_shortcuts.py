@@ -361,6 +361,17 @@ def test_delete(file_storage_config):
             fp.read()
 
 
+def test_delete_many(file_storage_config):
+    with tempfile.TemporaryDirectory() as tempdir:
+        urls = [f"{MSC_PROTOCOL}__filesystem__{os.path.join(tempdir, f'testfile{i}.bin')}" for i in range(5)]
+        for url in urls:
+            msc.write(url, b"A")
+
+        msc.delete_many(urls[:4])
+
+        assert [msc.is_file(url) for url in urls] == [False, False, False, False, True]
+
+
 def test_is_empty(file_storage_config):
     assert msc.is_empty("/usr/bin") is False
     assert msc.is_empty("/tmp/dir/not/exist")
@@ -14,11 +14,13 @@
 # limitations under the License.
 
 import concurrent.futures
+import hashlib
 import os
 import sys
 import tempfile
 import threading
 import time
+from collections.abc import Iterable
 from typing import cast
 from unittest import mock
 
@@ -30,39 +32,78 @@ from multistorageclient.config import StorageClientConfig
 from multistorageclient.constants import MEMORY_LOAD_LIMIT
 from multistorageclient.providers.base import BaseStorageProvider
 from multistorageclient.providers.manifest_metadata import DEFAULT_MANIFEST_BASE_DIR
-from multistorageclient.types import ExecutionMode, ObjectMetadata, PatternType, SymlinkHandling, SyncError
+from multistorageclient.types import ExecutionMode, ObjectMetadata, PatternType, Range, SymlinkHandling, SyncError
 from test_multistorageclient.unit.utils import config, tempdatastore
 
 
-def get_file_timestamp(uri: str) -> float:
-    client, path = msc.resolve_storage_client(uri)
-    response = client.info(path=path)
-    return response.last_modified.timestamp()
+def get_file_timestamps(url: str, files: Iterable[str]) -> dict[str, float]:
+    client, path = msc.resolve_storage_client(url)
+    return {file: client.info(path=os.path.join(path, file)).last_modified.timestamp() for file in files}
 
 
-def create_local_test_dataset(target_profile: str, expected_files: dict) -> None:
+def wait_for_next_second() -> None:
+    """Sleep past the next whole-second boundary so later writes get strictly later second-granularity timestamps."""
+    time.sleep(1.01 - time.time() % 1)
+
+
+def create_local_test_dataset(target_profile: str, expected_files: dict[str, bytes]) -> None:
     """Creates test files based on expected_files dictionary."""
     target_client, target_path = msc.resolve_storage_client(target_profile)
-    for rel_path, content in expected_files.items():
-        path = os.path.join(target_path, rel_path)
-        target_client.write(path, content.encode("utf-8"))
-
-
-def verify_sync_and_contents(target_url: str, expected_files: dict):
-    """Verifies that all expected files exist in the target storage and their contents are correct."""
-    for file, expected_content in expected_files.items():
-        target_file_url = os.path.join(target_url, file)
-        assert msc.is_file(target_file_url), f"Missing file: {target_file_url}"
-        actual_content = msc.open(target_file_url).read().decode("utf-8")
-        assert actual_content == expected_content, f"Mismatch in file {file}"
-    # Ensure there is nothing in target that is not in expected_files
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(16, len(expected_files)))) as executor:
+        futures = [
+            executor.submit(target_client.write, os.path.join(target_path, rel_path), content)
+            for rel_path, content in expected_files.items()
+        ]
+    for future in futures:
+        future.result()
+
+
+VERIFY_SAMPLE_SIZE = 64 * 1024
+
+
+def expected_digest(content: bytes) -> bytes:
+    """SHA-256 of ``content``, or of its first and last ``VERIFY_SAMPLE_SIZE`` bytes when it is larger than both."""
+    if len(content) <= 2 * VERIFY_SAMPLE_SIZE:
+        return hashlib.sha256(content).digest()
+    return hashlib.sha256(content[:VERIFY_SAMPLE_SIZE] + content[-VERIFY_SAMPLE_SIZE:]).digest()
+
+
+def read_digest(client: StorageClient, path: str, size: int) -> bytes:
+    """Counterpart of :py:func:`expected_digest` that only range-reads the sampled bytes of large files."""
+    if size <= 2 * VERIFY_SAMPLE_SIZE:
+        return hashlib.sha256(client.read(path)).digest()
+    digest = hashlib.sha256(client.read(path, byte_range=Range(offset=0, size=VERIFY_SAMPLE_SIZE)))
+    digest.update(client.read(path, byte_range=Range(offset=size - VERIFY_SAMPLE_SIZE, size=VERIFY_SAMPLE_SIZE)))
+    return digest.digest()
+
+
+def verify_sync_and_contents(target_url: str, expected_files: dict[str, bytes]):
+    """Verifies that the target storage holds exactly the expected files and that their contents are correct."""
     target_client, target_path = msc.resolve_storage_client(target_url)
+    # One listing replaces a HEAD per expected file; hidden temporary files (like .plexihcg) are ignored.
+    actual_files: dict[str, ObjectMetadata] = {}
     for targetf in target_client.list(path=target_path):
         key = targetf.key[len(target_path) :].lstrip("/")
-        # Skip temporary files that start with a dot (like .plexihcg)
         if key.startswith(".") or os.path.basename(key).startswith("."):
             continue
-        assert key in expected_files
+        actual_files[key] = targetf
+
+    missing = expected_files.keys() - actual_files.keys()
+    assert not missing, f"Missing files: {sorted(missing)}"
+    unexpected = actual_files.keys() - expected_files.keys()
+    assert not unexpected, f"Unexpected files: {sorted(unexpected)}"
+
+    for file, content in expected_files.items():
+        assert actual_files[file].content_length == len(content), f"Size mismatch in file {file}"
+
+    # Large files (such as the MEMORY_LOAD_LIMIT-sized ones) are checked by size plus head and tail samples.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        digests = {
+            file: executor.submit(read_digest, target_client, metadata.key, metadata.content_length)
+            for file, metadata in actual_files.items()
+        }
+    for file, content in expected_files.items():
+        assert digests[file].result() == expected_digest(content), f"Mismatch in file {file}"
 
 
 @pytest.mark.serial
@@ -77,11 +118,12 @@ def verify_sync_and_contents(target_url: str, expected_files: dict):
 def test_sync_function(
     temp_data_store_type: type[tempdatastore.TemporaryDataStore],
     sync_kwargs: dict,
+    monkeypatch: pytest.MonkeyPatch,
 ):
     msc.shortcuts._STORAGE_CLIENT_CACHE.clear()
 
-    # set environment variables to control multiprocessing
-    os.environ["MSC_NUM_PROCESSES"] = str(sync_kwargs.get("max_workers", 1))
+    # Control multiprocessing for this test only; reset_globals deliberately carries MSC_NUM_PROCESSES across tests.
+    monkeypatch.setenv("MSC_NUM_PROCESSES", str(sync_kwargs.get("max_workers", 1)))
 
     obj_profile = "s3-sync"
     local_profile = "local"
@@ -118,15 +160,15 @@ def test_sync_function(
 
         # Create local dataset
         expected_files = {
-            "dir1/file0.txt": "a" * 100,
-            "dir1/file1.txt": "b" * 100,
-            "dir1/file2.txt": "c" * 100,
-            "dir2/file0.txt": "d" * 100,
-            "dir2/file1.txt": "e" * 100,
-            "dir2/file2.txt": "f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
-            "dir3/file0.txt": "g" * 100,
-            "dir3/file1.txt": "h" * 100,
-            "dir3/file2.txt": "i" * 100,
+            "dir1/file0.txt": b"a" * 100,
+            "dir1/file1.txt": b"b" * 100,
+            "dir1/file2.txt": b"c" * 100,
+            "dir2/file0.txt": b"d" * 100,
+            "dir2/file1.txt": b"e" * 100,
+            "dir2/file2.txt": b"f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
+            "dir3/file0.txt": b"g" * 100,
+            "dir3/file1.txt": b"h" * 100,
+            "dir3/file2.txt": b"i" * 100,
         }
         create_local_test_dataset(source_msc_url, expected_files)
 
@@ -137,7 +179,7 @@ def test_sync_function(
         assert result.total_work_units == 9, f"Expected 9 work units, got {result.total_work_units}"
         assert result.total_files_added == 9, f"Expected 9 files added, got {result.total_files_added}"
         assert result.total_files_deleted == 0, f"Expected 0 files deleted, got {result.total_files_deleted}"
-        expected_bytes = sum(len(content.encode("utf-8")) for content in expected_files.values())
+        expected_bytes = sum(len(content) for content in expected_files.values())
         assert result.total_bytes_added == expected_bytes, (
             f"Expected {expected_bytes} bytes, got {result.total_bytes_added}"
         )
@@ -155,7 +197,7 @@ def test_sync_function(
         assert result.total_work_units == 9
         assert result.total_files_added == 1, f"Expected 1 file added, got {result.total_files_added}"
         assert result.total_files_deleted == 0
-        deleted_file_size = len("a" * 100)
+        deleted_file_size = len(expected_files["dir1/file0.txt"])
         assert result.total_bytes_added == deleted_file_size, (
             f"Expected {deleted_file_size} bytes, got {result.total_bytes_added}"
         )
@@ -165,9 +207,9 @@ def test_sync_function(
         verify_sync_and_contents(target_url=target_msc_url, expected_files=expected_files)
 
         print("Syncing again and verifying timestamps")
-        timestamps_before = {file: get_file_timestamp(os.path.join(target_msc_url, file)) for file in expected_files}
+        timestamps_before = get_file_timestamps(target_msc_url, expected_files)
         result = msc.sync(source_url=source_msc_url, target_url=target_msc_url)
-        timestamps_after = {file: get_file_timestamp(os.path.join(target_msc_url, file)) for file in expected_files}
+        timestamps_after = get_file_timestamps(target_msc_url, expected_files)
         assert timestamps_before == timestamps_after, "Timestamps changed on second sync."
 
         # Verify SyncResult - no changes, so nothing should be copied
@@ -178,7 +220,7 @@ def test_sync_function(
         assert result.total_time_seconds > 0
 
         print("Adding new files and syncing again")
-        new_files = {"dir1/new_file.txt": "n" * 100}
+        new_files = {"dir1/new_file.txt": b"n" * 100}
         create_local_test_dataset(source_msc_url, expected_files=new_files)
         result = msc.sync(source_url=source_msc_url, target_url=target_msc_url)
         expected_files.update(new_files)
@@ -187,7 +229,7 @@ def test_sync_function(
         assert result.total_work_units == 10, f"Expected 10 work units, got {result.total_work_units}"
         assert result.total_files_added == 1, f"Expected 1 file added, got {result.total_files_added}"
         assert result.total_files_deleted == 0
-        new_file_size = len("n" * 100)
+        new_file_size = len(new_files["dir1/new_file.txt"])
         assert result.total_bytes_added == new_file_size, (
             f"Expected {new_file_size} bytes, got {result.total_bytes_added}"
         )
@@ -196,7 +238,7 @@ def test_sync_function(
         verify_sync_and_contents(target_url=target_msc_url, expected_files=expected_files)
 
         print("Modifying one of the source files, but keeping size the same, and verifying it's copied.")
-        modified_files = {"dir1/file0.txt": "z" * 100}
+        modified_files = {"dir1/file0.txt": b"z" * 100}
         create_local_test_dataset(source_msc_url, expected_files=modified_files)
         expected_files.update(modified_files)
         result = msc.sync(source_url=source_msc_url, target_url=target_msc_url)
@@ -205,7 +247,7 @@ def test_sync_function(
         assert result.total_work_units == 10
         assert result.total_files_added == 1, f"Expected 1 file added (updated), got {result.total_files_added}"
         assert result.total_files_deleted == 0
-        modified_file_size = len("z" * 100)
+        modified_file_size = len(modified_files["dir1/file0.txt"])
         assert result.total_bytes_added == modified_file_size, (
             f"Expected {modified_file_size} bytes, got {result.total_bytes_added}"
         )
@@ -227,7 +269,7 @@ def test_sync_function(
         assert result.total_work_units == 10
         assert result.total_files_added == 10, f"Expected 10 files added, got {result.total_files_added}"
         assert result.total_files_deleted == 0
-        expected_bytes = sum(len(content.encode("utf-8")) for content in expected_files.values())
+        expected_bytes = sum(len(content) for content in expected_files.values())
         assert result.total_bytes_added == expected_bytes, (
             f"Expected {expected_bytes} bytes, got {result.total_bytes_added}"
         )
@@ -236,8 +278,7 @@ def test_sync_function(
         verify_sync_and_contents(target_url=second_msc_url, expected_files=expected_files)
 
         print("Deleting all the files at the target and going again.")
-        for key in expected_files:
-            msc.delete(os.path.join(target_msc_url, key))
+        msc.delete_many([os.path.join(target_msc_url, key) for key in expected_files])
 
         print("Syncing using prefixes to just copy one subfolder.")
         result = msc.sync(
@@ -249,7 +290,7 @@ def test_sync_function(
         assert result.total_work_units == 3, f"Expected 3 work units, got {result.total_work_units}"
         assert result.total_files_added == 3, f"Expected 3 files added, got {result.total_files_added}"
         assert result.total_files_deleted == 0
-        dir2_bytes = sum(len(v.encode("utf-8")) for k, v in expected_files.items() if k.startswith("dir2"))
+        dir2_bytes = sum(len(v) for k, v in expected_files.items() if k.startswith("dir2"))
         assert result.total_bytes_added == dir2_bytes, f"Expected {dir2_bytes} bytes, got {result.total_bytes_added}"
         assert result.total_time_seconds > 0
 
@@ -261,7 +302,7 @@ def test_sync_function(
         assert result.total_work_units == 10
         assert result.total_files_added == 7, f"Expected 7 files added, got {result.total_files_added}"
         assert result.total_files_deleted == 0
-        remaining_bytes = sum(len(v.encode("utf-8")) for k, v in expected_files.items() if not k.startswith("dir2"))
+        remaining_bytes = sum(len(v) for k, v in expected_files.items() if not k.startswith("dir2"))
         assert result.total_bytes_added == remaining_bytes, (
             f"Expected {remaining_bytes} bytes, got {result.total_bytes_added}"
         )
@@ -274,7 +315,7 @@ def test_sync_function(
         # Delete keys at the source.
         for key in keys_to_delete:
             expected_files.pop(key)
-            msc.delete(os.path.join(source_msc_url, key))
+        msc.delete_many([os.path.join(source_msc_url, key) for key in keys_to_delete])
 
         # Sync from source to target and expect deletes to happen at the target.
         result = msc.sync(source_url=source_msc_url, target_url=target_msc_url, delete_unmatched_files=True)
@@ -285,7 +326,7 @@ def test_sync_function(
         assert result.total_files_added == 0, f"Expected 0 files added, got {result.total_files_added}"
         assert result.total_files_deleted == 3, f"Expected 3 files deleted, got {result.total_files_deleted}"
         assert result.total_bytes_added == 0
-        deleted_bytes = sum(len(v.encode("utf-8")) for v in deleted_files_data.values())
+        deleted_bytes = sum(len(v) for v in deleted_files_data.values())
         assert result.total_bytes_deleted == deleted_bytes, (
             f"Expected {deleted_bytes} bytes deleted, got {result.total_bytes_deleted}"
         )
@@ -295,9 +336,8 @@ def test_sync_function(
 
         # Delete all remaining keys at source and verify the deletes propagate to target.
         remaining_files_count = len(expected_files)
-        remaining_bytes = sum(len(v.encode("utf-8")) for v in expected_files.values())
-        for key in expected_files:
-            msc.delete(os.path.join(source_msc_url, key))
+        remaining_bytes = sum(len(v) for v in expected_files.values())
+        msc.delete_many([os.path.join(source_msc_url, key) for key in expected_files])
         result = msc.sync(source_url=source_msc_url, target_url=target_msc_url, delete_unmatched_files=True)
 
         # Verify SyncResult - should delete all remaining 7 files
@@ -345,32 +385,32 @@ def test_sync_from(temp_data_store_type: type[tempdatastore.TemporaryDataStore])
 
         # Create local dataset with both regular and hidden files
         source_files = {
-            "dir1/file0.txt": "a" * 150,
-            "dir1/file1.txt": "b" * 200,
-            "dir1/file2.txt": "c" * 1000,
-            "dir2/file0.txt": "d" * 1,
-            "dir2/file1.txt": "e" * 5,
-            "dir2/file2.txt": "f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
-            "dir3/file0.txt": "g" * 10000,
-            "dir3/file1.txt": "h" * 800,
-            "dir3/file2.txt": "i" * 512,
+            "dir1/file0.txt": b"a" * 150,
+            "dir1/file1.txt": b"b" * 200,
+            "dir1/file2.txt": b"c" * 1000,
+            "dir2/file0.txt": b"d" * 1,
+            "dir2/file1.txt": b"e" * 5,
+            "dir2/file2.txt": b"f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
+            "dir3/file0.txt": b"g" * 10000,
+            "dir3/file1.txt": b"h" * 800,
+            "dir3/file2.txt": b"i" * 512,
             # Hidden files that should NOT be synced
-            ".hidden_root.txt": "hidden_root",
-            "dir1/.hidden_in_dir.txt": "hidden_in_dir1",
-            "dir2/.dotfile": "dotfile_content",
-            ".git/config": "git_config",
+            ".hidden_root.txt": b"hidden_root",
+            "dir1/.hidden_in_dir.txt": b"hidden_in_dir1",
+            "dir2/.dotfile": b"dotfile_content",
+            ".git/config": b"git_config",
         }
         # Expected files after sync (without hidden files)
         expected_files = {
-            "dir1/file0.txt": "a" * 150,
-            "dir1/file1.txt": "b" * 200,
-            "dir1/file2.txt": "c" * 1000,
-            "dir2/file0.txt": "d" * 1,
-            "dir2/file1.txt": "e" * 5,
-            "dir2/file2.txt": "f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
-            "dir3/file0.txt": "g" * 10000,
-            "dir3/file1.txt": "h" * 800,
-            "dir3/file2.txt": "i" * 512,
+            "dir1/file0.txt": b"a" * 150,
+            "dir1/file1.txt": b"b" * 200,
+            "dir1/file2.txt": b"c" * 1000,
+            "dir2/file0.txt": b"d" * 1,
+            "dir2/file1.txt": b"e" * 5,
+            "dir2/file2.txt": b"f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
+            "dir3/file0.txt": b"g" * 10000,
+            "dir3/file1.txt": b"h" * 800,
+            "dir3/file2.txt": b"i" * 512,
         }
         create_local_test_dataset(source_msc_url, source_files)
 
@@ -424,15 +464,15 @@ def test_sync_replicas(temp_data_store_type: type[tempdatastore.TemporaryDataSto
 
         # Create local dataset
         expected_files = {
-            "dir1/file0.txt": "a" * 150,
-            "dir1/file1.txt": "b" * 200,
-            "dir1/file2.txt": "c" * 1000,
-            "dir2/file0.txt": "d" * 1,
-            "dir2/file1.txt": "e" * 5,
-            "dir2/file2.txt": "f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
-            "dir3/file0.txt": "g" * 10000,
-            "dir3/file1.txt": "h" * 800,
-            "dir3/file2.txt": "i" * 512,
+            "dir1/file0.txt": b"a" * 150,
+            "dir1/file1.txt": b"b" * 200,
+            "dir1/file2.txt": b"c" * 1000,
+            "dir2/file0.txt": b"d" * 1,
+            "dir2/file1.txt": b"e" * 5,
+            "dir2/file2.txt": b"f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
+            "dir3/file0.txt": b"g" * 10000,
+            "dir3/file1.txt": b"h" * 800,
+            "dir3/file2.txt": b"i" * 512,
         }
         create_local_test_dataset(source_msc_url, expected_files)
 
@@ -487,7 +527,7 @@ def test_sync_with_attributes_posix():
             file_path = os.path.join(source_path, filename)
             source_client.write(file_path, content.encode("utf-8"), attributes=attrs)
 
-        time.sleep(1)  # Ensure timestamps are clear
+        wait_for_next_second()  # Ensure timestamps are clear
 
         # Sync from source to target with attributes enabled
         print(f"Syncing from {source_msc_url} to {target_msc_url}")
@@ -556,7 +596,7 @@ def test_sync_from_with_attributes(temp_data_store_type: type[tempdatastore.Temp
             file_path = os.path.join(source_path, filename)
             source_client.write(file_path, content.encode("utf-8"), attributes=attrs)
 
-        time.sleep(1)
+        wait_for_next_second()
 
         # Use sync_from instead of sync with attributes enabled
         print(f"Using sync_from to sync {source_msc_url} to {target_msc_url}")
@@ -713,23 +753,23 @@ def test_sync_from_symlink_files(temp_data_store_type: type[tempdatastore.Tempor
 
         base_path = cast(BaseStorageProvider, source_client._storage_provider)._base_path
 
-        real_file_content = "This is the real file content" * 50
+        real_file_content = b"This is the real file content" * 50
         real_file_path = os.path.join(source_path, "real_file.txt")
-        source_client.write(real_file_path, real_file_content.encode("utf-8"))
+        source_client.write(real_file_path, real_file_content)
 
         physical_real_file_path = os.path.join(base_path, source_path, "real_file.txt")
 
         physical_symlink_path = os.path.join(base_path, source_path, "symlink_to_real.txt")
         os.symlink(physical_real_file_path, physical_symlink_path)
 
-        regular_file_content = "Regular file content" * 30
+        regular_file_content = b"Regular file content" * 30
         regular_file_path = os.path.join(source_path, "regular_file.txt")
-        source_client.write(regular_file_path, regular_file_content.encode("utf-8"))
+        source_client.write(regular_file_path, regular_file_content)
 
         subdir_path = os.path.join(source_path, "subdir")
         real_file_subdir_path = os.path.join(subdir_path, "real_in_subdir.txt")
-        real_file_subdir_content = "Real file in subdirectory" * 20
-        source_client.write(real_file_subdir_path, real_file_subdir_content.encode("utf-8"))
+        real_file_subdir_content = b"Real file in subdirectory" * 20
+        source_client.write(real_file_subdir_path, real_file_subdir_content)
 
         physical_subdir_path = os.path.join(base_path, subdir_path)
         physical_real_file_subdir_path = os.path.join(base_path, real_file_subdir_path)
@@ -737,7 +777,7 @@ def test_sync_from_symlink_files(temp_data_store_type: type[tempdatastore.Tempor
 
         os.symlink(physical_real_file_subdir_path, physical_symlink_subdir_path)
 
-        time.sleep(1)  # Ensure timestamps are clear
+        wait_for_next_second()  # Ensure timestamps are clear
 
         target_client.sync_from(source_client, source_path, target_path)
 
@@ -755,8 +795,6 @@ def test_sync_from_symlink_files(temp_data_store_type: type[tempdatastore.Tempor
         target_client, target_path = msc.resolve_storage_client(target_msc_url)
         target_client.sync_from(source_client, source_path, target_path, symlink_handling=SymlinkHandling.SKIP)
 
-        time.sleep(1)
-
         expected_files = {
             "real_file.txt": real_file_content,
             "regular_file.txt": regular_file_content,
@@ -793,10 +831,10 @@ def test_sync_from_with_source_files(temp_data_store_type: type[tempdatastore.Te
         target_msc_url = f"msc://{obj_profile}/synced-files"
 
         all_files = {
-            "dir1/file0.txt": "a" * 150,
-            "dir1/file1.py": "b" * 200,
-            "dir2/file2.txt": "f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
-            "dir3/file1.txt": "h" * 800,
+            "dir1/file0.txt": b"a" * 150,
+            "dir1/file1.py": b"b" * 200,
+            "dir2/file2.txt": b"f" * (MEMORY_LOAD_LIMIT + 1024),  # One large file
+            "dir3/file1.txt": b"h" * 800,
         }
         create_local_test_dataset(source_msc_url, all_files)
 
@@ -845,7 +883,7 @@ def test_sync_posix_large_files_no_temp_optimization(
 
     This test specifically validates the optimization by mocking tempfile.NamedTemporaryFile
     and ensuring sync.py doesn't create temp files during large file transfers:
-    1. POSIX → POSIX: Direct copy with shutil.copy2 (no temp in sync.py)
+    1. POSIX → POSIX: Direct copy with copy_posix_file (no temp in sync.py)
     2. POSIX → Cloud: Direct upload with upload_file (no temp in sync.py)
 
     Note: Cloud → POSIX is not tested because cloud providers' download_file() methods
@@ -876,13 +914,13 @@ def test_sync_posix_large_files_no_temp_optimization(
             }
         )
 
-        large_file_content = "X" * (MEMORY_LOAD_LIMIT + 1024 * 1024)
+        large_file_content = b"X" * (MEMORY_LOAD_LIMIT + 1024 * 1024)
         source_url = f"msc://{source_posix_profile}/large-file.dat"
         target_url = f"msc://{target_posix_profile}/large-file.dat"
         cloud_url = f"msc://{cloud_profile}/large-file.dat"
 
-        msc.write(source_url, large_file_content.encode())
-        time.sleep(1)
+        msc.write(source_url, large_file_content)
+        wait_for_next_second()
 
         sync_module = sys.modules["multistorageclient.sync"]
 
@@ -893,7 +931,7 @@ def test_sync_posix_large_files_no_temp_optimization(
 
         assert msc.is_file(target_url)
         with msc.open(target_url, mode="rb") as f:
-            assert f.read().decode() == large_file_content
+            assert f.read() == large_file_content
         msc.delete(target_url)
 
         # Test POSIX → Cloud: no temp files should be created in sync.py
@@ -903,7 +941,7 @@ def test_sync_posix_large_files_no_temp_optimization(
 
         assert msc.is_file(cloud_url)
         with msc.open(cloud_url, mode="rb") as f:
-            assert f.read().decode() == large_file_content
+            assert f.read() == large_file_content
 
 
 def test_sync_with_manifest_overwrite_behavior():
@@ -1092,7 +1130,7 @@ def test_sync_resume_with_metadata_provider():
             print(f"File {file_path} timestamp before sync: {info.last_modified}")
 
         # Wait to ensure timestamp differences would be detectable
-        time.sleep(1)
+        wait_for_next_second()
 
         # Now run sync - this should copy the missing files but not overwrite existing ones
         print("Running sync operation...")
@@ -1287,14 +1325,14 @@ def test_sync_between_object_and_posix(temp_data_store_type: type[tempdatastore.
 
         # Create local dataset
         objects = {
-            "dir1/file0.txt": "a" * 150,
-            "dir1/file1.txt": "b" * 200,
-            "dir1/file2.txt": "c" * 1000,
+            "dir1/file0.txt": b"a" * 150,
+            "dir1/file1.txt": b"b" * 200,
+            "dir1/file2.txt": b"c" * 1000,
         }
         create_local_test_dataset(object_msc_url, objects)
 
         # Insert a delay before sync'ing so that timestamps will be clearer.
-        time.sleep(1)
+        wait_for_next_second()
 
         # Sync from the object to the posix shouldn't do any changes to the object.
         msc.sync(source_url=object_msc_url, target_url=posix_msc_url)
@@ -1367,7 +1405,7 @@ def test_sync_source_files_should_not_copy_attributes_when_preserve_false(
         source_metadata = source_client.info(os.path.join(source_path, "file_with_attrs.txt"))
         assert source_metadata.metadata == test_attributes, "Source file should have attributes"
 
-        time.sleep(1)
+        wait_for_next_second()
 
         target_client.sync_from(
             source_client,
@@ -1422,8 +1460,8 @@ def test_sync_uses_strict_false_for_get_object_metadata(
         target_url = f"msc://{target_profile}/"
 
         test_files = {
-            "file1.txt": "test content 1",
-            "dir/file2.txt": "test content 2",
+            "file1.txt": b"test content 1",
+            "dir/file2.txt": b"test content 2",
         }
         create_local_test_dataset(source_url, test_files)
 
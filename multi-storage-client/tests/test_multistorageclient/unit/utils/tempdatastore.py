@@ -75,11 +75,14 @@ class TemporaryPOSIXDirectory(TemporaryDataStore):
     #: Directory.
     _directory: tempfile.TemporaryDirectory
 
-    def __init__(self):
+    def __init__(self, dir: str | None = None):
         # Backed by Python's `tempfile`.
         #
         # https://docs.python.org/3/library/tempfile.html
-        self._directory = tempfile.TemporaryDirectory()
+        #
+        # Background writers (e.g. replica uploads) may still be touching the tree at cleanup,
+        # which shouldn't fail the test (and trigger a rerun) after its assertions have passed.
+        self._directory = tempfile.TemporaryDirectory(dir=dir, ignore_cleanup_errors=True)
 
         self._profile_config_dict = {
             "storage_provider": {"type": "file", "options": {"base_path": self._directory.name}}
@@ -142,8 +145,11 @@ class TemporaryAWSS3Bucket(TemporaryDataStore):
 
     def cleanup(self) -> None:
         try:
-            for obj in self._client.list_objects_v2(Bucket=self._bucket_name).get("Contents", []):
-                self._client.delete_object(Bucket=self._bucket_name, Key=obj["Key"])
+            # Each listing page holds at most 1000 keys, which is also the DeleteObjects limit.
+            for page in self._client.get_paginator("list_objects_v2").paginate(Bucket=self._bucket_name):
+                objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+                if objects:
+                    self._client.delete_objects(Bucket=self._bucket_name, Delete={"Objects": objects, "Quiet": True})
             self._client.delete_bucket(Bucket=self._bucket_name)
         except self._client.exceptions.NoSuchBucket:
             pass